@@ -0,0 +1,115 @@
+import threading
+from collections import deque
+
+from PyQt5.QtCore import QObject, QTimer, QUrl, pyqtSignal
+from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
+
+from tts_utils import cached_tts_file, ensure_tts_file
+
+CLIP_GAP_MS = 500   # 음성 하나가 끝나고 다음 음성을 시작하기까지의 간격
+
+
+class AudioSequencer(QObject):
+    """
+    카드 하나의 음성(단어 -> 뜻 -> 예문 영어 -> 예문 한글)을 차례로 이어서 재생하는 재생기.
+
+    정해진 시각(2초, 6초, ...)에 재생하지 않고, 음성 하나가 실제로 끝나면(EndOfMedia) gap_ms 뒤에 다음 음성을 재생합니다.
+    play()/cancel()은 화면 스레드에서만 부르고, 부르는 즉시 재생 중인 음성과 남은 음성을 모두 멈춥니다.
+    (캐시에 없는 음성을 받는 작업 스레드의 결과는 세대 번호로 확인해서, 취소된 뒤에 도착하면 버림)
+
+    시그널:
+        clip_started(text, lang)   음성 하나를 재생하기 시작함
+        finished()                 넘겨받은 음성을 모두 재생함 (cancel로 멈춘 경우는 보내지 않음)
+    """
+    clip_started = pyqtSignal(str, str)
+    finished = pyqtSignal()
+    _clip_ready = pyqtSignal(int, object)   # (세대, 음성 파일 경로 또는 None) 작업 스레드 -> 화면 스레드
+
+    def __init__(self, gap_ms=CLIP_GAP_MS, parent=None):
+        super().__init__(parent)
+        self.gap_ms = gap_ms
+        self.queue = deque()     # [(text, lang), ...] 남은 음성
+        self.current = None      # 재생 중(또는 받는 중)인 (text, lang)
+        self.generation = 0
+
+        self.player = QMediaPlayer(self)
+        self.player.mediaStatusChanged.connect(self.on_media_status_changed)
+        self.player.error.connect(self.on_player_error)
+
+        self.gap_timer = QTimer(self)
+        self.gap_timer.setSingleShot(True)
+        self.gap_timer.timeout.connect(self.play_next)
+
+        self._clip_ready.connect(self.on_clip_ready)
+
+    def is_active(self):
+        """재생할(재생 중인) 음성이 남아 있는지"""
+        return self.current is not None or bool(self.queue)
+
+    def play(self, clips):
+        """재생 중인 음성을 멈추고 clips [(text, lang), ...]를 처음부터 이어서 재생"""
+        self.cancel()
+        self.queue.extend((text, lang) for text, lang in clips if text)
+        self.play_next()
+
+    def cancel(self):
+        """재생 중인 음성과 남은 음성을 모두 버림"""
+        self.generation += 1
+        self.queue.clear()
+        self.current = None
+        self.gap_timer.stop()
+        if self.player.state() != QMediaPlayer.StoppedState:
+            self.player.stop()
+
+    def play_next(self):
+        if not self.queue:
+            self.current = None
+            self.finished.emit()
+            return
+        self.current = self.queue.popleft()
+        text, lang = self.current
+        path = cached_tts_file(text, lang)
+        if path is not None:
+            self.start_clip(path)
+            return
+        # 아직 받지 않은 음성 -> 작업 스레드에서 받은 뒤 재생
+        generation = self.generation
+        threading.Thread(target=self._fetch, args=(generation, text, lang), daemon=True).start()
+
+    def _fetch(self, generation, text, lang):
+        try:
+            path = ensure_tts_file(text, lang)
+        except Exception as e:
+            print(f"음성 재생 중 오류 발생: {e}")
+            path = None
+        self._clip_ready.emit(generation, path)
+
+    def on_clip_ready(self, generation, path):
+        if generation != self.generation:
+            return   # 그사이 다른 카드로 넘어감
+        if path is None:
+            self.play_next()
+        else:
+            self.start_clip(path)
+
+    def start_clip(self, path):
+        self.player.setMedia(QMediaContent(QUrl.fromLocalFile(path)))
+        self.player.play()
+        self.clip_started.emit(*self.current)
+
+    def on_media_status_changed(self, status):
+        if self.current is not None and status in (QMediaPlayer.EndOfMedia, QMediaPlayer.InvalidMedia):
+            self.clip_done()
+
+    def on_player_error(self, error):
+        if self.current is None:
+            return
+        print(f"음성 재생 중 오류 발생: {self.player.errorString()}")
+        self.clip_done()
+
+    def clip_done(self):
+        """음성 하나가 끝남 -> gap_ms 뒤에 다음 음성 (마지막 음성이었으면 바로 finished)"""
+        if self.queue:
+            self.gap_timer.start(self.gap_ms)
+        else:
+            self.play_next()
@@ -0,0 +1,55 @@
+"""
+단어 하나당 메모리 비교: {'word','meaning','example'} dict vs WordEntry(__slots__, 예문 미리 분리).
+
+실행:
+    python benchmarks/bench_entry_memory.py [단어 개수]
+
+같은 단어 목록을 두 방식으로 만들어 tracemalloc으로 잰 메모리를 100k 단어 기준으로 환산해 출력합니다.
+(영단어/뜻은 실제 라이브러리처럼 일부가 반복되도록 생성)
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from word_entry import WordEntry  # noqa: E402
+
+
+def raw_lines(n):
+    # 파일에서 막 읽어온 것처럼 매번 새 문자열을 만든다 (문자열 상수 공유 방지)
+    for i in range(n):
+        word = "".join(["word", str(i % (n // 4 or 1))])
+        meaning = "".join(["뜻 ", str(i % (n // 4 or 1))])
+        example = "".join(["-This is example number ", str(i), ". + 이것은 ", str(i), "번째 예문입니다."]) if i % 2 == 0 else ""
+        yield word, meaning, example
+
+
+def build_dicts(n):
+    return [{'word': w, 'meaning': m, 'example': e} for w, m, e in raw_lines(n)]
+
+
+def build_entries(n):
+    return [WordEntry(w, m, e) for w, m, e in raw_lines(n)]
+
+
+def measure(build, n):
+    tracemalloc.start()
+    data = build(n)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return current
+
+
+def main(n):
+    scale = 100_000 / n
+    dict_bytes = measure(build_dicts, n) * scale
+    entry_bytes = measure(build_entries, n) * scale
+    print(f"per 100k entries (measured on {n})")
+    print(f"dict       : {dict_bytes / 1024 / 1024:7.1f} MB")
+    print(f"WordEntry  : {entry_bytes / 1024 / 1024:7.1f} MB  ({entry_bytes / dict_bytes:.0%})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
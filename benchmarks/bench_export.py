@@ -0,0 +1,66 @@
+"""
+단어장 내보내기(export_wordbooks) 속도와 메모리 측정.
+
+실행:
+    python benchmarks/bench_export.py [단어 개수]
+
+임시 words/ 폴더에 가짜 단어장(50,000단어씩, 기본 합계 1M 단어)을 만든 뒤
+TSV / JSON Lines / Anki 형식으로 전체를 내보내면서 시간과 tracemalloc 최대 메모리를 출력합니다.
+최대 메모리는 단어 수가 늘어도 묶음 하나 + 쓰기 버퍼 정도로 일정해야 합니다.
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wordbook_export import export_wordbooks, ExportSource, EXPORTERS  # noqa: E402
+from wordbook_manager import write_wordbook  # noqa: E402
+from word_entry import WordEntry  # noqa: E402
+
+BOOK_SIZE = 50_000
+
+
+def make_library(directory, n, rnd):
+    syllables = [chr(0xAC00 + i) for i in range(0, 11172, 37)]
+    sources = []
+    for book in range(max(1, n // BOOK_SIZE)):
+        words = []
+        for _ in range(BOOK_SIZE):
+            word = "".join(rnd.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rnd.randint(3, 10)))
+            meaning = "".join(rnd.choice(syllables) for _ in range(rnd.randint(2, 6)))
+            words.append(WordEntry(word, meaning, f"-This is {word}+{meaning} 입니다"))
+        folder = os.path.join(directory, f"250101_{book:04d}")
+        os.makedirs(folder)
+        path = os.path.join(folder, f"book{book}_wordbook.txt")
+        write_wordbook(path, words)
+        sources.append(ExportSource(f"book{book}", path, len(words)))
+    return sources
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        sources = make_library(os.path.join(tmp, "words"), n, random.Random(0))
+        total = sum(source.count for source in sources)
+        for fmt, exporter in EXPORTERS.items():
+            dest = os.path.join(tmp, f"export{exporter.suffix}")
+            start = time.perf_counter()
+            count = export_wordbooks(sources, dest, fmt)
+            elapsed = time.perf_counter() - start
+
+            # 메모리는 tracemalloc이 느려서 따로 한 번 더 실행해서 잼
+            tracemalloc.start()
+            export_wordbooks(sources, dest, fmt)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            size_mb = os.path.getsize(dest) / (1024 * 1024)
+            print(f"{fmt:>6}: {count:,}/{total:,} entries  {elapsed:6.2f}s  ({count / elapsed:,.0f} entries/s)  "
+                  f"{size_mb:6.1f} MB written  peak memory {peak / (1024 * 1024):5.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+'학습 이력' 페이지(HistoryPage)를 여는 시간 측정.
+
+실행:
+    python benchmarks/bench_history.py [하루 이벤트 수]
+
+임시 폴더에 하루 EVENTS_PER_DAY개(기본 3000, 단어 20k개 중에서)씩 1년치 학습 기록을 만들고
+    - 집계가 없을 때 처음부터 집계 (1년치 기록 전체를 한 번 읽음)
+    - 집계를 저장한 뒤 페이지를 새로 만들어 여는 시간 (저장한 집계 + 새 기록 없음)
+    - 오늘 기록이 조금 더 쌓인 뒤 여는 시간
+을 출력합니다.
+화면이 없어도 돌 수 있도록 QT_QPA_PLATFORM=offscreen으로 실행합니다.
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+import study_log  # noqa: E402
+from study_log import StudyLog, log_date  # noqa: E402
+from study_stats import StudyStats  # noqa: E402
+from history_page import HistoryPage  # noqa: E402
+
+DAYS = 365
+WORDS = 20_000
+EVENT_MIX = [study_log.CARD_SHOWN, study_log.CARD_SHOWN, study_log.AUDIO_PLAYED,
+             study_log.CARD_SKIPPED, study_log.NAV_NEXT, study_log.CARD_KNEW, study_log.CARD_MISSED]
+
+
+def write_days(log, first_day, days, per_day, rnd):
+    """first_day일 전부터 days일치 기록 파일을 직접 만듦 (log()는 현재 시각을 쓰므로)"""
+    books = [f"{2400 + i:04d}_{i:04d}/day{i}_wordbook.txt" for i in range(80)]
+    now = time.time()
+    os.makedirs(log.folder, exist_ok=True)
+    for day in range(days):
+        t = now - (first_day - day) * 86400
+        date = log_date(t)
+        book = rnd.choice(books)
+        lines = [f'{{"t":{t:.3f},"e":"start","b":"{book}","n":500}}']
+        for _ in range(per_day):
+            t += rnd.uniform(1, 8)
+            event = rnd.choice(EVENT_MIX)
+            lines.append(f'{{"t":{t:.3f},"e":"{event}","b":"{book}","w":"word{rnd.randrange(WORDS)}"}}')
+        lines.append(f'{{"t":{t:.3f},"e":"stop","b":"{book}"}}')
+        with open(log.path_for(date), 'a', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+
+
+def open_page(app, log):
+    start = time.perf_counter()
+    page = HistoryPage(study_log=log)
+    page.resize(1000, 700)
+    page.show()
+    app.processEvents()
+    elapsed = (time.perf_counter() - start) * 1000
+    page.stats.save()
+    page.close()
+    return elapsed
+
+
+def main():
+    per_day = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    app = QApplication(sys.argv[:1])
+    rnd = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        log = StudyLog(directory)
+        write_days(log, DAYS, DAYS, per_day, rnd)
+        print(f"{DAYS} days x {per_day:,} events")
+
+        start = time.perf_counter()
+        stats = StudyStats(log)
+        count = stats.catch_up()
+        print(f"    full rebuild : {(time.perf_counter() - start) * 1000:.0f} ms ({count:,} events, "
+              f"{len(stats.words):,} words)")
+        start = time.perf_counter()
+        stats.save()
+        print(f"    save rollups : {(time.perf_counter() - start) * 1000:.0f} ms "
+              f"({os.path.getsize(stats.path) / 1e6:.1f} MB)")
+
+        print(f"    open page    : {open_page(app, log):.0f} ms")
+        write_days(log, 0, 1, 200, rnd)
+        print(f"    open page after 200 new events: {open_page(app, log):.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+단어장 가져오기(import_wordbook) 처리 속도 측정.
+
+실행:
+    python benchmarks/bench_import.py [행 개수]
+
+임시 폴더에 CSV/TSV/JSONL/Anki 형식의 가짜 파일(기본 200k 행)을 만들고,
+파일을 그냥 읽는 시간(디스크 읽기 + UTF-8 디코딩)과 가져오기 전체 시간(파싱 + 중복 확인 키 + 저장)을 비교합니다.
+PIP_STORAGE_ENGINE=sqlite로 실행하면 SQLite 저장소에 묶음 단위로 쓰는 시간을 잽니다.
+"""
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wordbook_import import import_wordbook, commit_import  # noqa: E402
+
+
+def make_rows(n, rnd):
+    syllables = [chr(0xAC00 + i) for i in range(0, 11172, 37)]
+    for i in range(n):
+        word = "".join(rnd.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rnd.randint(3, 10))) + str(i)
+        meaning = "".join(rnd.choice(syllables) for _ in range(rnd.randint(2, 6)))
+        example = f"This is {word} in a sentence+{meaning} 예문입니다" if i % 2 else ""
+        yield word, meaning, example
+
+
+def write_samples(directory, n):
+    rows = list(make_rows(n, random.Random(0)))
+    paths = {}
+
+    paths["csv"] = os.path.join(directory, "sample.csv")
+    with open(paths["csv"], 'w', encoding='utf-8') as f:
+        f.write("word,meaning,example\n")
+        for row in rows:
+            f.write(",".join(f'"{value}"' for value in row) + "\n")
+
+    paths["tsv"] = os.path.join(directory, "sample.tsv")
+    with open(paths["tsv"], 'w', encoding='utf-8') as f:
+        for row in rows:
+            f.write("\t".join(row) + "\n")
+
+    paths["jsonl"] = os.path.join(directory, "sample.jsonl")
+    with open(paths["jsonl"], 'w', encoding='utf-8') as f:
+        for word, meaning, example in rows:
+            f.write(json.dumps({"word": word, "meaning": meaning, "example": example}, ensure_ascii=False) + "\n")
+
+    paths["anki"] = os.path.join(directory, "sample_anki.txt")
+    with open(paths["anki"], 'w', encoding='utf-8') as f:
+        f.write("#separator:tab\n#html:true\n#notetype column:1\n")
+        for word, meaning, example in rows:
+            f.write(f"Basic\t<b>{word}</b>\t{meaning}<br>\t{example}\n")
+    return paths
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_samples(tmp, n)
+        words_dir = os.path.join(tmp, "words")
+        for name, path in paths.items():
+            size_mb = os.path.getsize(path) / (1024 * 1024)
+
+            start = time.perf_counter()
+            with open(path, 'r', encoding='utf-8') as f:
+                while f.read(1 << 20):
+                    pass
+            read_time = time.perf_counter() - start
+
+            dest = os.path.join(words_dir, "250101_0000", f"{name}_wordbook.txt")
+            start = time.perf_counter()
+            result = import_wordbook(path, dest)
+            commit_import(result)
+            import_time = time.perf_counter() - start
+            print(f"{name:>6}: {result.count:,} rows, {size_mb:5.1f} MB  "
+                  f"read {read_time * 1000:7.1f} ms  import {import_time * 1000:7.1f} ms  "
+                  f"({result.count / import_time:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+큰 단어장 열기 비교: parse_wordbook(전체 파싱) vs LazyWordbook(mmap + 오프셋 인덱스).
+
+실행:
+    python benchmarks/bench_lazy.py [단어 개수]
+
+임시 폴더에 단어장을 하나 만들고 다음을 측정합니다.
+    - 전체 파싱 시간 / 메모리
+    - LazyWordbook 첫 열기(인덱스 생성) / 두 번째 열기(.idx 재사용) 시간
+    - 임의의 단어 1,000개 접근 후 메모리
+두 방식의 결과가 같은지도 확인합니다.
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wordbook_manager import parse_wordbook  # noqa: E402
+from lazy_wordbook import LazyWordbook  # noqa: E402
+
+
+def write_sample(path, n):
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(n):
+            f.write(f"word{i}\n뜻 {i}\n")
+            if i % 2 == 0:
+                f.write(f"-This is example number {i}. + 이것은 {i}번째 예문입니다.\n")
+            if i % 7 == 0:
+                f.write("\n")
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, current
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "big_wordbook.txt")
+        write_sample(path, n)
+        print(f"{n:,} words, {os.path.getsize(path) / 1024 / 1024:.1f} MB")
+
+        (words, _), t_parse, m_parse = measure(lambda: parse_wordbook(path))
+        print(f"parse_wordbook      : {t_parse:7.2f}s  {m_parse / 1024 / 1024:8.1f} MB")
+
+        lazy, t_index, m_index = measure(lambda: LazyWordbook(path))
+        print(f"LazyWordbook (index): {t_index:7.2f}s  {m_index / 1024 / 1024:8.1f} MB")
+        lazy.close()
+
+        picks = random.Random(0).sample(range(n), min(n, 1000))
+
+        def open_and_pick():
+            view = LazyWordbook(path)
+            for i in picks:
+                view[i]
+            return view
+
+        lazy, t_reopen, m_reopen = measure(open_and_pick)
+        print(f"LazyWordbook (.idx) : {t_reopen:7.2f}s  {m_reopen / 1024 / 1024:8.1f} MB  (1,000 random reads)")
+
+        assert len(lazy) == len(words)
+        assert all(lazy[i] == words[i] for i in picks)
+        assert list(lazy) == words
+        lazy.close()
+        print("results match")
+
+
+if __name__ == "__main__":
+    main()
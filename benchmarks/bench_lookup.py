@@ -0,0 +1,67 @@
+"""
+영단어 접두어/오타 조회(HeadwordIndex) 속도 측정.
+
+실행:
+    python benchmarks/bench_lookup.py [표제어 개수 ...]
+
+기본으로 100k, 1M개의 가짜 표제어로 색인을 만든 뒤,
+    - 접두어(앞 3글자) 자동 완성
+    - 한 글자를 바꾼 오타 검색 (원래 단어를 찾았는지도 셈)
+    - 표제어 하나를 넣고 하나를 빼는 update() (단어장 한 칸을 고쳤을 때)
+의 평균 시간(ms)을 출력합니다.
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from word_lookup import HeadwordIndex  # noqa: E402
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+QUERIES = 500
+
+
+def make_typo(word, rnd):
+    i = rnd.randrange(len(word))
+    return word[:i] + rnd.choice(LETTERS) + word[i + 1:]
+
+
+def run(n, rnd):
+    words = {"".join(rnd.choice(LETTERS) for _ in range(rnd.randint(4, 12))) for _ in range(n)}
+    words.add("receive")
+
+    start = time.perf_counter()
+    index = HeadwordIndex(words)
+    print(f"{len(index):>9,} headwords: built in {time.perf_counter() - start:.1f}s")
+
+    samples = rnd.sample(index.words, QUERIES)
+
+    start = time.perf_counter()
+    for word in samples:
+        index.complete(word[:3])
+    print(f"    prefix : {(time.perf_counter() - start) / QUERIES * 1000:.3f} ms")
+
+    typos = [make_typo(word, rnd) for word in samples]
+    start = time.perf_counter()
+    found = sum(any(c == word for c, _ in index.fuzzy(typo, limit=50)) for word, typo in zip(samples, typos))
+    print(f"    fuzzy  : {(time.perf_counter() - start) / QUERIES * 1000:.3f} ms  (found {found}/{QUERIES})")
+    print(f"    'recieve' -> {index.fuzzy('recieve', limit=3)}")
+
+    removed = rnd.sample(index.words, QUERIES)
+    start = time.perf_counter()
+    for word in removed:
+        index.update(added=[make_typo(word, rnd) + "x"], removed=[word])
+    print(f"    update : {(time.perf_counter() - start) / QUERIES * 1000:.3f} ms  (+1 -1 headword)")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+    rnd = random.Random(0)
+    for n in sizes:
+        run(n, rnd)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+병렬 라이브러리 로딩 벤치마크: 순차 로딩 vs ProcessPoolExecutor 로딩.
+
+실행:
+    python benchmarks/bench_parallel.py [파일 개수] [파일당 단어 개수]
+
+임시 폴더에 YYMMDD_HHMM 형태의 폴더들과 _wordbook.txt 파일을 만든 뒤,
+캐시 없이(use_cache=False) 순차 / 병렬로 각각 load_wordbooks를 실행해 시간을 비교합니다.
+"""
+import os
+import sys
+import shutil
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wordbook_manager import load_wordbooks, resolve_workers  # noqa: E402
+
+
+def make_library(directory, file_count, words_per_file):
+    for i in range(file_count):
+        folder = os.path.join(directory, f"2501{i // 100:02d}_{i % 100:04d}")
+        os.makedirs(folder, exist_ok=True)
+        # 파일 크기를 일부러 들쭉날쭉하게 (크기별 샤딩 확인용)
+        n = words_per_file * (1 + i % 5)
+        with open(os.path.join(folder, f"deck{i}_wordbook.txt"), 'w', encoding='utf-8') as f:
+            for j in range(n):
+                f.write(f"word{j}\n뜻 {j}\n")
+                if j % 2 == 0:
+                    f.write(f"-Example sentence {j}. + 예문 {j}\n")
+
+
+def main(file_count, words_per_file):
+    directory = tempfile.mkdtemp(prefix="pip_bench_")
+    try:
+        make_library(directory, file_count, words_per_file)
+        print(f"library: {file_count} files, workers={resolve_workers()}")
+
+        start = time.perf_counter()
+        serial, _ = load_wordbooks(directory, use_cache=False, workers=1)
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel, _ = load_wordbooks(directory, use_cache=False)
+        parallel_time = time.perf_counter() - start
+
+        assert list(serial.items()) == list(parallel.items()), "parallel result differs from serial"
+        print(f"serial   : {serial_time:.2f}s")
+        print(f"parallel : {parallel_time:.2f}s  (x{serial_time / parallel_time:.2f})")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    file_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    words_per_file = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    main(file_count, words_per_file)
@@ -0,0 +1,94 @@
+"""
+단어장 파서 벤치마크: 기존(라인 리스트) 방식 vs iter_wordbook 스트리밍 방식.
+
+실행:
+    python benchmarks/bench_parse.py [단어 개수 ...]
+
+각 크기별로 임시 단어장 파일을 만든 뒤, 두 방식의 소요 시간과 최대 메모리(tracemalloc peak)를 출력합니다.
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wordbook_manager import iter_wordbook, parse_wordbook  # noqa: E402
+
+
+def legacy_parse_wordbook(file_path):
+    """기존 parse_wordbook 구현 (파일 전체를 lines 리스트로 읽은 뒤 인덱스로 순회)"""
+    words = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        lines = [line.strip() for line in f if line.strip()]
+
+    i = 0
+    while i < len(lines):
+        word = lines[i]
+        meaning = lines[i+1] if i+1 < len(lines) else ""
+        example = ""
+        if i+2 < len(lines) and lines[i+2].startswith('-'):
+            example_line = lines[i+2]
+            if '+' in example_line:
+                parts = example_line[1:].split('+', 1)
+                if len(parts) == 2:
+                    example = f"-{parts[0].strip()}+{parts[1].strip()}"
+                else:
+                    example = example_line
+            else:
+                example = example_line
+            i += 3
+        else:
+            i += 2
+        words.append({'word': word, 'meaning': meaning, 'example': example})
+    return words, len(words)
+
+
+def count_only(file_path):
+    """iter_wordbook을 리스트로 모으지 않고 순회만 하는 경우 (순수 스트리밍)"""
+    count = 0
+    for _ in iter_wordbook(file_path):
+        count += 1
+    return None, count
+
+
+def make_wordbook(path, n):
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(n):
+            f.write(f"word{i}\n")
+            f.write(f"뜻 {i}\n")
+            if i % 2 == 0:
+                f.write(f"-This is example number {i}. + 이것은 {i}번째 예문입니다.\n")
+
+
+def measure(func, path):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, peak
+
+
+def main(sizes):
+    print(f"{'entries':>10} {'method':<10} {'time(s)':>9} {'peak(MB)':>9}")
+    for n in sizes:
+        fd, path = tempfile.mkstemp(suffix="_wordbook.txt")
+        os.close(fd)
+        try:
+            make_wordbook(path, n)
+            for name, func in (("legacy", legacy_parse_wordbook),
+                               ("parse", parse_wordbook),
+                               ("iter", count_only)):
+                elapsed, peak = measure(func, path)
+                print(f"{n:>10} {name:<10} {elapsed:>9.3f} {peak / 1024 / 1024:>9.1f}")
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    main(sizes)
@@ -0,0 +1,81 @@
+"""
+간격 반복 스케줄러(StudyScheduler) 속도 측정.
+
+실행:
+    python benchmarks/bench_scheduler.py [단어 개수 ...]
+
+기본으로 10k, 100k개의 가짜 단어로
+    - 처음 여는 단어장 / 절반을 채점한 기록이 있는 단어장의 스케줄러 생성
+    - 다음 단어 고르기 + 채점(알았음/몰랐음/넘기기 섞어서) 한 번
+    - 학습 기록 저장/불러오기
+의 시간을 출력합니다.
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from word_entry import WordEntry  # noqa: E402
+from study_scheduler import StudyScheduler, ScheduleStore, DAY_SECONDS  # noqa: E402
+
+STEPS = 20_000
+
+
+def study(scheduler, rnd, now):
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        index = scheduler.next_card(now)
+        roll = rnd.random()
+        if roll < 0.4:
+            scheduler.answer(index, True, now)
+        elif roll < 0.6:
+            scheduler.answer(index, False, now)
+        else:
+            scheduler.skip(index, now)
+        now += 7
+    return (time.perf_counter() - start) / STEPS * 1e6
+
+
+def run(n, rnd):
+    words = [WordEntry(f"word{i}", f"뜻{i}", "") for i in range(n)]
+    now = time.time()
+
+    start = time.perf_counter()
+    scheduler = StudyScheduler(words, now=now)
+    print(f"{n:>9,} words: new deck   built in {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"    next+grade : {study(scheduler, rnd, now):.2f} us/step")
+
+    # 절반을 한 번씩 채점해둔 기록 (복습 시각은 지난 달 ~ 다음 달에 흩어짐)
+    for index in rnd.sample(range(n), n // 2):
+        state = scheduler.answer(index, True, now)
+        state.due = now + rnd.uniform(-30, 30) * DAY_SECONDS
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = ScheduleStore(directory)
+        path = os.path.join(directory, "bench_wordbook.txt")
+        start = time.perf_counter()
+        store.save(path, scheduler.states)
+        print(f"    save       : {(time.perf_counter() - start) * 1000:.1f} ms ({len(scheduler.states):,} cards)")
+        start = time.perf_counter()
+        states = store.load(path)
+        print(f"    load       : {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    scheduler = StudyScheduler(words, states, now=now)
+    print(f"    reviewed deck built in {(time.perf_counter() - start) * 1000:.1f} ms "
+          f"({scheduler.due_count(now):,} due)")
+    print(f"    next+grade : {study(scheduler, rnd, now):.2f} us/step")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    rnd = random.Random(0)
+    for n in sizes:
+        run(n, rnd)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+전체 검색 색인(SearchIndex) 검색 속도 측정.
+
+실행:
+    python benchmarks/bench_search.py [단어 개수]
+
+가짜 단어장(5,000단어씩)으로 색인을 만든 뒤, 드문 단어/흔한 단어/한글 2-gram/한 글자 한글 등
+여러 종류의 검색어에 대해 검색 시간(ms)을 출력합니다. (기본 500k 단어)
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search_index import SearchIndex  # noqa: E402
+from word_entry import WordEntry  # noqa: E402
+
+BOOK_SIZE = 5000
+
+
+def build_index(n, rnd):
+    syllables = [chr(0xAC00 + i) for i in range(0, 11172, 37)]
+    vocab = ["".join(rnd.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rnd.randint(3, 9)))
+             for _ in range(50000)]
+    common = ["the", "a", "is", "to", "of", "and", "in", "it"]
+
+    index = SearchIndex()
+    for book in range(max(1, n // BOOK_SIZE)):
+        words = []
+        for _ in range(BOOK_SIZE):
+            word = rnd.choice(vocab)
+            meaning = "".join(rnd.choice(syllables) for _ in range(rnd.randint(2, 5)))
+            example = "-" + " ".join([rnd.choice(common), rnd.choice(vocab), word, rnd.choice(common)]) \
+                + "+" + meaning + " 입니다"
+            words.append(WordEntry(word, meaning, example))
+        index.add_book(f"book{book}", words)
+    return index, vocab, syllables
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    rnd = random.Random(0)
+
+    start = time.perf_counter()
+    index, vocab, syllables = build_index(n, rnd)
+    print(f"indexed {n:,} entries in {time.perf_counter() - start:.1f}s ({len(index.postings):,} tokens)")
+
+    queries = [
+        vocab[5],                      # 드문 영단어
+        f"the {vocab[5]}",             # 흔한 단어 + 드문 단어
+        "the",                         # 아주 흔한 단어
+        syllables[3] + syllables[4],   # 한글 2-gram
+        "입니다",                       # 모든 예문에 들어 있는 한글
+        syllables[3],                  # 한 글자 한글 (첫 검색은 글자 -> 2-gram 표 생성)
+        syllables[8],
+    ]
+    for query in queries:
+        start = time.perf_counter()
+        hits = index.search(query)
+        print(f"{query!r:>24}: {len(hits):3d} hits  {(time.perf_counter() - start) * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
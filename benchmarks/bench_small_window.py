@@ -0,0 +1,72 @@
+"""
+학습 창(SmallWindow)에서 다음 단어로 넘어갈 때 드는 CPU 시간 측정.
+
+실행:
+    python benchmarks/bench_small_window.py [단어 개수 ...]
+
+기본으로 10k 단어 단어장을 열고 (TTS, 자동 넘어가기는 끔)
+    - 첫 바퀴: 단어장의 모든 단어를 한 번씩 보여줌
+    - 둘째 바퀴: 같은 단어들을 다시 한 번씩 보여줌
+    - 예문 토글 후: 표시 설정을 바꾼 뒤 ADVANCES번
+마다 show_next_word + 이벤트 처리(다시 그리기 포함)에 든 CPU 시간(us)을 출력합니다.
+화면이 없어도 돌 수 있도록 QT_QPA_PLATFORM=offscreen으로 실행합니다.
+"""
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from word_entry import WordEntry  # noqa: E402
+from small_window import SmallWindow  # noqa: E402
+
+ADVANCES = 2000
+
+
+def make_words(n, rnd):
+    syllables = [chr(0xAC00 + i) for i in range(0, 11172, 37)]
+    words = []
+    for _ in range(n):
+        word = "".join(rnd.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rnd.randint(3, 12)))
+        meaning = "".join(rnd.choice(syllables) for _ in range(rnd.randint(2, 8)))
+        example = " ".join(rnd.choice(["This", "is", "a", word, "example", "sentence"]) for _ in range(rnd.randint(3, 12)))
+        words.append(WordEntry(word, meaning, f"-{example}+{meaning} 입니다"))
+    return words
+
+
+def advance(app, window, count):
+    start = time.process_time()
+    for _ in range(count):
+        window.show_next_word()
+        app.processEvents()
+    return (time.process_time() - start) / count * 1e6
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000]
+    app = QApplication(sys.argv[:1])
+    os.chdir(ROOT)  # assets/ 아이콘 경로
+    rnd = random.Random(0)
+
+    window = SmallWindow({"Pretendard-Bold.otf": "Pretendard", "Pretendard-Regular.otf": "Pretendard"})
+    window.is_tts_on = False
+    window.is_auto_on = False
+    window.show()
+    for n in sizes:
+        window.set_word_list(make_words(n, rnd))
+        app.processEvents()
+        print(f"{n:>9,} words")
+        print(f"    first lap  : {advance(app, window, n):.0f} us/advance")
+        print(f"    second lap : {advance(app, window, n):.0f} us/advance")
+        window.toggle_example()
+        print(f"    after toggle: {advance(app, window, ADVANCES):.0f} us/advance")
+        window.toggle_example()
+
+
+if __name__ == "__main__":
+    main()
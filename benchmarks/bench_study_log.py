@@ -0,0 +1,82 @@
+"""
+학습 기록(StudyLog) 속도 측정.
+
+실행:
+    python benchmarks/bench_study_log.py [하루 이벤트 수]
+
+임시 폴더에 하루 EVENTS_PER_DAY개(기본 3000)씩 1년치 기록을 만들고
+    - log() 한 번 (학습 창에서 단어를 넘길 때 드는 시간)
+    - flush() 한 번 (FLUSH_LINES개)
+    - 최근 3개월 / 1년 전체 읽기, 특정 이벤트만 골라 읽기
+의 시간을 출력합니다.
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication  # noqa: E402
+
+import study_log  # noqa: E402
+from study_log import StudyLog, log_date, FLUSH_LINES  # noqa: E402
+
+DAYS = 365
+EVENT_MIX = [study_log.CARD_SHOWN, study_log.AUDIO_PLAYED, study_log.AUDIO_PLAYED,
+             study_log.CARD_SKIPPED, study_log.NAV_NEXT, study_log.CARD_KNEW]
+
+
+def write_year(log, per_day, rnd):
+    """1년치 기록 파일을 직접 만듦 (log()는 현재 시각을 쓰므로)"""
+    books = [f"{2400 + i:04d}_{i:04d}/day{i}_wordbook.txt" for i in range(50)]
+    now = time.time()
+    os.makedirs(log.folder, exist_ok=True)
+    for day in range(DAYS):
+        t = now - (DAYS - day) * 86400
+        book = rnd.choice(books)
+        lines = [f'{{"t":{t:.3f},"e":"start","b":"{book}","n":500}}']
+        for i in range(per_day):
+            t += rnd.uniform(1, 8)
+            event = rnd.choice(EVENT_MIX)
+            lines.append(f'{{"t":{t:.3f},"e":"{event}","b":"{book}","w":"word{i % 500}"}}')
+        lines.append(f'{{"t":{t:.3f},"e":"stop","b":"{book}"}}')
+        with open(log.path_for(log_date(now - (DAYS - day) * 86400)), 'a', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+
+
+def main():
+    per_day = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    app = QCoreApplication(sys.argv[:1])  # noqa: F841  (QTimer 사용)
+    rnd = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        log = StudyLog(directory)
+        start = time.perf_counter()
+        for i in range(FLUSH_LINES - 1):
+            log.log(study_log.CARD_SHOWN, "2501_0101/a_wordbook.txt", w=f"word{i}")
+        elapsed = time.perf_counter() - start
+        print(f"log()      : {elapsed / (FLUSH_LINES - 1) * 1e6:.2f} us/event")
+        start = time.perf_counter()
+        log.flush()
+        print(f"flush()    : {(time.perf_counter() - start) * 1000:.2f} ms ({FLUSH_LINES - 1} events)")
+
+        write_year(log, per_day, rnd)
+        total = DAYS * (per_day + 2)
+        print(f"{DAYS} days, {total:,} events")
+
+        today = time.time()
+        since = log_date(today - 90 * 86400)
+        start = time.perf_counter()
+        count = sum(1 for _ in log.iter_events(start=since))
+        print(f"    last 90 days : {(time.perf_counter() - start) * 1000:.0f} ms ({count:,} events)")
+        start = time.perf_counter()
+        count = sum(1 for _ in log.iter_events())
+        print(f"    whole year   : {(time.perf_counter() - start) * 1000:.0f} ms ({count:,} events)")
+        start = time.perf_counter()
+        count = sum(1 for _ in log.iter_events(events={study_log.CARD_SKIPPED}))
+        print(f"    skips only   : {(time.perf_counter() - start) * 1000:.0f} ms ({count:,} events)")
+
+
+if __name__ == "__main__":
+    main()
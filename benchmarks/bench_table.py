@@ -0,0 +1,100 @@
+"""
+단어 테이블을 열 때 첫 화면이 그려지기까지의 시간(time-to-first-paint) 측정.
+
+실행:
+    python benchmarks/bench_table.py [단어 개수 ...]
+
+기본으로 1k, 50k, 500k 단어에 대해
+    - model: QTableView + WordTableModel + fit_column_widths (지금 방식)
+    - items: QTableWidget에 행마다 QTableWidgetItem 3개 + resizeColumnsToContents (이전 방식)
+로 단어장을 표시하고 viewport를 한 번 그릴 때까지의 시간(ms)을 출력합니다.
+이전 방식은 오래 걸려서 ITEMS_MAX_ROWS 이하에서만 잽니다.
+화면이 없어도 돌 수 있도록 QT_QPA_PLATFORM=offscreen으로 실행합니다.
+"""
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication, QTableView, QTableWidget, QTableWidgetItem  # noqa: E402
+
+from word_entry import WordEntry  # noqa: E402
+from word_table_model import WordTableModel, fit_column_widths  # noqa: E402
+
+ITEMS_MAX_ROWS = 50_000
+STYLE = "font-family: 'Pretendard'; font-size: 16px;"
+
+
+def make_words(n, rnd):
+    syllables = [chr(0xAC00 + i) for i in range(0, 11172, 37)]
+    words = []
+    for _ in range(n):
+        word = "".join(rnd.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rnd.randint(3, 12)))
+        meaning = "".join(rnd.choice(syllables) for _ in range(rnd.randint(2, 8)))
+        words.append(WordEntry(word, meaning, f"-This is {word}+{meaning} 입니다"))
+    return words
+
+
+def first_paint(view):
+    view.resize(900, 600)
+    view.show()
+    view.viewport().grab()  # viewport를 지금 바로 한 번 그림
+    view.hide()
+
+
+def open_with_model(words):
+    view = QTableView()
+    view.setStyleSheet(STYLE)
+    model = WordTableModel(view)
+    view.setModel(model)
+
+    start = time.perf_counter()
+    model.set_words(words)
+    fit_column_widths(view)
+    first_paint(view)
+    elapsed = time.perf_counter() - start
+    view.deleteLater()
+    return elapsed
+
+
+def open_with_items(words):
+    table = QTableWidget()
+    table.setStyleSheet(STYLE)
+    table.setColumnCount(3)
+    table.setHorizontalHeaderLabels(["영단어", "뜻", "예문"])
+
+    start = time.perf_counter()
+    table.setRowCount(len(words))
+    for row, entry in enumerate(words):
+        table.setItem(row, 0, QTableWidgetItem(entry.word))
+        table.setItem(row, 1, QTableWidgetItem(entry.meaning))
+        table.setItem(row, 2, QTableWidgetItem(entry.example_body))
+    table.resizeColumnsToContents()
+    first_paint(table)
+    elapsed = time.perf_counter() - start
+    table.deleteLater()
+    return elapsed
+
+
+def main():
+    app = QApplication(sys.argv[:1])
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 50_000, 500_000]
+    rnd = random.Random(0)
+    for n in sizes:
+        words = make_words(n, rnd)
+        model_ms = open_with_model(words) * 1000
+        line = f"{n:>9,} rows: model {model_ms:9.1f} ms"
+        if n <= ITEMS_MAX_ROWS:
+            items_ms = open_with_items(words) * 1000
+            line += f"   items {items_ms:9.1f} ms   ({items_ms / model_ms:,.0f}x)"
+        else:
+            line += "   items   (skipped)"
+        print(line)
+        app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
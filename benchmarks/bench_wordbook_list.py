@@ -0,0 +1,123 @@
+"""
+왼쪽 단어장 목록을 채우는 시간 측정.
+
+실행:
+    python benchmarks/bench_wordbook_list.py [단어장 개수 ...]
+
+기본으로 1k, 10k개의 가짜 단어장(가져오기 폴더 YYMMDD_HHMM 하나에 5개씩, 하루에 폴더 3개)으로
+    - model: QTreeView + WordbookListModel + WordbookItemDelegate (지금 방식, 마지막 묶음만 펼침)
+    - widgets: QListWidget + 행마다 QWidget/QLabel 2개 + setItemWidget (이전 방식)
+를 채우고 viewport를 한 번 그릴 때까지의 시간(ms)과, 제목 필터 한 번에 걸리는 시간을 출력합니다.
+화면이 없어도 돌 수 있도록 QT_QPA_PLATFORM=offscreen으로 실행합니다.
+"""
+import os
+import sys
+import time
+import random
+import datetime
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QObject, pyqtSignal  # noqa: E402
+from PyQt5.QtWidgets import (  # noqa: E402
+    QApplication, QTreeView, QListWidget, QListWidgetItem, QWidget, QLabel, QHBoxLayout
+)
+
+from wordbook_catalog import WordbookRecord  # noqa: E402
+from wordbook_list_model import WordbookListModel, WordbookItemDelegate  # noqa: E402
+
+BOOKS_PER_FOLDER = 5
+FOLDERS_PER_DAY = 3
+
+
+class FakeCatalog(QObject):
+    """WordbookListModel이 쓰는 부분(records/get/시그널)만 있는 카탈로그"""
+    wordbook_added = pyqtSignal(int)
+    wordbook_changed = pyqtSignal(int)
+    wordbook_removed = pyqtSignal(int)
+    reloaded = pyqtSignal()
+    listed = pyqtSignal()
+    wordbook_loaded = pyqtSignal(int)
+
+    def __init__(self, n, rnd):
+        super().__init__()
+        self._records = {}
+        start = datetime.datetime(2024, 1, 1, 9, 0)
+        for i in range(n):
+            folder_no = i // BOOKS_PER_FOLDER
+            when = start + datetime.timedelta(days=folder_no // FOLDERS_PER_DAY, hours=folder_no % FOLDERS_PER_DAY)
+            title = "".join(rnd.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rnd.randint(5, 14)))
+            path = os.path.join("words", when.strftime("%y%m%d_%H%M"), f"{title}_wordbook.txt")
+            self._records[i] = WordbookRecord(i, title, path, [None] * rnd.randint(10, 300))
+
+    def records(self):
+        return list(self._records.values())
+
+    def get(self, wordbook_id):
+        return self._records.get(wordbook_id)
+
+
+def populate_model(catalog):
+    view = QTreeView()
+    view.setHeaderHidden(True)
+    view.setUniformRowHeights(True)
+    view.setItemDelegate(WordbookItemDelegate(view))
+    view.resize(300, 600)
+
+    start = time.perf_counter()
+    model = WordbookListModel(catalog, view)
+    view.setModel(model)
+    view.expand(model.index(model.rowCount() - 1, 0))
+    view.show()
+    view.viewport().grab()
+    populate = time.perf_counter() - start
+
+    start = time.perf_counter()
+    model.set_filter("ab")
+    view.viewport().grab()
+    filtered = time.perf_counter() - start
+    view.hide()
+    view.deleteLater()
+    return populate, filtered
+
+
+def populate_widgets(catalog):
+    view = QListWidget()
+    view.resize(300, 600)
+
+    start = time.perf_counter()
+    for record in catalog.records():
+        widget = QWidget()
+        layout = QHBoxLayout()
+        layout.addWidget(QLabel(record.title))
+        layout.addStretch()
+        layout.addWidget(QLabel(f"({record.count})"))
+        widget.setLayout(layout)
+        item = QListWidgetItem(view)
+        item.setSizeHint(widget.sizeHint())
+        view.addItem(item)
+        view.setItemWidget(item, widget)
+    view.show()
+    view.viewport().grab()
+    elapsed = time.perf_counter() - start
+    view.hide()
+    view.deleteLater()
+    return elapsed
+
+
+def main():
+    app = QApplication(sys.argv[:1])
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000]
+    rnd = random.Random(0)
+    for n in sizes:
+        catalog = FakeCatalog(n, rnd)
+        populate, filtered = populate_model(catalog)
+        widgets = populate_widgets(catalog)
+        print(f"{n:>7,} wordbooks: model {populate * 1000:7.1f} ms (filter {filtered * 1000:5.1f} ms)   "
+              f"widgets {widgets * 1000:8.1f} ms")
+        app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
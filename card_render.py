@@ -0,0 +1,87 @@
+from collections import OrderedDict
+
+from PyQt5.QtGui import QFontMetrics
+
+RENDER_CACHE_SIZE = 4096   # 기억해둘 카드 수 (단어 하나에 문자열 두 개 + 숫자 하나)
+BASE_WIDTH = 330           # 학습 창 기본 너비
+MAX_WIDTH = 370            # 예문이 길어도 이 이상은 넓히지 않음
+WIDTH_PADDING = 20         # 예문 너비에 더하는 여백
+WIDTH_STEP = 20            # 너비를 이 단위로 올려서 맞춤 (카드마다 1px씩 다른 너비로 창 크기를 바꾸지 않도록)
+
+
+class CardRender:
+    """학습 창에 카드 하나를 표시하는 데 필요한 값 (단어/뜻 HTML, 예문 텍스트, 창 너비)"""
+    __slots__ = ("html", "example_text", "width")
+
+    def __init__(self, html, example_text, width):
+        self.html = html
+        self.example_text = example_text
+        self.width = width
+
+
+class CardRenderCache:
+    """
+    학습 창(SmallWindow) 카드 표시값의 LRU 캐시.
+
+    키는 단어장 안의 단어 인덱스이고, 표시 설정(예문 표시 여부, 글꼴)은 settings로 따로 기억합니다.
+    settings가 바뀌면(set_settings) 캐시를 비우고, 단어장을 바꿀 때는 clear()로 비웁니다.
+    예문 너비를 재는 QFontMetrics도 설정마다 한 번만 만듭니다.
+    """
+    def __init__(self, capacity=RENDER_CACHE_SIZE):
+        self.capacity = capacity
+        self.items = OrderedDict()   # {index: CardRender}
+        self.settings = None         # (예문 표시 여부, 굵은 글꼴, 보통 글꼴, 예문 글꼴 키)
+        self.metrics = None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def clear(self):
+        self.items.clear()
+
+    def set_settings(self, is_example_shown, bold_font, regular_font, example_font):
+        """표시 설정을 알려줍니다. 이전과 다르면 만들어둔 카드를 모두 버림"""
+        settings = (is_example_shown, bold_font, regular_font, example_font.key())
+        if settings == self.settings:
+            return
+        self.settings = settings
+        self.metrics = QFontMetrics(example_font)
+        self.items.clear()
+
+    def get(self, index, entry):
+        """index번 단어(entry)의 CardRender (없으면 만들어서 기억)"""
+        render = self.items.get(index)
+        if render is not None:
+            self.items.move_to_end(index)
+            self.hits += 1
+            return render
+        self.misses += 1
+        render = self.build(entry)
+        self.items[index] = render
+        if len(self.items) > self.capacity:
+            self.items.popitem(last=False)
+        return render
+
+    def build(self, entry):
+        is_example_shown, bold_font, regular_font, _ = self.settings
+        html = (
+            f"<h2 style='margin: 0; font-family: {bold_font}; font-size: 20px;'>{entry.word}</h2>"
+            f"<p style='margin: 0 0 3px 0; font-family: {regular_font}; font-size: 14px;'>{entry.meaning}</p>"
+        )
+
+        # 예문 텍스트 (영문/한글로 나뉜 예문은 두 줄로, 아니면 원문 그대로)
+        if is_example_shown and entry.example_en is not None:
+            if entry.has_split_example:
+                example_text = f"{entry.example_en}\n{entry.example_ko}"
+                measured = f"{entry.example_en} {entry.example_ko}"
+            else:
+                example_text = measured = entry.example
+            text_width = self.metrics.horizontalAdvance(measured) + WIDTH_PADDING
+            steps = -(-(text_width - BASE_WIDTH) // WIDTH_STEP)
+            width = min(BASE_WIDTH + max(0, steps) * WIDTH_STEP, MAX_WIDTH)
+        else:
+            example_text = ""
+            width = BASE_WIDTH
+        return CardRender(html, example_text, width)
@@ -1,4 +1,5 @@
-from PyQt5.QtWidgets import QLabel
+from PyQt5.QtWidgets import QLabel, QStyledItemDelegate, QLineEdit, QCompleter
+from PyQt5.QtCore import Qt, QStringListModel
 
 class ColorBlock(QLabel):
     """색상 블록 위젯"""
@@ -6,3 +7,25 @@ class ColorBlock(QLabel):
         super().__init__()
         self.setStyleSheet(f"background-color: {color};")
         self.setMinimumSize(min_width, min_height)
+
+
+class HeadwordDelegate(QStyledItemDelegate):
+    """
+    테이블의 영단어 칸을 편집할 때 라이브러리 전체 영단어로 자동 완성해주는 델리게이트.
+    lookup: HeadwordLookup, is_headword_column: column -> 영단어 칸인지 (bool)
+    """
+    def __init__(self, lookup, is_headword_column=lambda column: column == 0, parent=None):
+        super().__init__(parent)
+        self.lookup = lookup
+        self.is_headword_column = is_headword_column
+
+    def createEditor(self, parent, option, index):
+        editor = super().createEditor(parent, option, index)
+        if self.lookup is None or not self.is_headword_column(index.column()) or not isinstance(editor, QLineEdit):
+            return editor
+        model = QStringListModel(editor)
+        completer = QCompleter(model, editor)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        editor.setCompleter(completer)
+        editor.textEdited.connect(lambda text: model.setStringList(self.lookup.complete(text)))
+        return editor
@@ -0,0 +1,124 @@
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTreeWidget, QTreeWidgetItem,
+    QPushButton, QMessageBox
+)
+from PyQt5.QtCore import Qt
+
+from wordbook_dedup import find_duplicates, merge_duplicates
+
+
+class DuplicateDialog(QDialog):
+    """
+    라이브러리 전체의 중복 단어를 보여주고, 선택한 묶음을 한 번에 병합하는 QDialog.
+    - 묶음마다 영단어, 들어 있는 단어장 수, 뜻이 같은지(정확히 같음/뜻 다름) 표시
+    - 병합: 묶음의 첫 번째 단어만 남기고 뜻/예문을 합친 뒤, 바뀐 단어장 파일을 한 번씩만 저장
+    """
+    def __init__(self, catalog, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.clusters = []
+        self.setWindowTitle("중복 단어 정리")
+        self.resize(600, 500)
+
+        self.setup_ui()
+        self.refresh()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        self.summary_label = QLabel("")
+        layout.addWidget(self.summary_label)
+
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(["영단어 / 단어장", "뜻"])
+        self.tree.setColumnWidth(0, 250)
+        layout.addWidget(self.tree)
+
+        btn_layout = QHBoxLayout()
+        self.select_exact_btn = QPushButton("정확히 같은 것만 선택")
+        self.merge_btn = QPushButton("선택 병합")
+        self.close_btn = QPushButton("닫기")
+        btn_layout.addWidget(self.select_exact_btn)
+        btn_layout.addStretch(1)
+        btn_layout.addWidget(self.merge_btn)
+        btn_layout.addWidget(self.close_btn)
+        layout.addLayout(btn_layout)
+
+        self.select_exact_btn.clicked.connect(self.select_exact)
+        self.merge_btn.clicked.connect(self.merge_selected)
+        self.close_btn.clicked.connect(self.accept)
+
+    def refresh(self):
+        self.clusters = find_duplicates(self.catalog.records())
+        self.tree.clear()
+        for cluster_index, cluster in enumerate(self.clusters):
+            members = [(self.catalog.get(rid), idx) for rid, idx in cluster.members]
+            first_record, first_idx = members[0]
+            kind = "정확히 같음" if cluster.kind == "exact" else "뜻 다름"
+            top = QTreeWidgetItem([f"{first_record.words[first_idx].word}  ({len(members)}곳, {kind})", ""])
+            top.setData(0, Qt.UserRole, cluster_index)
+            top.setFlags(top.flags() | Qt.ItemIsUserCheckable)
+            top.setCheckState(0, Qt.Unchecked)
+            for record, idx in members:
+                top.addChild(QTreeWidgetItem([record.title, record.words[idx].meaning]))
+            self.tree.addTopLevelItem(top)
+
+        exact = sum(1 for c in self.clusters if c.kind == "exact")
+        self.summary_label.setText(
+            f"중복 묶음 {len(self.clusters)}개 (정확히 같음 {exact}개, 뜻 다름 {len(self.clusters) - exact}개)"
+        )
+        self.merge_btn.setEnabled(bool(self.clusters))
+
+    def select_exact(self):
+        for i in range(self.tree.topLevelItemCount()):
+            item = self.tree.topLevelItem(i)
+            cluster = self.clusters[item.data(0, Qt.UserRole)]
+            item.setCheckState(0, Qt.Checked if cluster.kind == "exact" else Qt.Unchecked)
+
+    def merge_selected(self):
+        selected = []
+        for i in range(self.tree.topLevelItemCount()):
+            item = self.tree.topLevelItem(i)
+            if item.checkState(0) == Qt.Checked:
+                selected.append(self.clusters[item.data(0, Qt.UserRole)])
+        if not selected:
+            QMessageBox.warning(self, "경고", "병합할 묶음을 선택하세요.")
+            return
+
+        reply = QMessageBox.question(self, "확인",
+                                     f"{len(selected)}개 묶음을 병합하시겠습니까?\n"
+                                     "각 묶음의 첫 번째 단어만 남고 나머지는 단어장에서 지워집니다.",
+                                     QMessageBox.Yes | QMessageBox.No)
+        if reply != QMessageBox.Yes:
+            return
+        try:
+            removed, saved = merge_duplicates(self.catalog, selected)
+        except Exception as e:
+            QMessageBox.critical(self, "오류", f"병합 중 오류가 발생했습니다: {e}")
+            return
+        QMessageBox.information(self, "완료", f"단어 {removed}개를 정리했습니다. (단어장 {saved}개 저장)")
+        self.refresh()
+
+
+def ask_skip_duplicates(parent, duplicate_index, words, title, word_keys=None):
+    """
+    가져오거나 새로 만들 단어 목록에 중복이 있으면 물어봅니다. (파일을 쓰기 전에 호출)
+    word_keys: 미리 계산한 영단어 키 목록 (없으면 여기서 계산)
+    Returns: 저장할 단어 목록 (중복 제외 선택 시 걸러진 목록), 취소하면 None
+    """
+    flagged = duplicate_index.check(words, word_keys)
+    if not flagged:
+        return words
+    exact = sum(1 for kind in flagged.values() if kind == "exact")
+    reply = QMessageBox.question(
+        parent, "중복 단어",
+        f"'{title}'의 단어 {len(flagged)}개가 이미 다른 단어장(또는 같은 목록)에 있습니다.\n"
+        f"(뜻까지 같음 {exact}개, 뜻 다름 {len(flagged) - exact}개)\n\n"
+        "예: 뜻까지 같은 중복은 빼고 저장\n아니오: 그대로 모두 저장",
+        QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
+    )
+    if reply == QMessageBox.Cancel:
+        return None
+    if reply == QMessageBox.Yes:
+        return [w for i, w in enumerate(words) if flagged.get(i) != "exact"]
+    return words
@@ -0,0 +1,157 @@
+import os
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QListWidget, QListWidgetItem,
+    QPushButton, QComboBox, QProgressBar, QFileDialog, QMessageBox
+)
+from PyQt5.QtCore import Qt
+
+from wordbook_export import ExportJob, ExportSource, EXPORTERS, file_filters
+
+
+class ExportDialog(QDialog):
+    """
+    단어장을 TSV / JSON Lines / Anki 파일로 내보내는 QDialog.
+    - 체크한 단어장(처음에는 selected_ids)만, 또는 '전체 선택'으로 라이브러리 전체
+    - 내보내기는 ExportJob(백그라운드 스레드)에서 묶음 단위로 쓰고, 진행률 표시 + 취소 가능
+    """
+    def __init__(self, catalog, selected_ids=(), parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.job = None
+        self.setWindowTitle("단어장 내보내기")
+        self.resize(420, 500)
+
+        self.setup_ui()
+        self.fill_list(set(selected_ids))
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        layout.addWidget(QLabel("내보낼 단어장:"))
+        self.list_widget = QListWidget()
+        layout.addWidget(self.list_widget)
+
+        select_layout = QHBoxLayout()
+        self.select_all_btn = QPushButton("전체 선택")
+        self.select_none_btn = QPushButton("전체 해제")
+        select_layout.addWidget(self.select_all_btn)
+        select_layout.addWidget(self.select_none_btn)
+        select_layout.addStretch(1)
+        layout.addLayout(select_layout)
+
+        format_layout = QHBoxLayout()
+        format_layout.addWidget(QLabel("형식:"))
+        self.format_combo = QComboBox()
+        for key, filter_text in file_filters():
+            self.format_combo.addItem(filter_text, key)
+        format_layout.addWidget(self.format_combo, 1)
+        layout.addLayout(format_layout)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        self.status_label = QLabel("")
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.status_label)
+
+        btn_layout = QHBoxLayout()
+        self.export_btn = QPushButton("내보내기")
+        self.close_btn = QPushButton("닫기")
+        btn_layout.addStretch(1)
+        btn_layout.addWidget(self.export_btn)
+        btn_layout.addWidget(self.close_btn)
+        layout.addLayout(btn_layout)
+
+        self.select_all_btn.clicked.connect(lambda: self.set_all_checked(Qt.Checked))
+        self.select_none_btn.clicked.connect(lambda: self.set_all_checked(Qt.Unchecked))
+        self.export_btn.clicked.connect(self.start_export)
+        self.close_btn.clicked.connect(self.reject)
+
+    def fill_list(self, selected_ids):
+        for record in self.catalog.records():
+            item = QListWidgetItem(f"{record.title}  ({record.count})")
+            item.setData(Qt.UserRole, record.id)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked if record.id in selected_ids else Qt.Unchecked)
+            self.list_widget.addItem(item)
+
+    def set_all_checked(self, state):
+        for i in range(self.list_widget.count()):
+            self.list_widget.item(i).setCheckState(state)
+
+    def checked_records(self):
+        records = []
+        for i in range(self.list_widget.count()):
+            item = self.list_widget.item(i)
+            if item.checkState() == Qt.Checked:
+                record = self.catalog.get(item.data(Qt.UserRole))
+                if record is not None:
+                    records.append(record)
+        return records
+
+    # =====================
+    #   내보내기
+    # =====================
+    def start_export(self):
+        records = self.checked_records()
+        if not records:
+            QMessageBox.warning(self, "경고", "내보낼 단어장을 선택하세요.")
+            return
+
+        fmt = self.format_combo.currentData()
+        suffix = EXPORTERS[fmt].suffix
+        default_name = (records[0].title if len(records) == 1 else "단어장 전체") + suffix
+        dest_path, _ = QFileDialog.getSaveFileName(self, "내보낼 파일", default_name, self.format_combo.currentText())
+        if not dest_path:
+            return
+        if not dest_path.lower().endswith(suffix):
+            dest_path += suffix
+
+        self.job = ExportJob([ExportSource.from_record(r) for r in records], dest_path, fmt, self)
+        self.job.progress.connect(self.on_progress)
+        self.job.finished.connect(self.on_finished)
+        self.job.failed.connect(self.on_failed)
+        self.job.cancelled.connect(self.on_cancelled)
+
+        self.set_running(True)
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
+        self.status_label.setText(f"'{os.path.basename(dest_path)}'에 쓰는 중...")
+        self.job.start()
+
+    def set_running(self, running):
+        self.progress_bar.setVisible(running)
+        self.export_btn.setEnabled(not running)
+        self.list_widget.setEnabled(not running)
+        self.format_combo.setEnabled(not running)
+        self.close_btn.setText("취소" if running else "닫기")
+
+    def on_progress(self, done, total):
+        self.progress_bar.setValue(done * 100 // total if total else 100)
+        self.status_label.setText(f"{done:,} / {total:,} 단어")
+
+    def on_finished(self, dest_path, count):
+        self.end_job()
+        self.status_label.setText(f"단어 {count:,}개를 내보냈습니다.")
+        QMessageBox.information(self, "완료", f"단어 {count:,}개를 '{os.path.basename(dest_path)}'로 내보냈습니다.")
+
+    def on_failed(self, message):
+        self.end_job()
+        self.status_label.setText("")
+        QMessageBox.warning(self, "오류", f"내보내기 중 오류가 발생했습니다: {message}")
+
+    def on_cancelled(self):
+        self.end_job()
+        self.status_label.setText("내보내기를 취소했습니다.")
+
+    def end_job(self):
+        self.set_running(False)
+        if self.job is not None:
+            self.job.deleteLater()
+            self.job = None
+
+    def reject(self):
+        # 진행 중이면 '취소' 버튼: 작업만 멈추고 창은 그대로 (cancelled 시그널에서 정리)
+        if self.job is not None:
+            self.job.cancel()
+            return
+        super().reject()
@@ -1,11 +1,205 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel
+import os
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
+)
+from PyQt5.QtCore import Qt, QTimer, QRectF
+from PyQt5.QtGui import QPainter, QColor
 
-class HistoryPage(QWidget):
+from study_stats import StudyStats
+from wordbook_manager import title_from_filename
+
+CHART_DAYS = 30     # 날짜별 그래프에 보여줄 최근 일수
+TOP_ROWS = 20       # 단어장별 시간 / 많이 넘긴 단어 표의 행 수
+
+
+def format_duration(seconds):
+    """초 -> '1시간 5분', '12분', '30초'"""
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes = rest // 60
+    if hours:
+        return f"{hours}시간 {minutes}분"
+    if minutes:
+        return f"{minutes}분"
+    return f"{seconds}초"
+
+
+class DailyChart(QWidget):
+    """최근 CHART_DAYS일 동안 본 단어 수 막대 그래프 (왼쪽이 오래된 날)"""
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.days = []   # [(날짜, 본 단어, 학습 시간(초)), ...] 오래된 날부터
+        self.setMinimumHeight(160)
+
+    def set_days(self, days):
+        self.days = days
+        self.setToolTip("\n".join(f"{date}: {seen}개, {format_duration(seconds)}"
+                                  for date, seen, seconds in reversed(days) if seen))
+        self.update()
+
+    def paintEvent(self, event):
+        if not self.days:
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        label_height = 18
+        width = self.width()
+        height = self.height() - label_height
+        peak = max(seen for _, seen, _ in self.days) or 1
+        slot = width / len(self.days)
+        bar = max(2.0, slot * 0.7)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor("#45b1e9"))
+        for i, (_, seen, _) in enumerate(self.days):
+            bar_height = (height - 4) * seen / peak
+            painter.drawRoundedRect(QRectF(i * slot + (slot - bar) / 2, height - bar_height, bar, bar_height), 2, 2)
+        # 날짜(MM-DD)는 처음/가운데/마지막 날만
+        painter.setPen(QColor("#888"))
+        last = len(self.days) - 1
+        painter.drawText(QRectF(0, height, width / 3, label_height), Qt.AlignLeft, self.days[0][0][5:])
+        painter.drawText(QRectF(width / 3, height, width / 3, label_height), Qt.AlignCenter,
+                         self.days[last // 2][0][5:])
+        painter.drawText(QRectF(width * 2 / 3, height, width / 3, label_height), Qt.AlignRight,
+                         self.days[last][0][5:])
+
+
+class HistoryPage(QWidget):
+    """
+    '학습 이력' 페이지 - 날짜별 본 단어, 연속 학습 일수, 단어장별 학습 시간, 많이 넘긴 단어.
+
+    통계는 StudyStats가 미리 집계해둔 표에서 바로 읽습니다. (페이지를 처음 열 때 지난 집계를 불러오고,
+    그 뒤에 쌓인 기록만 더함 / 학습 중에는 StudyLog가 기록을 쓸 때마다 새 기록만 더함)
+    """
+    def __init__(self, study_log=None, parent=None):
+        super().__init__(parent)
+        self.study_log = study_log
+        self.stats = StudyStats(study_log) if study_log is not None else None
+        self.stats_loaded = False
+        if study_log is not None:
+            study_log.written.connect(self.on_log_written)
         self.setup_ui()
 
     def setup_ui(self):
+        self.setStyleSheet("""
+            QLabel {
+                font-size: 15px;
+            }
+            QLabel#Summary {
+                font-family: 'Pretendard';
+                font-size: 18px;
+                font-weight: bold;
+            }
+            QTableWidget {
+                font-size: 14px;
+            }
+        """)
         layout = QVBoxLayout(self)
-        label = QLabel("여기는 '학습 이력' 페이지입니다.")
-        layout.addWidget(label)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(12)
+
+        # 요약 (오늘 본 단어, 연속 학습, 최장 연속, 총 학습 시간)
+        summary_layout = QHBoxLayout()
+        self.today_label = QLabel(self)
+        self.streak_label = QLabel(self)
+        self.longest_label = QLabel(self)
+        self.total_label = QLabel(self)
+        for label in (self.today_label, self.streak_label, self.longest_label, self.total_label):
+            label.setObjectName("Summary")
+            label.setAlignment(Qt.AlignCenter)
+            summary_layout.addWidget(label)
+        layout.addLayout(summary_layout)
+
+        layout.addWidget(QLabel(f"최근 {CHART_DAYS}일 본 단어", self))
+        self.daily_chart = DailyChart(self)
+        layout.addWidget(self.daily_chart)
+
+        tables_layout = QHBoxLayout()
+        self.book_table = self.make_table(["단어장", "학습 시간"])
+        self.skipped_table = self.make_table(["단어", "넘긴 횟수", "본 횟수"])
+        for title, table in (("단어장별 학습 시간", self.book_table), ("많이 넘긴 단어", self.skipped_table)):
+            column = QVBoxLayout()
+            column.addWidget(QLabel(title, self))
+            column.addWidget(table)
+            tables_layout.addLayout(column)
+        layout.addLayout(tables_layout, 1)
+
+        self.empty_label = QLabel("아직 학습 기록이 없습니다. 작은 창에서 단어를 공부하면 여기에 표시됩니다.", self)
+        self.empty_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.empty_label)
+
+    def make_table(self, headers):
+        table = QTableWidget(0, len(headers), self)
+        table.setHorizontalHeaderLabels(headers)
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.setSelectionMode(QAbstractItemView.NoSelection)
+        table.setFocusPolicy(Qt.NoFocus)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        for column in range(1, len(headers)):
+            table.horizontalHeader().setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        return table
+
+    # =====================
+    #   통계 갱신
+    # =====================
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.stats is None:
+            return
+        if not self.stats_loaded:
+            # 처음 열 때: 저장해둔 집계 + 그 뒤에 쌓인 기록만
+            self.stats.load()
+            self.stats_loaded = True
+        if self.stats.catch_up():
+            QTimer.singleShot(0, self.stats.save)
+        self.refresh()
+
+    def on_log_written(self, events):
+        """학습 기록이 파일에 쓰임 -> 한 번이라도 연 페이지면 새 기록만 더해 둠"""
+        if not self.stats_loaded:
+            return
+        self.stats.catch_up()
+        if self.isVisible():
+            self.refresh()
+
+    def save_stats(self):
+        """앱을 끝낼 때 (집계를 불러온 적이 있으면 파일에 저장)"""
+        if self.stats_loaded:
+            self.stats.catch_up()
+            self.stats.save()
+
+    def refresh(self):
+        stats = self.stats
+        daily = stats.daily(CHART_DAYS)
+        current, longest = stats.streaks()
+        _, total_seconds = stats.totals()
+        self.today_label.setText(f"오늘 본 단어\n{daily[0][1]}개")
+        self.streak_label.setText(f"연속 학습\n{current}일")
+        self.longest_label.setText(f"최장 연속 학습\n{longest}일")
+        self.total_label.setText(f"총 학습 시간\n{format_duration(total_seconds)}")
+        self.daily_chart.set_days(list(reversed(daily)))
+
+        self.fill_table(self.book_table, [
+            (self.book_title(book), format_duration(seconds)) for book, seconds in stats.book_times(TOP_ROWS)
+        ])
+        self.fill_table(self.skipped_table, [
+            (word, str(skipped), str(seen)) for word, skipped, seen in stats.most_skipped(TOP_ROWS)
+        ])
+        self.empty_label.setVisible(not stats.days)
+
+    @staticmethod
+    def book_title(book):
+        """'2501_0101/오늘_wordbook.txt' -> '오늘 (2501_0101)'"""
+        folder, filename = os.path.split(book)
+        title = title_from_filename(filename)
+        return f"{title} ({folder})" if folder else title
+
+    @staticmethod
+    def fill_table(table, rows):
+        table.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column > 0:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                table.setItem(row, column, item)
@@ -0,0 +1,148 @@
+import os
+import mmap
+import struct
+from array import array
+
+from word_entry import WordEntry
+
+INDEX_HEADER = struct.Struct("<4sQQQ")  # magic, 원본 mtime_ns, 원본 size, 단어 개수
+INDEX_MAGIC = b"PWI1"
+
+
+def index_path_for(file_path):
+    """단어장 옆에 숨김 파일로 저장되는 오프셋 인덱스 경로 (.{파일명}.idx)"""
+    folder, filename = os.path.split(file_path)
+    return os.path.join(folder, f".{filename}.idx")
+
+
+class LazyWordbook:
+    """
+    아주 큰 단어장을 전부 읽지 않고 여는 읽기 전용 뷰.
+
+    _wordbook.txt 파일을 mmap으로 열고, 단어(단어/뜻/예문 묶음)마다 시작 바이트 위치만 담은
+    오프셋 인덱스를 한 번 만들어 둡니다. (인덱스는 .{파일명}.idx 로 저장해 다음 실행 때 재사용)
+    단어는 __getitem__으로 접근할 때 해당 구간만 디코딩하므로,
+    메모리는 실제로 본 단어 수에 비례합니다.
+
+    list처럼 len(), [i], [a:b], for 문을 지원하므로 SmallWindow.set_word_list 등에 그대로 넘길 수 있습니다.
+    """
+    def __init__(self, file_path, use_index_file=True):
+        self.file_path = file_path
+        self._file = open(file_path, 'rb')
+        st = os.fstat(self._file.fileno())
+        self._size = st.st_size
+        self._mtime = st.st_mtime_ns
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self._size else None
+        self._decoded = {}   # {index: WordEntry} 이미 디코딩한 단어
+
+        self.offsets = None
+        if use_index_file:
+            self.offsets = self._read_index_file()
+        if self.offsets is None:
+            self.offsets = self._build_index()
+            if use_index_file:
+                self._write_index_file()
+
+    # =====================
+    #   인덱스
+    # =====================
+    def _iter_lines(self):
+        """(시작 위치, 공백 제거한 줄 bytes)를 빈 줄은 건너뛰며 생성"""
+        self._file.seek(0)
+        pos = 0
+        for raw_line in self._file:
+            line = raw_line.strip()
+            # bytes.strip()은 ASCII 공백만 지우므로, 유니코드 공백만 있는 줄도 빈 줄로 취급
+            if line and (line[0] < 0x80 or line.decode('utf-8', 'replace').strip()):
+                yield pos, line
+            pos += len(raw_line)
+
+    def _build_index(self):
+        """iter_wordbook과 같은 규칙(단어, 뜻, '-'로 시작하면 예문)으로 단어 시작 위치를 기록"""
+        offsets = array('Q')
+        state = 0  # 0: 단어 기다림, 1: 뜻 기다림, 2: 예문 또는 다음 단어
+        for pos, line in self._iter_lines():
+            if state == 0:
+                offsets.append(pos)
+                state = 1
+            elif state == 1:
+                state = 2
+            elif line.startswith(b'-'):
+                state = 0
+            else:
+                offsets.append(pos)
+                state = 1
+        return offsets
+
+    def _read_index_file(self):
+        try:
+            with open(index_path_for(self.file_path), 'rb') as f:
+                magic, mtime, size, count = INDEX_HEADER.unpack(f.read(INDEX_HEADER.size))
+                if magic != INDEX_MAGIC or mtime != self._mtime or size != self._size:
+                    return None
+                offsets = array('Q')
+                offsets.fromfile(f, count)
+                return offsets
+        except (OSError, EOFError, struct.error):
+            return None
+
+    def _write_index_file(self):
+        index_path = index_path_for(self.file_path)
+        temp_path = index_path + ".tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(INDEX_HEADER.pack(INDEX_MAGIC, self._mtime, self._size, len(self.offsets)))
+                self.offsets.tofile(f)
+            os.replace(temp_path, index_path)
+        except OSError as e:
+            print(f"Failed to write wordbook index: {e}")
+
+    # =====================
+    #   list 호환 접근
+    # =====================
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("wordbook index out of range")
+
+        entry = self._decoded.get(index)
+        if entry is None:
+            entry = self._decode(index)
+            self._decoded[index] = entry
+        return entry
+
+    def __iter__(self):
+        # 전체 순회(테이블 채우기, 저장 등)는 디코딩 결과를 보관하지 않고 흘려보냄
+        for i in range(len(self)):
+            entry = self._decoded.get(i)
+            yield entry if entry is not None else self._decode(i)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def _decode(self, index):
+        start = self.offsets[index]
+        end = self.offsets[index + 1] if index + 1 < len(self.offsets) else self._size
+        # 인덱스(_iter_lines)와 같이 '\n'으로만 나눔 (splitlines는 \x0b, \x1c, \u2028 등에서도 나눠서 단어가 어긋남)
+        # CRLF 파일의 줄 끝 '\r'은 strip()으로 지워짐
+        lines = [line.strip() for line in self._mm[start:end].decode('utf-8').split('\n')]
+        lines = [line for line in lines if line]
+        word = lines[0]
+        meaning = lines[1] if len(lines) > 1 else ""
+        example = lines[2] if len(lines) > 2 else ""
+        return WordEntry(word, meaning, example)
+
+    def close(self):
+        """mmap/파일 핸들 해제 (Windows에서는 열려 있는 동안 파일 이름 변경/삭제가 안 됨)"""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,134 @@
+import os
+import time
+import threading
+from collections import deque
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+import wordbook_manager
+from wordbook_manager import iter_library, iter_prioritized, find_script_files, title_from_filename
+
+BATCH_SIZE = 200   # 한 번에 화면 스레드로 넘기는 최대 단어장 수
+BATCH_MS = 50      # 이 시간이 지나면 BATCH_SIZE가 차지 않아도 넘김
+
+
+class LibraryLoader(QObject):
+    """
+    시작할 때 words/ 라이브러리를 작업 스레드에서 읽어 화면 스레드(WordbookCatalog)로 조금씩 넘기는 로더.
+
+    1) 매니페스트 스캔(sqlite면 DB 목록)만 먼저 해서 단어장 목록을 보냄 (단어는 아직 읽지 않음)
+    2) 단어장을 하나씩 읽어 BATCH_SIZE개 또는 BATCH_MS마다 묶어서 보냄
+       prioritize(path)로 부탁받은 단어장은 차례를 건너뛰어 먼저 읽고 곧바로 보냄
+    3) 다 읽으면 finished
+
+    시그널 (작업 스레드에서 보내므로 화면 스레드의 슬롯에는 큐 연결로 전달됨):
+        listed([(title, path, script_text_path, script_audio_path), ...])
+        batch_loaded([(path, words), ...])   단어가 없는(읽지 못한) 단어장은 보내지 않음
+        finished()
+    """
+    listed = pyqtSignal(object)
+    batch_loaded = pyqtSignal(object)
+    finished = pyqtSignal()
+
+    def __init__(self, directory, manifest, parent=None):
+        super().__init__(parent)
+        self.directory = directory
+        self.manifest = manifest   # 로딩이 끝날 때까지는 작업 스레드만 사용
+        self._wanted = deque()     # prioritize로 부탁받은 경로 (deque의 append/pop은 스레드 간에 안전)
+        self._urgent = set()       # 부탁받아 먼저 읽은 경로 -> 모으지 않고 바로 보냄
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """다음 단어장을 넘기기 전에 멈추게 합니다. (멈춘 뒤에도 finished는 보냄)"""
+        self._cancel.set()
+
+    def is_cancelled(self):
+        return self._cancel.is_set()
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def prioritize(self, path):
+        """path 단어장을 다음 차례로 읽도록 합니다. (화면 스레드에서 호출, 여러 번 부르면 마지막 것부터)"""
+        self._wanted.append(path)
+
+    def _next_wanted(self):
+        try:
+            path = self._wanted.pop()
+        except IndexError:
+            return None
+        self._urgent.add(path)
+        return path
+
+    # =====================
+    #   작업 스레드
+    # =====================
+    def _run(self):
+        try:
+            if not os.path.isdir(self.directory):
+                print(f"Directory '{self.directory}' does not exist.")
+                self.listed.emit([])
+            elif wordbook_manager.STORAGE_ENGINE == "sqlite":
+                self._load_sqlite()
+            else:
+                self._load_text()
+        except Exception as e:
+            print(f"Library loading failed: {e}")
+        self.finished.emit()
+
+    def _load_text(self):
+        self.manifest.scan()
+        entries = list(self.manifest.iter_wordbooks())
+        self.listed.emit([
+            (title_from_filename(os.path.basename(path)), path, text_path, audio_path)
+            for path, text_path, audio_path in entries
+        ])
+        infos = iter_library(self.directory, manifest=self.manifest, entries=entries, priority=self._next_wanted)
+        try:
+            self._emit_batches((info["wordbook_path"], info["words"]) for info in infos)
+        finally:
+            infos.close()
+
+    def _load_sqlite(self):
+        from wordbook_store import SQLiteWordbookStore, DB_FILENAME
+
+        # sqlite3 연결은 만든 스레드에서만 쓸 수 있어서 로딩 전용 연결을 따로 엶
+        store = SQLiteWordbookStore(os.path.join(self.directory, DB_FILENAME))
+        try:
+            if store.is_empty():
+                store.import_text_tree(self.directory)
+            book_ids = {}
+            listing = []
+            for wordbook_id, title, source_path, count in store.list_wordbooks():
+                if count > 0:
+                    book_ids[source_path] = wordbook_id
+                    listing.append((title, source_path, *find_script_files(os.path.dirname(source_path))))
+            self.listed.emit(listing)
+            self._emit_batches(
+                (path, store.get_entries(book_ids[path]))
+                for path in iter_prioritized(list(book_ids), self._next_wanted)
+            )
+        finally:
+            store.close()
+
+    def _emit_batches(self, loaded):
+        batch = []
+        deadline = time.perf_counter() + BATCH_MS / 1000
+        for path, words in loaded:
+            if self._cancel.is_set():
+                return
+            batch.append((path, words))
+            urgent = path in self._urgent
+            self._urgent.discard(path)   # 읽은 경로는 바로 지움 (안 그러면 부탁받은 경로가 계속 쌓임)
+            if urgent or len(batch) >= BATCH_SIZE or time.perf_counter() >= deadline:
+                self.batch_loaded.emit(batch)
+                batch = []
+                deadline = time.perf_counter() + BATCH_MS / 1000
+        if batch:
+            self.batch_loaded.emit(batch)
+        self._urgent.clear()   # 이미 읽은 뒤에 부탁받아 다시 나오지 않은 경로
@@ -0,0 +1,180 @@
+import os
+import json
+
+MANIFEST_FILENAME = ".library_manifest.json"
+MANIFEST_VERSION = 1
+
+WORDBOOK_SUFFIX = "_wordbook.txt"
+SCRIPT_FILES = ("script.txt", "script.wav", "script_temp.mp3")
+
+
+def is_library_file(name):
+    """매니페스트가 기록하는 파일인지 (단어장/대본/음성, 매니페스트/캐시/색인처럼 앱이 쓰는 점(.) 파일은 제외)"""
+    return not name.startswith(".") and (name.endswith(WORDBOOK_SUFFIX) or name in SCRIPT_FILES)
+
+
+def is_library_folder(name):
+    """.study_schedule 같은 앱 데이터 폴더가 아닌지"""
+    return not name.startswith(".")
+
+
+class LibraryManifest:
+    """
+    words/ 폴더 구조를 기억해두는 매니페스트 (words/.library_manifest.json).
+
+    폴더마다 디렉토리 mtime, 하위 폴더 목록, 단어장/대본/음성 파일의 (mtime, size)를 저장합니다.
+    다음 스캔 때 디렉토리 mtime이 그대로인 폴더는 목록을 다시 읽지 않고(os.scandir 생략) 기록을 그대로 씁니다.
+    (파일이 추가/삭제/이름 변경되면 디렉토리 mtime이 바뀌므로 그 폴더만 다시 읽습니다.)
+
+    folders 구조:
+        {상대 폴더 경로: {"mtime": ns, "subdirs": [...], "files": {파일명: [mtime, size]}}}
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self.manifest_path = os.path.join(self.directory, MANIFEST_FILENAME)
+        self.folders = {}
+        self.last_changes = {"added": [], "removed": [], "modified": [], "scripts": []}
+        self._force = set()
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                self.folders = data.get("folders", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Library manifest ignored ({self.manifest_path}): {e}")
+            self.folders = {}
+
+    def save(self):
+        temp_path = self.manifest_path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": MANIFEST_VERSION, "folders": self.folders}, f, ensure_ascii=False)
+            os.replace(temp_path, self.manifest_path)
+        except Exception as e:
+            print(f"Failed to write library manifest: {e}")
+
+    # =====================
+    #   스캔
+    # =====================
+    def scan(self, force_folders=()):
+        """
+        라이브러리를 스캔해서 매니페스트를 갱신하고, 바뀐 내용을 반환합니다. (changes_since_last_scan과 동일)
+        force_folders(상대 경로)는 디렉토리 mtime과 상관없이 다시 읽습니다.
+        (파일을 제자리에서 덮어쓰면 폴더 mtime이 바뀌지 않으므로, 파일 감시자가 알려준 폴더를 넘김)
+        """
+        old_folders = self.folders
+        new_folders = {}
+        rescanned = []
+        self._force = set(force_folders)
+
+        if os.path.isdir(self.directory):
+            self._scan_folder("", old_folders, new_folders, rescanned)
+
+        changes = {"added": [], "removed": [], "modified": [], "scripts": []}
+        for rel in rescanned:
+            old_files = old_folders.get(rel, {}).get("files", {})
+            new_files = new_folders[rel]["files"]
+            for name, stat in new_files.items():
+                path = os.path.join(rel, name)
+                if name.endswith(WORDBOOK_SUFFIX):
+                    if name not in old_files:
+                        changes["added"].append(path)
+                    elif old_files[name] != stat:
+                        changes["modified"].append(path)
+            for name in old_files:
+                if name.endswith(WORDBOOK_SUFFIX) and name not in new_files:
+                    changes["removed"].append(os.path.join(rel, name))
+            if self._script_stats(old_files) != self._script_stats(new_files):
+                changes["scripts"].append(rel)
+
+        for rel, info in old_folders.items():
+            if rel not in new_folders:
+                for name in info["files"]:
+                    if name.endswith(WORDBOOK_SUFFIX):
+                        changes["removed"].append(os.path.join(rel, name))
+
+        self.folders = new_folders
+        self.last_changes = changes
+        # 다시 읽은 폴더라도(force, 매니페스트 저장으로 바뀐 words/ mtime 등) 목록이 그대로면 저장하지 않음
+        # (저장하면 words/ mtime이 또 바뀌어 LibraryWatcher가 다시 알려주므로)
+        if len(new_folders) != len(old_folders) or any(
+                self._listing(old_folders.get(rel)) != self._listing(new_folders[rel]) for rel in rescanned):
+            self.save()
+        return changes
+
+    def _scan_folder(self, rel, old_folders, new_folders, rescanned):
+        path = os.path.join(self.directory, rel) if rel else self.directory
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return
+
+        info = old_folders.get(rel)
+        if info is None or info["mtime"] != mtime or rel in self._force:
+            # 폴더 내용이 바뀌었거나 처음 보는 폴더 -> 목록을 다시 읽음
+            subdirs = []
+            files = {}
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        if is_library_folder(entry.name):
+                            subdirs.append(entry.name)
+                    elif is_library_file(entry.name):
+                        st = entry.stat()
+                        files[entry.name] = [st.st_mtime_ns, st.st_size]
+            info = {"mtime": mtime, "subdirs": sorted(subdirs), "files": files}
+            rescanned.append(rel)
+
+        new_folders[rel] = info
+        # 하위 폴더의 변경은 상위 폴더 mtime에 반영되지 않으므로 하위 폴더는 각자 확인
+        for name in info["subdirs"]:
+            self._scan_folder(os.path.join(rel, name), old_folders, new_folders, rescanned)
+
+    @staticmethod
+    def _listing(info):
+        """폴더 기록에서 폴더 mtime을 뺀 부분 (하위 폴더, 파일별 (mtime, size))"""
+        if info is None:
+            return None
+        return info["subdirs"], info["files"]
+
+    @staticmethod
+    def _script_stats(files):
+        # 대본/음성은 새로 생성되면서 덮어써지는 경우가 있어서 (mtime, size)까지 비교
+        return {name: stat for name, stat in files.items() if name in SCRIPT_FILES}
+
+    # =====================
+    #   조회
+    # =====================
+    def changes_since_last_scan(self):
+        """
+        마지막 scan()에서 바뀐 내용 (words/ 기준 상대 경로)
+            {"added": [...], "removed": [...], "modified": [...], "scripts": [대본/음성이 바뀐 폴더, ...]}
+        """
+        return self.last_changes
+
+    def iter_wordbooks(self):
+        """
+        매니페스트에 기록된 단어장을 (file_path, script_text_path, script_audio_path)로 하나씩 생성합니다.
+        대본/음성 파일이 없으면 None.
+        """
+        for rel in sorted(self.folders):
+            files = self.folders[rel]["files"]
+            folder = os.path.join(self.directory, rel) if rel else self.directory
+
+            text_path = os.path.join(folder, "script.txt") if "script.txt" in files else None
+            # 우선순위로 script.wav -> 없으면 script_temp.mp3
+            if "script.wav" in files:
+                audio_path = os.path.join(folder, "script.wav")
+            elif "script_temp.mp3" in files:
+                audio_path = os.path.join(folder, "script_temp.mp3")
+            else:
+                audio_path = None
+
+            for name in sorted(files):
+                if name.endswith(WORDBOOK_SUFFIX):
+                    yield os.path.join(folder, name), text_path, audio_path
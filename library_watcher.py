@@ -0,0 +1,123 @@
+import os
+from PyQt5.QtCore import QObject, QFileSystemWatcher, QTimer
+
+from library_manifest import is_library_file, is_library_folder
+
+DEBOUNCE_MS = 400  # 마지막 이벤트 후 이 시간 동안 조용하면 한 번에 반영
+
+
+class LibraryWatcher(QObject):
+    """
+    words/ 폴더를 QFileSystemWatcher로 감시해서 바뀐 폴더만 카탈로그에 반영합니다.
+
+    - 폴더 감시: 단어장/대본/음성 파일이 생기거나 삭제/이름 변경될 때 (directoryChanged)
+    - 파일 감시: 단어장/대본/음성 파일을 제자리에서 덮어쓸 때 (fileChanged)
+    짧은 시간에 몰려오는 이벤트(라디오 생성 중 script.txt, mp3, wav 저장 등)는
+    DEBOUNCE_MS 동안 모았다가 바뀐 폴더 목록으로 catalog.refresh(folders)를 한 번만 호출합니다.
+    이후 카탈로그 시그널로 각 페이지는 바뀐 단어장만 갱신하므로, 새로고침 버튼을 누를 필요가 없습니다.
+    """
+    def __init__(self, catalog, parent=None, debounce_ms=DEBOUNCE_MS):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.on_directory_changed)
+        self.watcher.fileChanged.connect(self.on_file_changed)
+
+        self.pending_folders = set()   # 감시하는 파일이 바뀐 폴더 (항상 다시 스캔)
+        self.changed_dirs = set()      # directoryChanged가 온 폴더 (목록이 실제로 바뀌었을 때만 다시 스캔)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(debounce_ms)
+        self.timer.timeout.connect(self.flush)
+
+    def start(self):
+        """카탈로그를 읽은 뒤 감시 시작 (백그라운드에서 읽는 중이면 다 읽은 뒤에 시작)"""
+        if self.catalog.is_loading:
+            self.catalog.reloaded.connect(self._start_after_load)
+            return
+        self.catalog.load()
+        self.sync_watch_list()
+
+    def _start_after_load(self):
+        self.catalog.reloaded.disconnect(self._start_after_load)
+        self.sync_watch_list()
+
+    def stop(self):
+        self.timer.stop()
+        self.pending_folders.clear()
+        self.changed_dirs.clear()
+        paths = self.watcher.directories() + self.watcher.files()
+        if paths:
+            self.watcher.removePaths(paths)
+
+    # =====================
+    #   이벤트 모으기
+    # =====================
+    def on_directory_changed(self, path):
+        self.changed_dirs.add(path)
+        self.timer.start()
+
+    def on_file_changed(self, path):
+        self.pending_folders.add(os.path.dirname(path))
+        # 삭제 후 다시 쓰는 방식(os.replace 등)으로 저장되면 감시가 풀리므로, flush 때 다시 등록
+        self.timer.start()
+
+    def flush(self):
+        """모아둔 폴더만 다시 스캔해서 카탈로그에 반영"""
+        # 매니페스트/캐시/색인 저장처럼 앱이 words/에 쓴 파일 때문에 온 알림은 버림 (반영하면 또 저장해서 끝없이 반복됨)
+        changed = self.pending_folders | {path for path in self.changed_dirs if self._listing_changed(path)}
+        self.pending_folders.clear()
+        self.changed_dirs.clear()
+        if not changed:
+            return
+        folders = sorted(changed)
+        try:
+            self.catalog.refresh(folders)
+        except Exception as e:
+            print(f"Library refresh failed: {e}")
+        self.sync_watch_list()
+
+    def _listing_changed(self, folder):
+        """폴더의 단어장/대본/음성 파일 또는 하위 폴더 목록이 매니페스트 기록과 다른지"""
+        rel = os.path.relpath(folder, self.catalog.directory)
+        info = self.catalog.manifest.folders.get("" if rel == os.curdir else rel)
+        if info is None:
+            return True
+        names = set()
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if is_library_folder(entry.name) if entry.is_dir() else is_library_file(entry.name):
+                        names.add(entry.name)
+        except OSError:
+            return True   # 폴더가 사라짐
+        return names != set(info["subdirs"]) | set(info["files"])
+
+    # =====================
+    #   감시 목록
+    # =====================
+    def sync_watch_list(self):
+        """매니페스트에 기록된 폴더/파일과 감시 목록을 맞춥니다. (새 폴더는 추가, 사라진 것은 제거)"""
+        manifest = self.catalog.manifest
+        directory = self.catalog.directory
+        wanted_dirs = set()
+        wanted_files = set()
+        if os.path.isdir(directory):
+            wanted_dirs.add(directory)
+        for rel, info in manifest.folders.items():
+            folder = os.path.join(directory, rel) if rel else directory
+            wanted_dirs.add(folder)
+            for name in info["files"]:
+                if is_library_file(name):
+                    wanted_files.add(os.path.join(folder, name))
+
+        current_dirs = set(self.watcher.directories())
+        current_files = set(self.watcher.files())
+        stale = (current_dirs - wanted_dirs) | (current_files - wanted_files)
+        if stale:
+            self.watcher.removePaths(list(stale))
+        new = [p for p in (wanted_dirs - current_dirs) | (wanted_files - current_files) if os.path.exists(p)]
+        if new:
+            failed = self.watcher.addPaths(new)
+            if failed:
+                print(f"Cannot watch {len(failed)} path(s), e.g. {failed[0]}")
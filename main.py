@@ -16,11 +16,13 @@ def main():
 
     # 메인 윈도우와 작은 창 생성
     main_window = MainWindow(fonts)  # MainWindow 생성
-    small_window = SmallWindow(fonts)  # word_list는 추후 설정
+    # word_list는 추후 설정, 학습 기록은 학습 페이지와 같은 저장소 사용
+    small_window = SmallWindow(fonts, schedule_store=main_window.study_page.schedule_store,
+                               study_log=main_window.study_log)
 
     # 신호 연결: 메인 윈도우에서 작은 창 열기 요청
     main_window.study_page.open_small_window_signal.connect(
-        lambda word_list: open_small_window(main_window, small_window, word_list)
+        lambda word_list, wordbook_path: open_small_window(main_window, small_window, word_list, wordbook_path)
     )
 
     # 신호 연결: 작은 창에서 메인 윈도우 열기 요청
@@ -28,14 +30,22 @@ def main():
         lambda: open_main_window(main_window, small_window)
     )
     
+    # 앱을 끝낼 때 라이브러리 로딩을 멈추고, 학습 세션을 닫고 모아둔 학습 기록을 파일에 씀
+    app.aboutToQuit.connect(main_window.catalog.cancel_loading)
+    app.aboutToQuit.connect(small_window.end_session)
+    app.aboutToQuit.connect(lambda: small_window.save_schedule(background=False))
+    app.aboutToQuit.connect(main_window.study_page.schedule_store.flush)  # 작업 스레드가 아직 쓰지 않은 기록
+    app.aboutToQuit.connect(main_window.study_log.flush)
+    app.aboutToQuit.connect(main_window.history_page.save_stats)  # 학습 이력 집계 (flush 뒤에)
+
     # 초기에는 메인 윈도우만 표시
     main_window.show()
 
     sys.exit(app.exec_())
 
-def open_small_window(main_window, small_window, word_list):
+def open_small_window(main_window, small_window, word_list, wordbook_path=None):
     """메인 윈도우에서 작은 창을 열고 메인 윈도우를 숨깁니다."""
-    small_window.set_word_list(word_list)  # 단어장 설정
+    small_window.set_word_list(word_list, wordbook_path)  # 단어장 설정 (학습 기록은 단어장 경로별)
     main_window.hide()
     small_window.show()
 
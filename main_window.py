@@ -11,6 +11,9 @@ from effects import apply_shadow_effect
 from study_page import StudyPage
 from radio_page import RadioPage
 from history_page import HistoryPage
+from wordbook_catalog import get_catalog
+from library_watcher import LibraryWatcher
+from study_log import StudyLog
 
 class MainWindow(QMainWindow):
     def __init__(self, fonts):
@@ -87,14 +90,22 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(self.stacked_widget, 1)
 
         # 페이지들 생성 & stacked_widget에 추가
-        self.study_page = StudyPage(self.fonts)
-        self.radio_page = RadioPage()
-        self.history_page = HistoryPage()
+        # (두 페이지는 같은 단어장 카탈로그를 공유 -> 라이브러리 스캔은 세션당 한 번)
+        self.catalog = get_catalog()
+        # 학습 기록 (작은 창이 기록하고 '학습 이력' 페이지가 읽음)
+        self.study_log = StudyLog(self.catalog.directory, self)
+        self.study_page = StudyPage(self.fonts, catalog=self.catalog)
+        self.radio_page = RadioPage(catalog=self.catalog)
+        self.history_page = HistoryPage(study_log=self.study_log)
 
         self.stacked_widget.addWidget(self.study_page)   # index 0
         self.stacked_widget.addWidget(self.radio_page)    # index 1
         self.stacked_widget.addWidget(self.history_page) # index 2
 
+        # words/ 폴더 감시 -> 파일이 바뀌면 바뀐 단어장만 자동 갱신 (새로고침 불필요)
+        self.library_watcher = LibraryWatcher(self.catalog, self)
+        self.library_watcher.start()
+
         # 기본 페이지는 '학습'(index 0)
         self.stacked_widget.setCurrentIndex(0)
 
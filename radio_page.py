@@ -15,17 +15,24 @@ from openai_api import request_radio_script
 from gtts import gTTS
 from pydub import AudioSegment
 
-# wordbook_manager의 확장 함수
-from wordbook_manager import load_wordbooks_with_script_audio
+# StudyPage와 공유하는 단어장 카탈로그
+from wordbook_catalog import get_catalog
 
 
 class RadioPage(QWidget):
-    def __init__(self, parent=None):
+    def __init__(self, catalog=None, parent=None):
         super().__init__(parent)
-        # 최종 데이터 (title -> { words, wordbook_path, script_text_path, script_audio_path })
-        self.all_data_map = {}
+        # 단어장 데이터 (id -> WordbookRecord: words, path, script_text_path, script_audio_path)
+        self.catalog = catalog if catalog is not None else get_catalog()
         self.parsed_script_lines = []
 
+        self.catalog.wordbook_added.connect(self.on_catalog_added)
+        self.catalog.wordbook_changed.connect(self.on_catalog_changed)
+        self.catalog.wordbook_removed.connect(self.on_catalog_removed)
+        self.catalog.wordbook_loaded.connect(self.on_catalog_loaded)
+        # 시작할 때 라이브러리는 백그라운드에서 읽으므로, 목록이 오면 콤보박스를 채움
+        self.catalog.listed.connect(self.load_wordbooks_into_combobox)
+
         self.media_player = QMediaPlayer(None, QMediaPlayer.StreamPlayback)
         self.is_playing = False
 
@@ -194,20 +201,63 @@ class RadioPage(QWidget):
 
     def load_wordbooks_into_combobox(self):
         """
-        wordbook_manager.load_wordbooks_with_script_audio 로드 ->
-        self.all_data_map 에 저장 -> 콤보박스에 제목 추가
+        카탈로그의 단어장 목록 -> 콤보박스에 제목 추가 (항목 데이터는 단어장 id)
+        (목록을 아직 받지 못했으면 불러오는 중이라는 안내만 보여주고, listed 시그널 때 다시 호출됨)
         """
-        words_dir = os.path.join(os.path.dirname(__file__), "words")
-        self.all_data_map = load_wordbooks_with_script_audio(words_dir)
+        self.catalog.load_async()
+        self.wordbook_combo.blockSignals(True)
         self.wordbook_combo.clear()
+        for record in self.catalog.records():
+            self.wordbook_combo.addItem(record.title, record.id)
+        self.wordbook_combo.blockSignals(False)
+        self.update_combobox_state()
+        if self.wordbook_combo.isEnabled():
+            self.on_wordbook_selected(self.wordbook_combo.currentIndex())
+
+    def update_combobox_state(self):
+        """단어장이 하나도 없으면 안내 문구를 보여주고 콤보박스를 비활성화"""
+        has_wordbooks = len(self.catalog) > 0
+        placeholder_idx = self.wordbook_combo.findData(None)
+        placeholder = "불러온 단어장이 없습니다." if self.catalog.is_loaded else "단어장을 불러오는 중..."
+        if not has_wordbooks and placeholder_idx < 0:
+            self.wordbook_combo.addItem(placeholder)
+        elif not has_wordbooks:
+            self.wordbook_combo.setItemText(placeholder_idx, placeholder)
+        elif placeholder_idx >= 0:
+            self.wordbook_combo.removeItem(placeholder_idx)
+        self.wordbook_combo.setEnabled(has_wordbooks)
+
+    # 카탈로그 변경 -> 해당 항목만 갱신
+    def on_catalog_added(self, wordbook_id):
+        record = self.catalog.get(wordbook_id)
+        if record is not None:
+            self.wordbook_combo.addItem(record.title, wordbook_id)
+            self.update_combobox_state()
+
+    def on_catalog_changed(self, wordbook_id):
+        idx = self.wordbook_combo.findData(wordbook_id)
+        record = self.catalog.get(wordbook_id)
+        if idx < 0 or record is None:
+            return
+        self.wordbook_combo.setItemText(idx, record.title)
+        if idx == self.wordbook_combo.currentIndex():
+            self.on_wordbook_selected(idx)
 
-        if not self.all_data_map:
-            self.wordbook_combo.addItem("불러온 단어장이 없습니다.")
-            self.wordbook_combo.setEnabled(False)
-        else:
-            self.wordbook_combo.setEnabled(True)
-            for title in self.all_data_map.keys():
-                self.wordbook_combo.addItem(title)
+    def on_catalog_loaded(self, wordbook_id):
+        # 선택해 둔 단어장의 단어가 백그라운드 로딩으로 도착함 -> 테이블 표시
+        if wordbook_id == self.wordbook_combo.currentData():
+            self.on_wordbook_selected(self.wordbook_combo.currentIndex())
+
+    def on_catalog_removed(self, wordbook_id):
+        idx = self.wordbook_combo.findData(wordbook_id)
+        if idx >= 0:
+            self.wordbook_combo.removeItem(idx)
+        self.update_combobox_state()
+
+    def current_record(self):
+        """콤보박스에서 선택된 단어장 (WordbookRecord, 없으면 None)"""
+        wordbook_id = self.wordbook_combo.currentData()
+        return self.catalog.get(wordbook_id) if wordbook_id is not None else None
 
     def on_wordbook_selected(self, idx):
         """
@@ -215,13 +265,15 @@ class RadioPage(QWidget):
         """
         if idx < 0:
             return
-        title = self.wordbook_combo.currentText().strip()
-        if title not in self.all_data_map:
+        record = self.current_record()
+        if record is None:
             return
+        if not record.is_loaded:
+            # 아직 읽지 않은 단어장 -> 먼저 읽도록 부탁 (도착하면 on_catalog_loaded에서 다시 표시)
+            self.catalog.prioritize(record.id)
 
-        info = self.all_data_map[title]
         # 1) 테이블 표시
-        words = info["words"]
+        words = record.words or []
         self.word_table.setRowCount(len(words))
         for i, w in enumerate(words):
             self.word_table.setItem(i, 0, QTableWidgetItem(w.get('word', '')))
@@ -244,13 +296,13 @@ class RadioPage(QWidget):
         self.media_player.setMedia(QMediaContent())
 
         # script.txt 존재 시 -> 파싱
-        txt_path = info.get('script_text_path')
+        txt_path = record.script_text_path
         if txt_path and os.path.exists(txt_path):
             self.parsed_script_lines = self.parse_script_file(txt_path)
             self.update_script_text_display()
 
         # 음성 존재 시 -> 미디어 로드
-        audio_path = info.get('script_audio_path')
+        audio_path = record.script_audio_path
         if audio_path and os.path.exists(audio_path):
             self.media_player.setMedia(QMediaContent(QUrl.fromLocalFile(audio_path)))
 
@@ -291,13 +343,17 @@ class RadioPage(QWidget):
         GPT -> 대본 생성 -> script.txt -> (영문 +만) TTS -> script.wav
         -> UI 반영
         """
-        title = self.wordbook_combo.currentText().strip()
-        if title not in self.all_data_map:
+        record = self.current_record()
+        if record is None:
             QMessageBox.warning(self, "오류", "잘못된 단어장 선택")
             return
 
-        info = self.all_data_map[title]
-        words = info["words"]
+        wordbook_id = record.id
+        if not record.is_loaded:
+            self.catalog.prioritize(wordbook_id)
+            QMessageBox.warning(self, "오류", "단어장을 아직 불러오는 중입니다.")
+            return
+        words = record.words
         if not words:
             QMessageBox.warning(self, "오류", "단어 목록이 없습니다.")
             return
@@ -310,7 +366,7 @@ class RadioPage(QWidget):
         # GPT에 넘길 단어 리스트
         word_list = [w['word'] for w in words if w.get('word')]
 
-        folder = os.path.dirname(info["wordbook_path"])
+        folder = os.path.dirname(record.path)
         script_txt = os.path.join(folder, "script.txt")
         script_wav = os.path.join(folder, "script.wav")
         temp_mp3 = os.path.join(folder, "script_temp.mp3")
@@ -334,15 +390,9 @@ class RadioPage(QWidget):
                 seg.export(script_wav, format="wav")
                 os.remove(temp_mp3)
 
-                # all_data_map에 저장
-                info["script_text_path"] = script_txt
-                info["script_audio_path"] = script_wav
-
                 def ui_up():
-                    if self.wordbook_combo.currentText().strip() == title:
-                        self.parsed_script_lines = lines
-                        self.update_script_text_display()
-                        self.media_player.setMedia(QMediaContent(QUrl.fromLocalFile(script_wav)))
+                    # 카탈로그에 반영 (현재 선택된 단어장이면 wordbook_changed -> 화면 갱신)
+                    self.catalog.update_scripts(wordbook_id, script_txt, script_wav, changed=True)
 
                 self.call_in_main_thread(ui_up)
 
@@ -425,13 +475,7 @@ class RadioPage(QWidget):
             self.word_table.setVisible(True)
             self.toggle_table_button.setText("단어 가리기")
 
-    # 대본/오디오 재로딩
+    # 대본/오디오 재로딩 (보통은 LibraryWatcher가 자동 반영, 감시가 안 되는 환경을 위한 수동 버튼)
     def on_reload(self):
-        idx = self.wordbook_combo.currentIndex()
-        words_dir = os.path.join(os.path.dirname(__file__), "words")
-        self.all_data_map = load_wordbooks_with_script_audio(words_dir)
-        # 다시 콤보박스 선택 로직 수행
-        if idx >= 0:
-            self.on_wordbook_selected(idx)
-        self.update()
-        self.repaint()
+        # 바뀐 폴더만 다시 읽음 -> 바뀐 단어장은 카탈로그 시그널로 갱신됨
+        self.catalog.refresh()
@@ -0,0 +1,435 @@
+import os
+import re
+import math
+import heapq
+import pickle
+import threading
+from array import array
+from bisect import bisect_left
+
+from PyQt5.QtCore import QObject, QTimer
+
+from sliced_work import SlicedWorkQueue
+
+SEARCH_INDEX_FILENAME = ".search_index.pickle"
+SEARCH_INDEX_VERSION = 1
+
+# 필드 번호와 점수 가중치
+FIELD_WORD, FIELD_MEANING, FIELD_EXAMPLE = 0, 1, 2
+FIELD_WEIGHTS = (3.0, 2.0, 1.0)
+
+# 단어 키 = 단어장 번호 << ENTRY_BITS | 단어 인덱스
+ENTRY_BITS = 30
+ENTRY_MASK = (1 << ENTRY_BITS) - 1
+
+TOKEN_RE = re.compile(r"[0-9a-z]+|[가-힣]+")
+HANGUL_FIRST = "가"
+
+
+def tokenize(text):
+    """
+    검색용 토큰 생성.
+    - 영어/숫자: 소문자 단어 단위 ("Take off!" -> "take", "off")
+    - 한글: 글자 2-gram ("사과나무" -> "사과", "과나", "나무"), 한 글자짜리는 그대로
+    """
+    for match in TOKEN_RE.finditer(text.lower()):
+        token = match.group()
+        if token[0] >= HANGUL_FIRST and len(token) > 1:
+            for i in range(len(token) - 1):
+                yield token[i:i + 2]
+        else:
+            yield token
+
+
+class SearchIndex:
+    """
+    라이브러리 전체(단어, 뜻, 예문)에 대한 역색인.
+
+    postings[토큰] = [단어 필드, 뜻 필드, 예문 필드] 별로 정렬된 array('Q') 단어 키 목록.
+        단어 키 = 단어장 번호 << 30 | 단어 인덱스
+    단어장 번호는 추가할 때마다 커지고 단어는 순서대로 넣으므로, 배열은 append만으로 정렬 상태가 유지됩니다.
+
+    검색은 가장 드문 토큰의 포스팅을 필드 가중치가 높은 순(단어 -> 뜻 -> 예문)으로 훑으며,
+    나머지 토큰은 후보마다 bisect로 확인합니다.
+    이미 찾은 결과가 남은 필드에서 나올 수 있는 최고 점수 이상으로 limit개 모이면 바로 멈추므로,
+    "the", "입니다"처럼 흔한 토큰도 포스팅 전체를 훑지 않습니다.
+
+    단어장을 지우거나 다시 색인하면 기존 번호는 dead로 표시만 하고(검색 시 걸러냄),
+    dead가 많아지면 compact()로 한꺼번에 정리합니다.
+    """
+    def __init__(self):
+        self.books = {}      # {book_no: (key, signature, 단어 수)}
+        self.postings = {}   # {토큰: [array('Q'), array('Q'), array('Q')]}
+        self.dead = set()    # 삭제/교체된 단어장 번호
+        self.next_book = 1
+        self._bigrams_by_char = None  # {한글 한 글자: [그 글자가 들어간 2-gram 토큰, ...]} (필요할 때 생성)
+
+    # =====================
+    #   색인
+    # =====================
+    def add_book(self, key, words, signature=None):
+        """단어 목록을 색인하고 새 단어장 번호를 반환합니다."""
+        book_no = self.new_book()
+        for _ in self.iter_index_book(book_no, key, words, signature):
+            pass
+        return book_no
+
+    def new_book(self):
+        """새 단어장 번호 (이 번호로 iter_index_book을 끝까지 실행해야 검색 대상이 됨)"""
+        book_no = self.next_book
+        self.next_book += 1
+        return book_no
+
+    def iter_index_book(self, book_no, key, words, signature=None, step=500):
+        """
+        단어 목록을 색인하면서 step개마다 yield 하는 generator. (SlicedWorkQueue로 나눠서 실행)
+        끝까지 실행한 뒤에야 books에 등록되므로, 중간에 멈춘 단어장은 remove_book으로 정리합니다.
+        """
+        postings = self.postings
+        base = book_no << ENTRY_BITS
+        for entry_index, entry in enumerate(words):
+            entry_key = base | entry_index
+            for field, text in ((FIELD_WORD, entry.word), (FIELD_MEANING, entry.meaning),
+                                (FIELD_EXAMPLE, entry.example_body)):
+                if not text:
+                    continue
+                for token in set(tokenize(text)):
+                    fields = postings.get(token)
+                    if fields is None:
+                        fields = postings[token] = [array('Q'), array('Q'), array('Q')]
+                        self._bigrams_by_char = None
+                    fields[field].append(entry_key)
+            if entry_index % step == step - 1:
+                yield
+        self.books[book_no] = (key, signature, len(words))
+
+    def remove_book(self, book_no):
+        """단어장을 검색 대상에서 뺍니다. (색인 중이던 단어장의 일부 포스팅도 함께 정리됨)"""
+        self.books.pop(book_no, None)
+        self.dead.add(book_no)
+        if len(self.dead) > max(16, len(self.books)):
+            self.compact()
+
+    def compact(self):
+        """dead 단어장의 포스팅을 실제로 지웁니다."""
+        if not self.dead:
+            return
+        dead = self.dead
+        compacted = {}
+        for token, fields in self.postings.items():
+            kept = [array('Q', (k for k in arr if (k >> ENTRY_BITS) not in dead)) for arr in fields]
+            if any(kept):
+                compacted[token] = kept
+        self.postings = compacted
+        self.dead = set()
+        self._bigrams_by_char = None
+
+    # =====================
+    #   검색
+    # =====================
+    def _postings_for(self, token):
+        """
+        토큰의 필드별 포스팅을 [[array, ...], [array, ...], [array, ...]] 형태로 반환합니다. (없으면 None)
+        한 글자 한글은 그 글자가 들어간 2-gram 포스팅들을 합치지 않고 그대로 모아서 넘깁니다. (검색 시 lazy merge)
+        """
+        fields = self.postings.get(token)
+        if len(token) == 1 and token >= HANGUL_FIRST:
+            if self._bigrams_by_char is None:
+                by_char = {}
+                for t in self.postings:
+                    if len(t) == 2 and t[0] >= HANGUL_FIRST:
+                        by_char.setdefault(t[0], []).append(t)
+                        if t[1] != t[0]:
+                            by_char.setdefault(t[1], []).append(t)
+                self._bigrams_by_char = by_char
+            parts = [self.postings[t] for t in self._bigrams_by_char.get(token, ())]
+            if fields is not None:
+                parts.append(fields)
+            if not parts:
+                return None
+            return [[f[i] for f in parts if f[i]] for i in range(3)]
+        if fields is None:
+            return None
+        return [[arr] if arr else [] for arr in fields]
+
+    @staticmethod
+    def _iter_keys(parts):
+        """정렬된 배열 여러 개를 키 순서대로 (중복 없이) 훑기"""
+        if len(parts) == 1:
+            return iter(parts[0])
+        previous = [None]
+
+        def unique(keys):
+            for key in keys:
+                if key != previous[0]:
+                    previous[0] = key
+                    yield key
+        return unique(heapq.merge(*parts))
+
+    @staticmethod
+    def _best_field_weight(fields, entry_key):
+        """entry_key가 들어 있는 필드 중 가장 높은 가중치 (없으면 0)"""
+        for field, parts in enumerate(fields):
+            for arr in parts:
+                pos = bisect_left(arr, entry_key)
+                if pos < len(arr) and arr[pos] == entry_key:
+                    return FIELD_WEIGHTS[field]
+        return 0
+
+    def search(self, query, limit=50):
+        """
+        query의 모든 토큰이 (어느 필드에든) 들어 있는 단어를 점수순으로 반환합니다.
+        점수 = 토큰마다 idf * (그 토큰이 나온 가장 좋은 필드의 가중치)의 합, 같으면 먼저 색인된 단어가 앞.
+        Returns: [(book_no, entry_index, score), ...]
+        """
+        tokens = set(tokenize(query))
+        if not tokens:
+            return []
+
+        terms = []
+        for token in tokens:
+            fields = self._postings_for(token)
+            size = sum(len(arr) for parts in fields for arr in parts) if fields else 0
+            if not size:
+                return []
+            terms.append((size, fields))
+        terms.sort(key=lambda term: term[0])
+
+        total = sum(count for _, _, count in self.books.values()) or 1
+        weighted = []
+        for size, fields in terms:
+            idf = math.log(1 + total / size)
+            max_weight = next(FIELD_WEIGHTS[i] for i, parts in enumerate(fields) if parts)
+            weighted.append((idf, max_weight, fields))
+
+        first_idf, _, first_fields = weighted[0]
+        others = weighted[1:]
+        others_bound = sum(idf * max_weight for idf, max_weight, _ in others)
+        dead = self.dead
+        best_field_weight = self._best_field_weight
+        scores = {}
+
+        for field, parts in enumerate(first_fields):
+            if not parts:
+                continue
+            # 이 필드(와 그 뒤 필드)에서 나올 수 있는 최고 점수
+            tier_bound = first_idf * FIELD_WEIGHTS[field] + others_bound - 1e-9
+            at_bound = sum(1 for score in scores.values() if score >= tier_bound)
+            if at_bound >= limit:
+                break
+            for entry_key in self._iter_keys(parts):
+                if entry_key in scores or (dead and (entry_key >> ENTRY_BITS) in dead):
+                    continue
+                score = first_idf * FIELD_WEIGHTS[field]
+                for idf, _, fields in others:
+                    weight = best_field_weight(fields, entry_key)
+                    if not weight:
+                        break
+                    score += idf * weight
+                else:
+                    scores[entry_key] = score
+                    if score >= tier_bound:
+                        at_bound += 1
+                        if at_bound >= limit:
+                            break
+            else:
+                continue
+            break
+
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(key >> ENTRY_BITS, key & ENTRY_MASK, score) for key, score in top]
+
+    # =====================
+    #   저장/불러오기
+    # =====================
+    def save(self, path):
+        data = {}
+        for _ in self.iter_snapshot(data):
+            pass
+        self.write_snapshot(data, path)
+
+    def iter_snapshot(self, data, step=5000):
+        """
+        저장할 내용을 data(dict)에 채우면서 토큰 step개마다 yield 하는 generator.
+        (화면 스레드에서 나눠서 만들고, 파일 쓰기는 write_snapshot으로 다른 스레드에서)
+        """
+        data.update({
+            "version": SEARCH_INDEX_VERSION,
+            "books": dict(self.books),
+            "dead": set(self.dead),
+            "next_book": self.next_book,
+        })
+        postings = {}
+        for n, (token, fields) in enumerate(list(self.postings.items())):
+            postings[token] = [arr.tobytes() for arr in fields]
+            if n % step == step - 1:
+                yield
+        data["postings"] = postings
+
+    @staticmethod
+    def write_snapshot(data, path):
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"Failed to write search index: {e}")
+
+    @classmethod
+    def load(cls, path):
+        """저장된 색인을 읽습니다. 없거나 버전이 다르면 빈 색인."""
+        index = cls()
+        try:
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+            if data.get("version") != SEARCH_INDEX_VERSION:
+                return index
+            index.books = data["books"]
+            index.dead = data["dead"]
+            index.next_book = data["next_book"]
+            for token, raw_fields in data["postings"].items():
+                fields = []
+                for raw in raw_fields:
+                    arr = array('Q')
+                    arr.frombytes(raw)
+                    fields.append(arr)
+                index.postings[token] = fields
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Search index ignored ({path}): {e}")
+            index = cls()
+        return index
+
+
+class LibrarySearchIndex(QObject):
+    """
+    WordbookCatalog와 SearchIndex를 이어주는 객체.
+
+    - 카탈로그를 처음 읽으면 저장된 색인(words/.search_index.pickle)과 비교해서 바뀐 단어장만 다시 색인
+    - 단어장 추가/저장/삭제 시그널을 받아 그 단어장만 다시 색인
+      (큰 단어장은 SlicedWorkQueue로 나눠서 색인하므로 가져오기 직후에도 화면이 멈추지 않음)
+    - 변경이 있으면 잠시 후(SAVE_DELAY_MS) 한 번에 디스크에 저장 (파일 쓰기는 작업 스레드에서)
+    """
+    SAVE_DELAY_MS = 2000
+
+    def __init__(self, catalog, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.index_path = os.path.join(catalog.directory, SEARCH_INDEX_FILENAME)
+        self.index = SearchIndex.load(self.index_path)
+        self.books_by_record = {}   # {record_id: (book_no, 색인한 words 객체)}
+        self.records_by_book = {}   # {book_no: record_id}
+        self.updates = SlicedWorkQueue(self)
+
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(self.SAVE_DELAY_MS)
+        self.save_timer.timeout.connect(self.save)
+
+        catalog.reloaded.connect(self.sync_all)
+        catalog.wordbook_added.connect(self.index_record)
+        catalog.wordbook_changed.connect(self.index_record)
+        catalog.wordbook_removed.connect(self.remove_record)
+        if catalog.is_loaded:
+            self.sync_all()
+
+    def key_for(self, record):
+        return os.path.relpath(os.path.abspath(record.path), os.path.abspath(self.catalog.directory))
+
+    @staticmethod
+    def signature_for(record):
+        """저장된 색인을 재사용해도 되는지 판단하는 값 (파일 mtime, 크기, 단어 수)"""
+        try:
+            st = os.stat(record.path)
+            return st.st_mtime_ns, st.st_size, record.count
+        except OSError:
+            return None, None, record.count
+
+    def sync_all(self):
+        """카탈로그 전체와 색인을 맞춥니다. (저장된 색인 중 그대로인 단어장은 재사용)"""
+        # 색인 중이던 단어장은 버림 (끝나지 않은 포스팅 정리)
+        self.updates.clear()
+        for book_no, _ in self.books_by_record.values():
+            if book_no not in self.index.books:
+                self.index.remove_book(book_no)
+        saved = {(key, signature): book_no for book_no, (key, signature, _) in self.index.books.items()}
+        used = set()
+        self.books_by_record.clear()
+        self.records_by_book.clear()
+        changed = False
+        for record in self.catalog.records():
+            if record.words is None:
+                continue  # 아직 불러오는 중 (다 불러오면 reloaded로 다시 맞춤)
+            key = self.key_for(record)
+            signature = self.signature_for(record)
+            book_no = saved.get((key, signature))
+            if book_no is None or book_no in used:
+                # 바뀐 단어장은 단어장마다 나눠서 이벤트 루프 사이사이에 색인 (다시 읽은 직후 화면이 멈추지 않도록)
+                book_no = self.index.new_book()
+                self.updates.submit(record.id, self.index.iter_index_book(book_no, key, record.words, signature),
+                                    defer=True)
+                changed = True
+            used.add(book_no)
+            self.books_by_record[record.id] = (book_no, record.words)
+            self.records_by_book[book_no] = record.id
+        for book_no in list(self.index.books):
+            if book_no not in used:
+                self.index.remove_book(book_no)
+                changed = True
+        if changed:
+            self.save_timer.start()
+
+    def index_record(self, record_id):
+        record = self.catalog.get(record_id)
+        if record is None:
+            return
+        current = self.books_by_record.get(record_id)
+        key = self.key_for(record)
+        if current is not None:
+            book_no, words = current
+            if words is record.words and self.index.books.get(book_no, (None,))[0] == key:
+                return  # 제목/대본만 바뀜
+            self.updates.cancel(record_id)
+            self.index.remove_book(book_no)
+            self.records_by_book.pop(book_no, None)
+        book_no = self.index.new_book()
+        self.books_by_record[record_id] = (book_no, record.words)
+        self.records_by_book[book_no] = record_id
+        self.updates.submit(record_id, self.index.iter_index_book(book_no, key, record.words,
+                                                                  self.signature_for(record)))
+        self.save_timer.start()
+
+    def remove_record(self, record_id):
+        current = self.books_by_record.pop(record_id, None)
+        if current is not None:
+            self.updates.cancel(record_id)
+            self.index.remove_book(current[0])
+            self.records_by_book.pop(current[0], None)
+            self.save_timer.start()
+
+    def search(self, query, limit=50):
+        """
+        Returns: [(record, entry_index, WordEntry), ...] 점수순
+        """
+        results = []
+        for book_no, entry_index, _ in self.index.search(query, limit):
+            record = self.catalog.get(self.records_by_book.get(book_no))
+            if record is not None and entry_index < record.count:
+                results.append((record, entry_index, record.words[entry_index]))
+        return results
+
+    def save(self):
+        if self.updates.is_busy():
+            # 색인이 끝난 뒤에 저장 (반쯤 색인된 단어장이 저장되지 않도록)
+            self.save_timer.start()
+            return
+        self.save_timer.stop()
+        data = {}
+        self.updates.submit("save", self._iter_save(data))
+
+    def _iter_save(self, data):
+        # 스냅샷은 나눠서 만들고(색인 작업과 같은 큐라 중간에 바뀌지 않음), pickle 쓰기는 작업 스레드에서
+        yield from self.index.iter_snapshot(data)
+        threading.Thread(target=SearchIndex.write_snapshot, args=(data, self.index_path), daemon=True).start()
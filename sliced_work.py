@@ -0,0 +1,82 @@
+import time
+from collections import deque
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+SLICE_MS = 15  # 이벤트 루프 한 틱에 쓸 최대 시간
+
+
+class SlicedWorkQueue(QObject):
+    """
+    화면 스레드에서 오래 걸리는 작업(큰 단어장 색인 등)을 잘게 나눠 이벤트 루프 사이사이에 실행하는 큐.
+
+    작업은 generator로 넘기고, 작업은 적당한 간격(단어 수백 개)마다 yield 합니다.
+    yield 할 때마다 시간을 확인해서 slice_ms가 지나면 나머지는 다음 타이머 틱으로 미룹니다.
+    큐가 비어 있을 때 넣은 작업은 그 자리에서 바로 시작하므로, 작은 단어장은 예전처럼 즉시 반영됩니다.
+    작업은 넣은 순서대로 하나씩 끝까지 실행합니다. (색인 배열이 추가 순서대로 정렬된 상태를 유지하도록)
+    """
+    idle = pyqtSignal()  # 남은 작업이 모두 끝남
+
+    def __init__(self, parent=None, slice_ms=SLICE_MS):
+        super().__init__(parent)
+        self.slice_seconds = slice_ms / 1000
+        self.jobs = deque()   # [(key, generator), ...]
+        self.timer = QTimer(self)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.run)
+
+    def submit(self, key, job, defer=False):
+        """
+        job(generator)을 큐에 넣습니다. key는 cancel용 (보통 record_id)
+        defer=True면 큐가 비어 있어도 바로 시작하지 않고 다음 타이머 틱부터 실행합니다.
+        (라이브러리 전체처럼 작업을 한꺼번에 많이 넣을 때, 앞의 작업이 금방 끝나 전부 그 자리에서 실행되지 않도록)
+        """
+        self.jobs.append((key, job))
+        if defer:
+            if not self.timer.isActive():
+                self.timer.start()
+        elif len(self.jobs) == 1:
+            self.run()
+
+    def cancel(self, key):
+        """key로 넣은 작업 중 아직 끝나지 않은 것을 버립니다."""
+        if not any(k == key for k, _ in self.jobs):
+            return
+        kept = deque()
+        for k, job in self.jobs:
+            if k == key:
+                job.close()
+            else:
+                kept.append((k, job))
+        self.jobs = kept
+        if not self.jobs:
+            self.timer.stop()
+
+    def clear(self):
+        for _, job in self.jobs:
+            job.close()
+        self.jobs.clear()
+        self.timer.stop()
+
+    def is_busy(self):
+        return bool(self.jobs)
+
+    def run(self):
+        deadline = time.perf_counter() + self.slice_seconds
+        while self.jobs:
+            _, job = self.jobs[0]
+            finished = True
+            for _ in job:
+                if time.perf_counter() >= deadline:
+                    finished = False
+                    break
+            if not finished:
+                self.timer.start()
+                return
+            self.jobs.popleft()
+            if self.jobs and time.perf_counter() >= deadline:
+                # 작은 작업이 많이 쌓여 있어도(라이브러리 전체 색인) 한 틱에는 slice_ms만큼만
+                self.timer.start()
+                return
+        self.timer.stop()
+        self.idle.emit()
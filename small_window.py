@@ -2,23 +2,59 @@ import os
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QGridLayout, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QSizePolicy
 )
-from PyQt5.QtGui import QIcon, QFontMetrics
+from PyQt5.QtGui import QIcon
 from PyQt5.QtCore import Qt, QSize, QTimer, pyqtSignal
 
 # 위치, 효과, TTS 관련 유틸 (사용자 환경에 맞게 import 경로 수정)
 from window_position import move_to_bottom_left
 from effects import apply_shadow_effect
-from tts_utils import play_tts_in_background  # TTS 함수 import
+from audio_sequencer import AudioSequencer, CLIP_GAP_MS  # 카드 음성 이어서 재생
+from study_scheduler import StudyScheduler
+from card_render import CardRenderCache
+from tts_prefetch import TTSPrefetcher, PREFETCH_DEPTH
+from study_log import (
+    SESSION_START, SESSION_STOP, CARD_SHOWN, AUDIO_PLAYED, CARD_SKIPPED, CARD_KNEW, CARD_MISSED, NAV_NEXT, NAV_PREV
+)
+
+HISTORY_LIMIT = 200        # '이전 단어'로 돌아갈 수 있는 최대 단어 수
+SCHEDULE_SAVE_DELAY = 5000  # 채점 후 학습 기록을 저장하기까지 기다리는 시간(ms), 연속 채점은 한 번에 저장
+ADVANCE_GAP_MS = 1500       # 자동 넘어가기: 카드 음성이 모두 끝나고 다음 단어로 넘어가기까지의 간격
 
 class SmallWindow(QMainWindow):
     open_main_window_signal = pyqtSignal()  # 메인 창 열기 요청 신호
 
-    def __init__(self, fonts):
+    def __init__(self, fonts, schedule_store=None, prefetch_depth=PREFETCH_DEPTH,
+                 clip_gap_ms=CLIP_GAP_MS, advance_gap_ms=ADVANCE_GAP_MS, study_log=None):
         super().__init__()
         self.fonts = fonts
         self.word_list = []  # 초기 단어장은 비어 있음
         self.current_index = 0
 
+        # 간격 반복 학습 (다음 단어는 스케줄러가 고름, 기록은 단어장별로 schedule_store에 저장)
+        self.schedule_store = schedule_store
+        self.wordbook_path = None
+        self.scheduler = None
+        self.history = []         # 보여준 단어 인덱스 ('이전 단어'용)
+        self.history_pos = -1
+        self.pending_index = None  # 스케줄러에서 꺼낸 뒤 아직 채점/넘기기로 대기열에 돌려놓지 않은 단어
+
+        # 학습 기록 (StudyLog, 단어장을 열고 닫을 때까지가 세션 하나)
+        self.study_log = study_log
+        self.session_book = None
+        self.in_session = False
+
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(SCHEDULE_SAVE_DELAY)
+        self.save_timer.timeout.connect(self.save_schedule)
+
+        # 카드별 표시값(단어/뜻 HTML, 예문, 창 너비) 캐시 -> 다시 보는 단어는 문자열/글꼴 너비를 다시 계산하지 않음
+        self.render_cache = CardRenderCache()
+
+        # 다음에 보여줄 카드 prefetch_depth개의 음성을 미리 받아둠 (카드가 바뀌면 바로 재생되도록)
+        self.prefetch_depth = prefetch_depth
+        self.tts_prefetcher = TTSPrefetcher()
+
         self.is_dragging = False
         self.offset = None
 
@@ -34,13 +70,23 @@ class SmallWindow(QMainWindow):
         # 자동 넘어가기 활성/비활성 상태 (True: 자동 넘어가기 O, False: 없음)
         self.is_auto_on = True
 
-        # 자동 다음 단어 간격: 예문 TTS 활성 시 14000ms, 비활성 시 7000ms
-        self.auto_interval = 14000 if self.is_example_tts_on else 7000
+        # 자동 다음 단어 간격
+        # - TTS를 켰을 때: 카드 음성(단어 -> 뜻 -> 예문)이 모두 끝나고 advance_gap_ms 뒤
+        # - TTS를 껐을 때: 단어를 보여주고 auto_interval 뒤
+        self.advance_gap_ms = advance_gap_ms
+        self.auto_interval = 7000
 
-        # 타이머: 지정된 간격마다 다음 단어로 넘어감
+        # 타이머: 위 간격이 지나면 다음 단어로 넘어감 (단어를 보여줄 때마다 다시 시작)
         self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.auto_next_word)
 
+        # 카드 음성을 실제 길이대로 이어서 재생 (단어를 옮기면 남은 음성은 바로 취소)
+        self.audio = AudioSequencer(clip_gap_ms, self)
+        self.audio.finished.connect(self.on_audio_finished)
+        self.audio.clip_started.connect(
+            lambda text, lang: self.log_event(AUDIO_PLAYED, w=text, l=lang))
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -169,11 +215,31 @@ class SmallWindow(QMainWindow):
         next_button.clicked.connect(self.show_next_word)
         layout.addWidget(next_button, 1, 5, Qt.AlignRight | Qt.AlignVCenter)
 
+        # -----------------------------
+        # 11. 알았음/몰랐음 버튼 (간격 반복 채점)
+        grade_layout = QHBoxLayout()
+        grade_style = ("QPushButton { color: #fff; background-color: %s; border: none; border-radius: 4px;"
+                       " font-size: 12px; padding: 2px 10px; }")
+        self.missed_button = QPushButton("몰랐음", self)
+        self.missed_button.setStyleSheet(grade_style % "#e97a45")
+        self.missed_button.setToolTip("곧 다시 보여줍니다")
+        self.missed_button.clicked.connect(lambda: self.grade_current_word(False))
+        self.knew_button = QPushButton("알았음", self)
+        self.knew_button.setStyleSheet(grade_style % "#45b1e9")
+        self.knew_button.setToolTip("복습할 때가 될 때까지 보여주지 않습니다")
+        self.knew_button.clicked.connect(lambda: self.grade_current_word(True))
+        grade_layout.addStretch()
+        grade_layout.addWidget(self.missed_button)
+        grade_layout.addWidget(self.knew_button)
+        grade_layout.addStretch()
+        layout.addLayout(grade_layout, 3, 1, 1, 4, Qt.AlignCenter)
+
         # -----------------------------
         # 레이아웃 행/열 크기 조정
         layout.setRowStretch(0, 1)
         layout.setRowStretch(1, 3)
         layout.setRowStretch(2, 1)
+        layout.setRowStretch(3, 1)
 
         # 0~5열 사용
         layout.setColumnStretch(0, 1)
@@ -185,16 +251,28 @@ class SmallWindow(QMainWindow):
 
         self.setCentralWidget(container)
 
-    def set_word_list(self, word_list):
-        """단어장을 설정하고 초기 상태로 업데이트"""
+    def set_word_list(self, word_list, wordbook_path=None):
+        """
+        단어장을 설정하고 초기 상태로 업데이트
+        wordbook_path가 있으면 그 단어장의 학습 기록을 불러와 복습할 때가 된 단어부터 보여줍니다.
+        """
+        self.save_schedule()
+        self.end_session()
         self.word_list = word_list
+        self.wordbook_path = wordbook_path
+        self.start_session()
+        states = None
+        if self.schedule_store is not None and wordbook_path is not None:
+            states = self.schedule_store.load(wordbook_path)
+        self.scheduler = StudyScheduler(word_list, states)
+        self.history = []
+        self.history_pos = -1
+        self.pending_index = None
+        self.render_cache.clear()
         self.current_index = 0
+        self.draw_next_word()
         self.update_word_display()
 
-        # auto_next가 켜져 있으면 타이머 시작 (설정된 인터벌 사용)
-        if self.is_auto_on:
-            self.timer.start(self.auto_interval)
-
     # =====================
     #   토글 메서드들
     # =====================
@@ -205,7 +283,7 @@ class SmallWindow(QMainWindow):
             self.toggle_example_button.setIcon(QIcon("assets/hide_example.png"))
         else:
             self.toggle_example_button.setIcon(QIcon("assets/show_example.png"))
-        self.update_word_display()
+        self.update_word_display(play_audio=False)
 
     def toggle_tts_sound(self):
         """단어/뜻 TTS 재생 여부 토글"""
@@ -214,80 +292,164 @@ class SmallWindow(QMainWindow):
             self.sound_toggle_button.setIcon(QIcon("assets/sound_activate_btn.png"))
         else:
             self.sound_toggle_button.setIcon(QIcon("assets/sound_mute_btn.png"))
+            self.audio.cancel()
+            self.tts_prefetcher.cancel()
+        self.restart_auto_timer()
 
     def toggle_example_tts(self):
-        """예문 TTS 재생 여부 토글 및 자동 다음 간격 조정"""
+        """예문 TTS 재생 여부 토글 (다음 단어부터 적용, 자동 넘어가기는 음성이 끝나는 시점에 맞춰짐)"""
         self.is_example_tts_on = not self.is_example_tts_on
         if self.is_example_tts_on:
             self.example_sound_toggle_button.setIcon(QIcon("assets/example_sound_activate_btn.png"))
-            self.auto_interval = 14000
         else:
             self.example_sound_toggle_button.setIcon(QIcon("assets/example_sound_mute_btn.png"))
-            self.auto_interval = 7000
-        # 자동 모드가 켜진 경우 타이머 간격 재설정
-        if self.is_auto_on:
-            self.timer.start(self.auto_interval)
 
     def toggle_auto_next(self):
         """자동 넘어가기 여부 토글"""
         self.is_auto_on = not self.is_auto_on
         if self.is_auto_on:
             self.auto_toggle_button.setIcon(QIcon("assets/auto_activate_btn.png"))
-            self.timer.start(self.auto_interval)
         else:
             self.auto_toggle_button.setIcon(QIcon("assets/auto_deactivate_btn.png"))
+        self.restart_auto_timer()
+
+    def restart_auto_timer(self):
+        """
+        자동 넘어가기 타이머를 지금 상태에 맞게 다시 시작
+        음성을 재생 중이면 타이머를 멈추고 기다림 (음성이 끝나면 on_audio_finished에서 시작)
+        """
+        if not self.is_auto_on or not self.word_list:
+            self.timer.stop()
+        elif self.is_tts_on and self.audio.is_active():
             self.timer.stop()
+        elif self.is_tts_on:
+            self.timer.start(self.advance_gap_ms)
+        else:
+            self.timer.start(self.auto_interval)
+
+    def on_audio_finished(self):
+        """카드 음성이 모두 끝남 -> advance_gap_ms 뒤에 다음 단어로"""
+        if self.is_auto_on:
+            self.timer.start(self.advance_gap_ms)
 
     # =====================
     #   단어 이동 메서드들
     # =====================
+    def draw_next_word(self):
+        """
+        다음 단어로 이동합니다. '이전 단어'로 돌아가 있으면 보여줬던 순서대로 다시 앞으로,
+        아니면 스케줄러에서 다음 단어를 꺼냅니다. (채점하지 않고 넘긴 단어는 대기열 뒤로)
+        """
+        if self.history_pos < len(self.history) - 1:
+            self.history_pos += 1
+            self.current_index = self.history[self.history_pos]
+            return
+        self.release_pending_word()
+        index = self.scheduler.next_card()
+        if index is None:
+            return
+        self.history.append(index)
+        if len(self.history) > HISTORY_LIMIT:
+            del self.history[0]
+        self.history_pos = len(self.history) - 1
+        self.current_index = index
+        self.pending_index = index
+
+    def upcoming_indices(self, count):
+        """앞으로 보여줄 단어 인덱스 최대 count개 ('이전 단어'로 돌아가 있으면 보여줬던 순서부터, 그다음은 스케줄러 순서)"""
+        upcoming = self.history[self.history_pos + 1:self.history_pos + 1 + count]
+        if len(upcoming) < count:
+            upcoming.extend(self.scheduler.upcoming(count - len(upcoming)))
+        return upcoming
+
+    def release_pending_word(self):
+        """꺼내놓고 채점하지 않은 단어를 스케줄러 대기열로 돌려놓음"""
+        if self.pending_index is not None:
+            self.log_event(CARD_SKIPPED, w=self.word_list[self.pending_index].word)
+            self.scheduler.skip(self.pending_index)
+            self.pending_index = None
+
+    def grade_current_word(self, knew):
+        """현재 단어를 채점(알았음/몰랐음)하고 다음 단어로"""
+        if not self.word_list:
+            return
+        self.scheduler.answer(self.current_index, knew)
+        self.log_event(CARD_KNEW if knew else CARD_MISSED,
+                       w=self.word_list[self.current_index].word)
+        if self.pending_index == self.current_index:
+            self.pending_index = None
+        self.save_timer.start()
+        self.draw_next_word()
+        self.update_word_display()
+
+    def save_schedule(self, background=True):
+        """채점한 내용이 있으면 단어장의 학습 기록 파일에 저장 (앱을 끝낼 때는 background=False)"""
+        self.save_timer.stop()
+        if self.scheduler is None or not self.scheduler.dirty:
+            return
+        if self.schedule_store is not None and self.wordbook_path is not None:
+            self.schedule_store.save(self.wordbook_path, self.scheduler.states, background=background)
+        self.scheduler.dirty = False
+
+    # =====================
+    #   학습 기록
+    # =====================
+    def log_event(self, event, **fields):
+        if self.study_log is not None and self.in_session:
+            self.study_log.log(event, self.session_book, **fields)
+
+    def start_session(self):
+        if self.study_log is None or not self.word_list:
+            return
+        self.session_book = self.study_log.book_key(self.wordbook_path)
+        self.in_session = True
+        self.log_event(SESSION_START, n=len(self.word_list))
+
+    def end_session(self):
+        """학습 창을 닫거나 다른 단어장을 열 때, 앱을 끝낼 때 (세션이 없으면 아무것도 안 함)"""
+        if not self.in_session:
+            return
+        self.log_event(SESSION_STOP)
+        self.in_session = False
+
     def auto_next_word(self):
         """설정된 간격마다 다음 단어로 넘어감 (자동 모드 활성 시)"""
         if not self.word_list:
             return
-        if self.current_index < len(self.word_list) - 1:
-            self.current_index += 1
-        else:
-            self.current_index = 0
+        self.draw_next_word()
         self.update_word_display()
 
     def show_prev_word(self):
         if not self.word_list:
             return
-        if self.current_index > 0:
-            self.current_index -= 1
-        else:
-            self.current_index = len(self.word_list) - 1
+        self.log_event(NAV_PREV)
+        if self.history_pos > 0:
+            self.release_pending_word()
+            self.history_pos -= 1
+            self.current_index = self.history[self.history_pos]
         self.update_word_display()
 
-        # 자동 모드가 켜져 있으면 타이머 리셋 (설정된 간격 사용)
-        if self.is_auto_on:
-            self.timer.start(self.auto_interval)
-
     def show_next_word(self):
         if not self.word_list:
             return
-        if self.current_index < len(self.word_list) - 1:
-            self.current_index += 1
-        else:
-            self.current_index = 0
+        self.log_event(NAV_NEXT)
+        self.draw_next_word()
         self.update_word_display()
 
-        # 자동 모드가 켜져 있으면 타이머 리셋
-        if self.is_auto_on:
-            self.timer.start(self.auto_interval)
-
     # =====================
     #   단어 표시 갱신
     # =====================
-    def update_word_display(self):
+    def update_word_display(self, play_audio=True):
         """현재 단어 및 정보 표시 (TTS 재생 포함)
-           - 단어: 즉시 TTS 재생
-           - 뜻: 2000ms 후 TTS 재생
-           - 예문: (예문 TTS가 활성일 경우) 6000ms 후 영어, 9000ms 후 한글 TTS 재생
-           단, 예문은 '-'로 시작하며 '+' 구분자가 있는 경우 처리함.
+           - 단어 -> 뜻 -> (예문 TTS가 활성일 경우) 예문 영어 -> 예문 한글 순으로,
+             앞 음성이 끝나면 바로 다음 음성을 재생 (AudioSequencer, 이전 단어의 남은 음성은 취소)
+           - 자동 넘어가기 타이머는 음성이 모두 끝난 뒤에 시작
+           예문은 파싱할 때 이미 영문/한글로 나뉘어 있음 (WordEntry.example_en / example_ko)
+           play_audio=False면 표시만 다시 함 (예문 표시 토글 등)
         """
         if not self.word_list:
+            self.audio.cancel()
+            self.timer.stop()
             self.word_display.setText("단어장이 설정되지 않았습니다.")
             self.example_display.setText("")
             self.word_info_label.setText("0/0")
@@ -295,76 +457,54 @@ class SmallWindow(QMainWindow):
 
         word_data = self.word_list[self.current_index]
 
-        word = word_data.get('word', "")
-        meaning = word_data.get('meaning', "")
-        example = word_data.get('example', "")
-
-        pretendard_bold = self.fonts.get("Pretendard-Bold.otf", "Arial")
-        pretendard_regular = self.fonts.get("Pretendard-Regular.otf", "Arial")
-
-        # 단어/뜻 표시
-        self.word_display.setText(
-            f"<h2 style='margin: 0; font-family: {pretendard_bold}; font-size: 20px;'>{word}</h2>"
-            f"<p style='margin: 0 0 3px 0; font-family: {pretendard_regular}; font-size: 14px;'>{meaning}</p>"
+        # 단어/뜻 HTML, 예문 텍스트, 창 너비는 카드마다 한 번만 만들어 캐시에서 꺼냄
+        self.render_cache.set_settings(
+            self.is_example_shown,
+            self.fonts.get("Pretendard-Bold.otf", "Arial"),
+            self.fonts.get("Pretendard-Regular.otf", "Arial"),
+            self.example_display.font(),
         )
-
-        # 예문 텍스트 표시 (예문이 '-'로 시작하면 처리)
-        if self.is_example_shown and example.startswith('-'):
-            if '+' in example:
-                parts = example[1:].split('+', 1)  # '-' 제거 후 split
-                if len(parts) == 2:
-                    eng_example = parts[0].strip()
-                    kor_example = parts[1].strip()
-                    example_text = f"{eng_example}\n{kor_example}"
-                else:
-                    example_text = example
-            else:
-                example_text = example
-            self.example_display.setText(example_text)
-        else:
-            self.example_display.setText("")
+        render = self.render_cache.get(self.current_index, word_data)
+        self.word_display.setText(render.html)
+        self.example_display.setText(render.example_text)
 
         # 단어 정보 (현재/총 개수)
         self.word_info_label.setText(f"{self.current_index + 1}/{len(self.word_list)}")
 
         # TTS 재생 (TTS가 활성화 되어 있을 때만)
-        if self.is_tts_on:
-            # 단어 영어 읽기 즉시 실행
-            play_tts_in_background(word, lang='en')
-            # 2000ms 후에 단어 뜻(한글) 읽기
-            QTimer.singleShot(2000, lambda: play_tts_in_background(meaning, lang='ko'))
-
-            # 예문 TTS (예문 TTS가 활성이고, 예문이 '-'로 시작하며 '+' 구분자가 있는 경우)
-            if self.is_example_tts_on and example and example.startswith('-') and '+' in example:
-                parts = example[1:].split('+', 1)
-                if len(parts) == 2:
-                    eng_example = parts[0].strip()
-                    kor_example = parts[1].strip()
-                    # 6000ms 후에 예문 영어 읽기
-                    QTimer.singleShot(6000, lambda: play_tts_in_background(eng_example, lang='en'))
-                    # 9000ms 후에 예문 한글 읽기
-                    QTimer.singleShot(9000, lambda: play_tts_in_background(kor_example, lang='ko'))
+        if play_audio:
+            self.log_event(CARD_SHOWN, w=word_data.word)
+            if self.is_tts_on:
+                self.audio.play(self.card_clips(word_data))
+                # 지금 카드의 나머지 음성과 다음 카드들의 음성을 미리 받아둠
+                self.prefetch_upcoming_audio(word_data)
+            else:
+                self.audio.cancel()
+            self.restart_auto_timer()
 
         # 창 크기 조정
-        self.adjust_window_size()
+        self.adjust_window_size(render.width)
+
+    def card_clips(self, word_data):
+        """카드 하나에서 재생할 음성 [(text, lang), ...] (재생 순서대로)"""
+        clips = [(word_data.word, 'en'), (word_data.meaning, 'ko')]
+        if self.is_example_tts_on and word_data.has_split_example:
+            clips.append((word_data.example_en, 'en'))
+            clips.append((word_data.example_ko, 'ko'))
+        return clips
+
+    def prefetch_upcoming_audio(self, word_data):
+        """지금 카드와 다음 prefetch_depth개 카드의 음성을 작업 스레드에서 미리 받음 (남아 있던 요청은 버림)"""
+        clips = self.card_clips(word_data)
+        for index in self.upcoming_indices(self.prefetch_depth):
+            clips.extend(self.card_clips(self.word_list[index]))
+        self.tts_prefetcher.prefetch(clips)
 
     # =====================
     #   창 크기 조정
     # =====================
-    def adjust_window_size(self):
-        """예문 텍스트 길이에 따라 창의 너비를 조정"""
-        base_width = 330
-        max_width = 370  # 필요에 따라 조정
-
-        example_font = self.example_display.font()
-        metrics = QFontMetrics(example_font)
-
-        example_text = self.example_display.text().replace('\n', ' ')
-        text_width = metrics.horizontalAdvance(example_text) + 20  # 여백 추가
-
-        required_width = max(base_width, text_width)
-        required_width = min(required_width, max_width)
-
+    def adjust_window_size(self, required_width):
+        """예문 텍스트 길이에 맞춰 계산해둔 너비(CardRender.width)로 창의 너비를 조정"""
         if self.width() != required_width:
             self.setFixedWidth(required_width)
 
@@ -374,6 +514,10 @@ class SmallWindow(QMainWindow):
     def request_open_main_window(self):
         """큰 창 열기 요청 신호 발생"""
         self.timer.stop()
+        self.audio.cancel()
+        self.tts_prefetcher.cancel()
+        self.save_schedule()
+        self.end_session()
         self.open_main_window_signal.emit()
 
     # =====================
@@ -0,0 +1,155 @@
+import os
+import re
+import json
+import time
+import datetime
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+LOG_DIRNAME = ".study_log"
+FLUSH_MS = 5000       # 모아둔 기록을 파일에 쓰는 간격
+FLUSH_LINES = 500     # 이만큼 쌓이면 간격을 기다리지 않고 씀
+
+# 이벤트 종류 (e)
+SESSION_START = "start"   # 학습 창을 열었음 (b: 단어장, n: 단어 수)
+SESSION_STOP = "stop"     # 학습 창을 닫았음
+CARD_SHOWN = "shown"      # 단어를 보여줌 (w: 영단어)
+AUDIO_PLAYED = "audio"    # 음성 재생 시작 (w: 읽은 문장, l: 언어)
+CARD_SKIPPED = "skip"     # 채점하지 않고 다음 단어로 넘어감
+CARD_KNEW = "knew"        # 알았음
+CARD_MISSED = "missed"    # 몰랐음
+NAV_NEXT = "next"         # 다음 단어 버튼
+NAV_PREV = "prev"         # 이전 단어 버튼
+
+
+def log_date(timestamp):
+    """기록 파일을 나누는 날짜 (로컬 시간 기준 'YYYY-MM-DD')"""
+    return time.strftime("%Y-%m-%d", time.localtime(timestamp))
+
+
+class StudyLog(QObject):
+    """
+    학습 기록(이벤트 로그). words/.study_log/YYYY-MM-DD.jsonl 에 하루 한 파일씩 한 줄에 이벤트 하나를 덧붙입니다.
+        {"t": epoch 초, "e": 이벤트 종류, "b": 단어장(words/ 기준 상대 경로), "w": 영단어, ...}
+
+    log()는 한 줄을 만들어 메모리에 모아두기만 하고(학습 창 단어 넘기기를 늦추지 않도록),
+    FLUSH_MS마다 또는 FLUSH_LINES만큼 쌓이면 날짜별 파일에 한 번에 덧붙입니다. 앱을 끝낼 때는 flush()를 불러야 합니다.
+    파일에 쓴 이벤트는 written 시그널로 알려줍니다. (학습 이력 통계를 조금씩 갱신하는 데 사용)
+    """
+    written = pyqtSignal(object)   # [event dict, ...] 방금 파일에 쓴 이벤트
+
+    def __init__(self, directory, parent=None):
+        super().__init__(parent)
+        self.directory = directory
+        self.folder = os.path.join(directory, LOG_DIRNAME)
+        self.buffer = []   # [(날짜, 줄, event dict), ...]
+        self._date = None      # 지금 쓰는 날짜와 그 날짜가 끝나는 시각 (이벤트마다 날짜를 계산하지 않도록)
+        self._date_end = 0.0
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(FLUSH_MS)
+        self.flush_timer.timeout.connect(self.flush)
+
+    def book_key(self, wordbook_path):
+        """로그에 남기는 단어장 ID (words/ 기준 상대 경로, 경로가 없으면 None)"""
+        if wordbook_path is None:
+            return None
+        return os.path.relpath(os.path.abspath(wordbook_path), os.path.abspath(self.directory))
+
+    def log(self, event, book=None, **fields):
+        """이벤트 하나를 기록 (파일에는 나중에 모아서 씀)"""
+        now = time.time()
+        if now >= self._date_end:
+            self._date = log_date(now)
+            tomorrow = datetime.date.fromisoformat(self._date) + datetime.timedelta(days=1)
+            self._date_end = time.mktime(tomorrow.timetuple())
+        record = {"t": round(now, 3), "e": event}
+        if book is not None:
+            record["b"] = book
+        record.update(fields)
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        self.buffer.append((self._date, line, record))
+        if len(self.buffer) >= FLUSH_LINES:
+            self.flush()
+        elif not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush(self):
+        """모아둔 이벤트를 날짜별 파일에 덧붙임"""
+        self.flush_timer.stop()
+        if not self.buffer:
+            return
+        buffer, self.buffer = self.buffer, []
+        by_date = {}
+        for date, line, _ in buffer:
+            by_date.setdefault(date, []).append(line)
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            for date, lines in by_date.items():
+                with open(self.path_for(date), 'a', encoding='utf-8') as f:
+                    f.write("\n".join(lines) + "\n")
+        except Exception as e:
+            print(f"Failed to write study log: {e}")
+            return
+        self.written.emit([record for _, _, record in buffer])
+
+    def path_for(self, date):
+        return os.path.join(self.folder, f"{date}.jsonl")
+
+    # =====================
+    #   읽기
+    # =====================
+    def dates(self, start=None, end=None):
+        """기록이 있는 날짜 목록 ('YYYY-MM-DD', 오름차순). start/end(포함)로 범위를 좁힐 수 있음"""
+        try:
+            names = os.listdir(self.folder)
+        except FileNotFoundError:
+            return []
+        dates = sorted(name[:-len(".jsonl")] for name in names if name.endswith(".jsonl"))
+        return [date for date in dates
+                if (start is None or date >= start) and (end is None or date <= end)]
+
+    def iter_events(self, start=None, end=None, events=None):
+        """
+        start~end(포함, 'YYYY-MM-DD' 또는 datetime.date) 기록을 시간 순서대로 yield (아직 쓰지 않은 기록은 빼고)
+        events(이벤트 종류 집합)를 주면 그 종류만 (json 파싱 전에 걸러서 빠름)
+        """
+        start = start.isoformat() if isinstance(start, datetime.date) else start
+        end = end.isoformat() if isinstance(end, datetime.date) else end
+        pattern = None
+        if events is not None:
+            pattern = re.compile("|".join(re.escape(f'"e":"{event}"') for event in events))
+        for date in self.dates(start, end):
+            try:
+                with open(self.path_for(date), 'r', encoding='utf-8') as f:
+                    lines = f.read().splitlines()
+            except OSError as e:
+                print(f"Failed to read study log ({date}): {e}")
+                continue
+            if pattern is not None:
+                search = pattern.search
+                lines = [line for line in lines if search(line)]
+            yield from parse_lines(lines)
+
+
+def parse_lines(lines):
+    """
+    JSONL 줄 목록 -> event dict 목록
+    파일 하나를 JSON 배열 하나로 묶어 한 번에 파싱 (줄마다 json.loads 하는 것보다 몇 배 빠름),
+    끝나다 만 줄(쓰는 도중 종료 등)이 있으면 줄마다 파싱하며 그 줄만 건너뜀
+    """
+    lines = [line for line in lines if line]
+    if not lines:
+        return []
+    try:
+        return json.loads("[" + ",".join(lines) + "]")
+    except ValueError:
+        pass
+    events = []
+    for line in lines:
+        try:
+            events.append(json.loads(line))
+        except ValueError:
+            continue
+    return events
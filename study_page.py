@@ -1,57 +1,75 @@
 import os
-import shutil
-import random  # 단어 섞기를 위해 추가
-from datetime import datetime
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QListWidget, QListWidgetItem, QLineEdit, QTableWidget, QTableWidgetItem,
-    QRadioButton, QButtonGroup, QComboBox, QFileDialog, QMessageBox
+    QListWidget, QListWidgetItem, QLineEdit, QTableView, QTreeView,
+    QRadioButton, QButtonGroup, QComboBox, QFileDialog, QMessageBox, QProgressDialog
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QSize
+from PyQt5.QtCore import Qt, pyqtSignal, QSize, QTimer
 from PyQt5.QtGui import QFont, QIcon
 
-from wordbook_manager import load_wordbooks, parse_wordbook
+from wordbook_manager import load_wordbook
 from wordbook_editor import WordbookEditorDialog
+from wordbook_catalog import get_catalog
+from word_table_model import WordTableModel, fit_column_widths
+from word_order import ShuffleStore
+from study_scheduler import ScheduleStore
+from wordbook_list_model import WordbookListModel, WordbookItemDelegate
+from search_index import LibrarySearchIndex
+from word_lookup import HeadwordLookup
+from custom_widgets import HeadwordDelegate
+from wordbook_dedup import DuplicateIndex
+from duplicate_dialog import DuplicateDialog, ask_skip_duplicates
+from export_dialog import ExportDialog
+from wordbook_import import (
+    ImportJob, import_destination, commit_import, discard_import, file_filter as import_file_filter
+)
 
-
-class WordbookListItem(QWidget):
-    """
-    리스트에 보여질 아이템 위젯 (제목, 단어 개수)
-    """
-    def __init__(self, title, word_count, parent=None):
-        super().__init__(parent)
-        self.title_label = QLabel(title)
-        self.count_label = QLabel(f"({word_count})")
-
-        # 스타일 (필요 시 수정)
-        self.title_label.setStyleSheet("font-size: 12px;")
-        self.count_label.setStyleSheet("font-size: 8px; color: gray;")
-
-        layout = QHBoxLayout()
-        layout.addWidget(self.title_label)
-        layout.addStretch()
-        layout.addWidget(self.count_label)
-        self.setLayout(layout)
+EXPAND_ALL_MAX = 300  # 보이는 단어장이 이 수 이하면 묶음을 모두 펼침
 
 
 class StudyPage(QWidget):
     """
-    - 내 단어장 목록(좌측 QListWidget)
-    - 선택한 단어장 내용(QTableWidget) 편집 (행 추가/삭제 가능 + '단어 섞기' 버튼)
+    - 내 단어장 목록(좌측 QTreeView + WordbookListModel, 날짜 폴더의 달별로 묶어서 표시)
+    - 선택한 단어장 내용(QTableView + WordTableModel) 편집 (행 추가/삭제 가능 + '단어 섞기' 버튼)
     - 새 단어장 추가 (직접 입력), 기존 단어장 파일 불러오기, 단어장 삭제
     - 단어장 제목 변경 시 파일 rename 처리
+    단어장 데이터는 WordbookCatalog(id 기준)에서 읽고, 목록 모델은 id로 단어장을 가리킵니다.
     """
-    open_small_window_signal = pyqtSignal(list)  # 작은 창 열기 요청 신호
+    open_small_window_signal = pyqtSignal(object, object)  # 작은 창 열기 요청 신호 (단어 목록: list, LazyWordbook, PermutedWords / 단어장 경로)
 
-    def __init__(self, fonts=None, word_list=None, parent=None):
+    def __init__(self, fonts=None, word_list=None, catalog=None, parent=None):
         super().__init__(parent)
         self.fonts = fonts
         self.word_list = word_list
 
         # 내부 데이터
-        self.wordbooks = {}       # {title: [ {word, meaning, example}, ... ], ...}
-        self.word_counts = {}     # {title: count, ...}
-        self.wordbook_paths = {}  # {title: file_path, ...}
+        self.catalog = catalog if catalog is not None else get_catalog()
+
+        # 테이블에 표시 중인 단어장 (편집 기록은 WordTableModel이 가지고 있음)
+        self.shown_wordbook_id = None
+        self.saving_wordbook = False  # 직접 저장 중 (wordbook_changed 시그널로 테이블을 다시 읽지 않도록)
+        # 저장하지 않은 '단어 섞기' 순서 (단어장별 seed, 다시 열거나 학습 창에서도 같은 순서)
+        self.shuffle_store = ShuffleStore(self.catalog.directory)
+        # 단어장별 간격 반복 학습 기록 (작은 창에서 채점한 결과)
+        self.schedule_store = ScheduleStore(self.catalog.directory)
+
+        # 단어장 파일 가져오기 (한 번에 하나씩 백그라운드에서)
+        self.import_queue = []       # 가져올 파일 경로 대기열
+        self.import_job = None       # 진행 중인 ImportJob
+        self.import_progress = None  # 진행 중인 가져오기의 QProgressDialog
+
+        # 단어장 목록 (추가/변경/삭제는 모델이 카탈로그 시그널로 직접 반영)
+        self.list_model = WordbookListModel(self.catalog, self)
+        self.catalog.wordbook_changed.connect(self.on_wordbook_changed)
+        self.catalog.wordbook_loaded.connect(self.on_wordbook_changed)
+        self.catalog.load_progress.connect(self.on_library_load_progress)
+
+        # 라이브러리 전체 검색 색인 (카탈로그 시그널로 자동 갱신)
+        self.search_index = LibrarySearchIndex(self.catalog, self)
+        # 영단어 접두어/오타 조회 (테이블 자동 완성, 이미 있는 단어 안내)
+        self.headword_lookup = HeadwordLookup(self.catalog, self)
+        # 가져오기 전 중복 확인용 색인
+        self.duplicate_index = DuplicateIndex(self.catalog, self)
 
         self.setup_ui()
         self.load_initial_wordbooks()
@@ -81,11 +99,11 @@ class StudyPage(QWidget):
                 font-family: 'Pretendard'; 
                 font-size: 14px;
             }
-            QTableWidget {
+            QTableView {
                 border: 2px solid #45b1e9;
                 border-radius: 6px;
             }
-            QListWidget {
+            QListWidget, QTreeView {
                 border: 2px solid #45b1e9;
                 border-radius: 6px;
             }
@@ -124,10 +142,40 @@ class StudyPage(QWidget):
         left_label = QLabel("💙 내 단어")
         left_label.setStyleSheet("font-family: 'esamanru Bold'; font-size: 23px;")
 
-        self.list_widget = QListWidget()
-        self.list_widget.setStyleSheet("font-family: 'Pretendard'; font-size: 14px; height: 200px; width: 100px;")
-        self.list_widget.setSelectionMode(QListWidget.SingleSelection)
-        self.list_widget.itemClicked.connect(self.display_wordbook)
+        # (2-1-0) 전체 단어장 검색 (영단어/뜻/예문)
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("모든 단어장에서 검색")
+        self.search_edit.textChanged.connect(lambda: self.search_timer.start())
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.run_search)
+
+        self.search_results = QListWidget()
+        self.search_results.setStyleSheet("font-family: 'Pretendard'; font-size: 13px;")
+        self.search_results.itemClicked.connect(self.open_search_result)
+        self.search_results.setVisible(False)
+
+        # (2-1-1) 단어장 목록: 이름 입력으로 바로 거르기 + 날짜 폴더(YYMMDD_HHMM)의 달별 트리
+        self.list_filter_edit = QLineEdit()
+        self.list_filter_edit.setPlaceholderText("단어장 이름으로 찾기")
+        self.list_filter_edit.textChanged.connect(self.filter_wordbook_list)
+
+        self.list_view = QTreeView()
+        self.list_view.setStyleSheet("font-family: 'Pretendard'; font-size: 14px; height: 200px; width: 100px;")
+        self.list_view.setHeaderHidden(True)
+        self.list_view.setUniformRowHeights(True)
+        self.list_view.setIndentation(12)
+        self.list_view.setSelectionMode(QTreeView.SingleSelection)
+        self.list_view.setModel(self.list_model)
+        self.list_view.setItemDelegate(WordbookItemDelegate(self.list_view))
+        self.list_view.clicked.connect(self.on_wordbook_clicked)
+        self.list_model.modelReset.connect(self.expand_wordbook_list)
+        self.list_model.rowsInserted.connect(self.on_wordbook_rows_inserted)
+
+        # 라이브러리를 백그라운드에서 읽는 동안 진행 상황 표시 (다 읽으면 숨김)
+        self.loading_label = QLabel("단어장 목록을 불러오는 중...")
+        self.loading_label.setStyleSheet("font-family: 'Pretendard'; font-size: 13px; color: gray;")
 
         # (2-1-A) 기존: 파일로 단어장 불러오기
         self.add_file_button = QPushButton("단어장 불러오기")
@@ -144,13 +192,29 @@ class StudyPage(QWidget):
         self.delete_wordbook_btn.setStyleSheet("font-family: 'Pretendard'; font-size: 16px;")
         self.delete_wordbook_btn.clicked.connect(self.delete_selected_wordbook)
 
+        # (2-1-D) 중복 단어 정리
+        self.duplicates_btn = QPushButton("중복 단어 정리")
+        self.duplicates_btn.setStyleSheet("font-family: 'Pretendard'; font-size: 16px;")
+        self.duplicates_btn.clicked.connect(self.open_duplicate_dialog)
+
+        # (2-1-E) 단어장 내보내기 (TSV / JSON Lines / Anki)
+        self.export_btn = QPushButton("단어장 내보내기")
+        self.export_btn.setStyleSheet("font-family: 'Pretendard'; font-size: 16px;")
+        self.export_btn.clicked.connect(self.open_export_dialog)
+
         # 왼쪽 레이아웃 배치
         left_box_layout.addWidget(left_label)
-        left_box_layout.addWidget(self.list_widget)
+        left_box_layout.addWidget(self.search_edit)
+        left_box_layout.addWidget(self.search_results)
+        left_box_layout.addWidget(self.list_filter_edit)
+        left_box_layout.addWidget(self.loading_label)
+        left_box_layout.addWidget(self.list_view)
         # left_box_layout.addWidget(self.open_subject_button)  # [주석 처리]
         left_box_layout.addWidget(self.add_file_button)
         left_box_layout.addWidget(self.new_wordbook_btn)
         left_box_layout.addWidget(self.delete_wordbook_btn)
+        left_box_layout.addWidget(self.duplicates_btn)
+        left_box_layout.addWidget(self.export_btn)
         left_box_layout.addStretch(1)
 
         # 2-2) 오른쪽: 단어장 편집 (테이블, 저장, 학습 시작 등)
@@ -170,11 +234,18 @@ class StudyPage(QWidget):
         date_layout.addWidget(self.save_button)
 
         # (2-2-2) 단어 테이블
-        self.word_table = QTableWidget()
-        self.word_table.setColumnCount(3)
-        self.word_table.setHorizontalHeaderLabels(["영단어", "뜻", "예문"])
+        self.table_model = WordTableModel(self)
+        self.table_model.dataChanged.connect(self.on_table_data_changed)
+        self.word_table = QTableView()
+        self.word_table.setModel(self.table_model)
         self.word_table.setStyleSheet("font-family: 'Pretendard'; font-size: 16px;")
-        self.word_table.setRowCount(0)
+        self.word_table.setItemDelegate(
+            HeadwordDelegate(self.headword_lookup, self.is_headword_column, parent=self.word_table)
+        )
+
+        # 입력한 영단어가 다른 단어장에 이미 있는지 안내
+        self.lookup_label = QLabel("")
+        self.lookup_label.setStyleSheet("font-family: 'Pretendard'; font-size: 13px; color: gray;")
 
         # (2-2-3) 테이블 행 추가/삭제 + [수정] 단어 섞기 버튼
         table_btn_layout = QHBoxLayout()
@@ -262,6 +333,7 @@ class StudyPage(QWidget):
         # 오른쪽 레이아웃 배치
         right_box_layout.addLayout(date_layout)
         right_box_layout.addWidget(self.word_table)
+        right_box_layout.addWidget(self.lookup_label)
         right_box_layout.addLayout(table_btn_layout)
         right_box_layout.addLayout(radio_layout)
         right_box_layout.addLayout(voice_layout)
@@ -273,28 +345,111 @@ class StudyPage(QWidget):
         main_layout.addLayout(middle_layout)
 
     def load_initial_wordbooks(self):
-        words_directory = os.path.join(os.path.dirname(__file__), 'words')
-        loaded_wordbooks, loaded_word_counts = load_wordbooks(words_directory)
-        self.wordbooks = loaded_wordbooks
-        self.word_counts = loaded_word_counts
-
-        # 파일 경로 매핑
-        for root, dirs, files in os.walk(words_directory):
-            for filename in files:
-                if filename.endswith('_wordbook.txt'):
-                    title = os.path.splitext(filename)[0]
-                    if title.endswith('_wordbook'):
-                        title = title[:-len('_wordbook')]
-                    file_path = os.path.join(root, filename)
-                    self.wordbook_paths[title] = file_path
-
-        # QListWidget 표시
-        for title, count in self.word_counts.items():
-            item_widget = WordbookListItem(title, count)
-            list_item = QListWidgetItem(self.list_widget)
-            list_item.setSizeHint(item_widget.sizeHint())
-            self.list_widget.addItem(list_item)
-            self.list_widget.setItemWidget(list_item, item_widget)
+        # 작업 스레드에서 읽기 시작하고 바로 돌아옴 (창은 먼저 뜸)
+        # 목록이 오면 카탈로그의 listed 시그널로 목록 모델이 채워지고, 단어 수는 단어장마다 도착하는 대로 표시됨
+        self.catalog.load_async()
+        if not self.catalog.is_loading:
+            self.loading_label.setVisible(False)
+        # 중복 정리는 라이브러리 전체를 다 읽은 뒤에 (on_library_load_progress에서 다시 켬)
+        self.duplicates_btn.setEnabled(not self.catalog.is_loading)
+        self.expand_wordbook_list()
+
+    def on_library_load_progress(self, done, total):
+        if done >= total:
+            self.loading_label.setVisible(False)
+            self.duplicates_btn.setEnabled(True)
+            return
+        self.duplicates_btn.setEnabled(False)
+        self.loading_label.setText(f"단어장을 불러오는 중... ({done:,}/{total:,})")
+        self.loading_label.setVisible(True)
+
+    # =====================
+    #   단어장 목록
+    # =====================
+    def expand_wordbook_list(self):
+        """보이는 단어장이 적으면 묶음을 모두 펼치고, 많으면 마지막(가장 최근) 묶음만 펼침"""
+        group_count = self.list_model.rowCount()
+        if not group_count:
+            return
+        if self.list_model.visible_count() <= EXPAND_ALL_MAX:
+            self.list_view.expandAll()
+        else:
+            self.list_view.expand(self.list_model.index(group_count - 1, 0))
+
+    def on_wordbook_rows_inserted(self, parent, first, last):
+        # 새 묶음(가져오기, 새 단어장 추가)은 펼쳐서 보여줌
+        if not parent.isValid():
+            for row in range(first, last + 1):
+                self.list_view.expand(self.list_model.index(row, 0))
+
+    def filter_wordbook_list(self, text):
+        self.list_model.set_filter(text)
+
+    def on_wordbook_clicked(self, index):
+        wordbook_id = self.list_model.wordbook_id(index)
+        if wordbook_id is not None:
+            self.display_wordbook(wordbook_id)
+
+    def select_wordbook(self, wordbook_id):
+        """목록에서 단어장을 선택하고 보이게 스크롤 (필터에 걸러져 있으면 False)"""
+        index = self.list_model.index_for_id(wordbook_id)
+        if not index.isValid():
+            return False
+        self.list_view.expand(index.parent())
+        self.list_view.setCurrentIndex(index)
+        self.list_view.scrollTo(index)
+        return True
+
+    def on_wordbook_changed(self, wordbook_id):
+        record = self.catalog.get(wordbook_id)
+        if (record is not None and wordbook_id == self.shown_wordbook_id and not self.saving_wordbook
+                and record.words is not self.table_model.words):
+            # 다른 곳(중복 정리, 파일 변경 감지 등)에서 단어 목록이 바뀜 -> 새 목록으로 다시 표시
+            # (이전 목록이 LazyWordbook이면 이미 닫혀서 더 읽을 수 없음)
+            self.display_wordbook(wordbook_id)
+
+    def selected_wordbook_id(self):
+        """목록에서 선택된 단어장 id (없으면 None)"""
+        selected = self.list_view.selectionModel().selectedIndexes()
+        if not selected:
+            return None
+        return self.list_model.wordbook_id(selected[0])
+
+    # =====================
+    #   전체 검색
+    # =====================
+    def run_search(self):
+        query = self.search_edit.text().strip()
+        self.search_results.clear()
+        if not query:
+            self.search_results.setVisible(False)
+            return
+        for record, entry_index, entry in self.search_index.search(query):
+            item = QListWidgetItem(f"{entry.word} - {entry.meaning}  [{record.title}]")
+            item.setData(Qt.UserRole, (record.id, entry_index))
+            self.search_results.addItem(item)
+        if self.search_results.count() == 0:
+            self.search_results.addItem(QListWidgetItem("검색 결과가 없습니다."))
+        self.search_results.setVisible(True)
+
+    def open_search_result(self, item):
+        """검색 결과 클릭 -> 그 단어장을 열고 해당 단어 행을 선택"""
+        target = item.data(Qt.UserRole)
+        if not target:
+            return
+        wordbook_id, entry_index = target
+        if self.catalog.get(wordbook_id) is None:
+            return
+        if not self.select_wordbook(wordbook_id):
+            # 목록 필터에 걸러진 단어장 -> 필터를 풀고 다시 선택
+            self.list_filter_edit.clear()
+            self.select_wordbook(wordbook_id)
+        self.display_wordbook(wordbook_id)
+        # entry_index는 원본 순서 -> 섞인 단어장이면 지금 표시 중인 행으로 바꿔서 선택
+        row = self.table_model.row_of(entry_index)
+        if row is not None:
+            self.word_table.selectRow(row)
+            self.word_table.scrollTo(self.table_model.index(row, 0))
 
     def add_wordbook(self):
         options = QFileDialog.Options()
@@ -303,154 +458,198 @@ class StudyPage(QWidget):
             self,
             "단어장 파일 추가",
             "",
-            "Text Files (*.txt);;All Files (*)",
+            import_file_filter(),
             options=options
         )
         if file_paths:
-            for file_path in file_paths:
-                self.load_and_add_wordbook(file_path)
-
-    def load_and_add_wordbook(self, file_path):
-        date_folder_name = datetime.now().strftime('%y%m%d_%H%M')
-        words_dir = os.path.join(os.path.dirname(__file__), 'words', date_folder_name)
-        os.makedirs(words_dir, exist_ok=True)
-
-        basename = os.path.splitext(os.path.basename(file_path))[0]
-        if not basename.endswith('_wordbook'):
-            new_filename = f"{basename}_wordbook.txt"
-        else:
-            new_filename = f"{basename}.txt"
-
-        new_path = os.path.join(words_dir, new_filename)
-
-        try:
-            shutil.copyfile(file_path, new_path)
-        except Exception as e:
-            QMessageBox.warning(self, "오류", f"파일 복사 중 오류 발생: {e}")
-            return
-
-        words, word_count = parse_wordbook(new_path)
-        if word_count == 0:
-            QMessageBox.warning(self, "오류", f"'{os.path.basename(file_path)}' 파일을 로드할 수 없습니다.")
-            return
-
-        title = os.path.splitext(new_filename)[0]
-        if title.endswith('_wordbook'):
-            title = title[:-len('_wordbook')]
-
-        if title in self.wordbooks:
-            QMessageBox.information(self, "정보", f"'{title}' 단어장은 이미 추가되었습니다.")
+            self.import_queue.extend(file_paths)
+            self.start_next_import()
+
+    # =====================
+    #   가져오기 (백그라운드 스레드, 여러 파일은 하나씩 차례로)
+    # =====================
+    def start_next_import(self):
+        if self.import_job is not None or not self.import_queue:
             return
+        file_path = self.import_queue.pop(0)
+        dest_path = import_destination(
+            file_path, exists=lambda path: os.path.exists(path) or self.catalog.find_by_path(path) is not None
+        )
+        self.import_job = ImportJob(file_path, dest_path, self)
+        self.import_job.progress.connect(self.on_import_progress)
+        self.import_job.finished.connect(self.on_import_finished)
+        self.import_job.failed.connect(self.on_import_failed)
+        self.import_job.cancelled.connect(self.end_import)
+
+        self.import_progress = QProgressDialog(
+            f"'{os.path.basename(file_path)}' 가져오는 중...", "취소", 0, 100, self
+        )
+        self.import_progress.setWindowTitle("단어장 가져오기")
+        self.import_progress.setWindowModality(Qt.WindowModal)
+        self.import_progress.setMinimumDuration(300)
+        self.import_progress.setAutoClose(False)
+        self.import_progress.setAutoReset(False)
+        self.import_progress.canceled.connect(self.import_job.cancel)
+        self.import_progress.setValue(0)
+        self.import_job.start()
+
+    def on_import_progress(self, count, percent):
+        if self.import_progress is not None:
+            self.import_progress.setLabelText(
+                f"'{os.path.basename(self.import_job.source_path)}' 가져오는 중... ({count:,}단어)"
+            )
+            self.import_progress.setValue(percent)
+
+    def on_import_finished(self, result):
+        source_name = os.path.basename(result.source_path)
+        self.close_import_progress()
+        try:
+            if result.count == 0:
+                discard_import(result)
+                QMessageBox.warning(self, "오류", f"'{source_name}' 파일을 로드할 수 없습니다.")
+                return
 
-        self.wordbooks[title] = words
-        self.word_counts[title] = word_count
-        self.wordbook_paths[title] = new_path
+            # 확정하기 전에 중복 확인 (중복을 빼기로 하면 걸러진 목록으로 저장)
+            kept_words = None
+            if result.words is not None:
+                kept_words = ask_skip_duplicates(self, self.duplicate_index, result.words, source_name,
+                                                 word_keys=result.word_keys)
+                if kept_words is None:
+                    discard_import(result)
+                    return
+                if not kept_words:
+                    discard_import(result)
+                    QMessageBox.information(self, "알림", "모든 단어가 이미 있어서 가져올 단어가 없습니다.")
+                    return
+                if len(kept_words) == result.count:
+                    kept_words = None
 
-        item_widget = WordbookListItem(title, word_count)
-        list_item = QListWidgetItem(self.list_widget)
-        list_item.setSizeHint(item_widget.sizeHint())
-        self.list_widget.addItem(list_item)
-        self.list_widget.setItemWidget(list_item, item_widget)
+            try:
+                words = commit_import(result, kept_words)
+            except Exception as e:
+                discard_import(result)
+                QMessageBox.warning(self, "오류", f"파일 저장 중 오류 발생: {e}")
+                return
+            self.catalog.add_wordbook(result.dest_path, words)
+        finally:
+            self.end_import()
+
+    def on_import_failed(self, message):
+        self.close_import_progress()
+        QMessageBox.warning(self, "오류", f"'{os.path.basename(self.import_job.source_path)}' 가져오기 실패: {message}")
+        self.end_import()
+
+    def close_import_progress(self):
+        if self.import_progress is not None:
+            self.import_progress.close()
+            self.import_progress.deleteLater()
+            self.import_progress = None
+
+    def end_import(self):
+        self.close_import_progress()
+        if self.import_job is not None:
+            self.import_job.deleteLater()
+            self.import_job = None
+        self.start_next_import()
 
     def open_new_wordbook_dialog(self):
-        dialog = WordbookEditorDialog(self)
+        dialog = WordbookEditorDialog(self, lookup=self.headword_lookup, duplicate_index=self.duplicate_index)
         if dialog.exec_() == dialog.Accepted:
             new_file = dialog.saved_file_path
             if new_file:
-                words, count = parse_wordbook(new_file)
+                words, count = load_wordbook(new_file)
                 if count > 0:
-                    title = os.path.splitext(os.path.basename(new_file))[0]
-                    if title.endswith('_wordbook'):
-                        title = title[:-len('_wordbook')]
-
-                    self.wordbooks[title] = words
-                    self.word_counts[title] = count
-                    self.wordbook_paths[title] = new_file
-
-                    item_widget = WordbookListItem(title, count)
-                    list_item = QListWidgetItem(self.list_widget)
-                    list_item.setSizeHint(item_widget.sizeHint())
-                    self.list_widget.addItem(list_item)
-                    self.list_widget.setItemWidget(list_item, item_widget)
+                    wordbook_id = self.catalog.add_wordbook(new_file, words)
+                    title = self.catalog.get(wordbook_id).title
 
                     QMessageBox.information(self, "완료", f"'{title}' 단어장이 추가되었습니다.")
                 else:
                     QMessageBox.warning(self, "경고", "단어장에 단어가 없습니다.")
 
+    def open_duplicate_dialog(self):
+        DuplicateDialog(self.catalog, self).exec_()
+
+    def open_export_dialog(self):
+        wordbook_id = self.selected_wordbook_id()
+        ExportDialog(self.catalog, [wordbook_id] if wordbook_id is not None else [], self).exec_()
+
     def delete_selected_wordbook(self):
-        selected_items = self.list_widget.selectedItems()
-        if not selected_items:
+        wordbook_id = self.selected_wordbook_id()
+        if wordbook_id is None:
             QMessageBox.warning(self, "경고", "삭제할 단어장을 선택하세요.")
             return
-        list_item = selected_items[0]
-        list_item_widget = self.list_widget.itemWidget(list_item)
-        title = list_item_widget.title_label.text()
+        title = self.catalog.get(wordbook_id).title
 
         reply = QMessageBox.question(self, "확인",
                                      f"'{title}' 단어장을 삭제하시겠습니까?",
                                      QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            file_path = self.wordbook_paths.get(title)
-            if file_path and os.path.exists(file_path):
-                try:
-                    os.remove(file_path)
-                except Exception as e:
-                    QMessageBox.critical(self, "오류", f"파일 삭제 중 오류: {e}")
-                    return
-
-            if title in self.wordbooks:
-                del self.wordbooks[title]
-            if title in self.word_counts:
-                del self.word_counts[title]
-            if title in self.wordbook_paths:
-                del self.wordbook_paths[title]
-
-            row = self.list_widget.row(list_item)
-            self.list_widget.takeItem(row)
+            path = self.catalog.get(wordbook_id).path
+            try:
+                self.catalog.delete(wordbook_id)
+            except Exception as e:
+                QMessageBox.critical(self, "오류", f"파일 삭제 중 오류: {e}")
+                return
+            self.shuffle_store.clear(path)
+            self.schedule_store.clear(path)
 
             QMessageBox.information(self, "삭제 완료", f"'{title}' 단어장이 삭제되었습니다.")
 
-    def display_wordbook(self, item):
-        list_item_widget = self.list_widget.itemWidget(item)
-        title = list_item_widget.title_label.text()
-
-        self.date_edit.setText(title)
-
-        words = self.wordbooks.get(title, [])
-        self.word_table.setRowCount(len(words))
-
-        for row_idx, word_data in enumerate(words):
-            if self.eng_first_radio.isChecked():
-                eng = word_data.get('word', "")
-                kor = word_data.get('meaning', "")
-            else:
-                eng = word_data.get('meaning', "")
-                kor = word_data.get('word', "")
-
-            self.word_table.setItem(row_idx, 0, QTableWidgetItem(eng))
-            self.word_table.setItem(row_idx, 1, QTableWidgetItem(kor))
+    def display_wordbook(self, wordbook_id):
+        record = self.catalog.get(wordbook_id)
+        if record is None:
+            return
 
-            example_raw = word_data.get('example', "").strip()
-            if example_raw.startswith('-'):
-                example_raw = example_raw[1:].strip()
-            self.word_table.setItem(row_idx, 2, QTableWidgetItem(example_raw))
+        self.date_edit.setText(record.title)
+        if not record.is_loaded:
+            # 아직 백그라운드에서 읽지 않은 단어장 -> 먼저 읽도록 부탁하고, 도착하면(wordbook_loaded) 다시 표시
+            self.catalog.prioritize(wordbook_id)
+            self.shown_wordbook_id = record.id
+            self.table_model.set_words([], self.eng_first_radio.isChecked())
+            self.word_table.setEnabled(False)
+            self.lookup_label.setText("단어장을 불러오는 중입니다...")
+            return
+        self.word_table.setEnabled(True)
+        self.lookup_label.setText("")
+
+        # 단어 목록을 그대로 모델에 넘김 (화면에 보이는 행만 읽고, 열 너비는 일부 행만 재서 맞춤)
+        self.shown_wordbook_id = record.id
+        seed = self.shuffle_store.get(record.path, record.count)
+        self.table_model.set_words(record.words, self.eng_first_radio.isChecked(), seed)
+        fit_column_widths(self.word_table)
+
+    # =====================
+    #   테이블 편집
+    # =====================
+    def on_table_data_changed(self, top_left, bottom_right):
+        if top_left != bottom_right or not self.is_headword_column(top_left.column()):
+            return
+        source = self.table_model.source(top_left.row())
+        exclude = (self.shown_wordbook_id, source) if source is not None else None
+        self.lookup_label.setText(self.headword_lookup.describe(top_left.data(), exclude))
 
-        self.word_table.resizeColumnsToContents()
+    def is_headword_column(self, column):
+        """영단어가 표시되는 열인지 (영-한 순서면 0번, 한-영 순서면 1번)"""
+        return self.table_model.is_headword_column(column)
 
     def update_word_table_order(self):
-        selected_items = self.list_widget.selectedItems()
-        if not selected_items:
+        english_first = self.eng_first_radio.isChecked()
+        if english_first == self.table_model.english_first:
             return
-        self.display_wordbook(selected_items[0])
+        # 모델은 열 0, 1이 가리키는 필드만 바꿈 (편집 중인 내용, 섞은 순서, 스크롤 위치는 그대로)
+        self.table_model.set_english_first(english_first)
+        first_width = self.word_table.columnWidth(0)
+        self.word_table.setColumnWidth(0, self.word_table.columnWidth(1))
+        self.word_table.setColumnWidth(1, first_width)
 
     # (행 추가/삭제 기존 동일)
     def add_table_row(self):
-        self.word_table.insertRow(self.word_table.rowCount())
+        self.table_model.insertRows(self.table_model.rowCount(), 1)
 
     def delete_table_row(self):
-        current_row = self.word_table.currentRow()
+        current_row = self.word_table.currentIndex().row()
         if current_row >= 0:
-            self.word_table.removeRow(current_row)
+            self.table_model.removeRows(current_row, 1)
         else:
             QMessageBox.warning(self, "경고", "삭제할 행을 선택하세요.")
 
@@ -458,41 +657,28 @@ class StudyPage(QWidget):
     def shuffle_words(self):
         """
         테이블의 현재 단어들을 무작위로 섞는다.
+        섞은 순서는 seed로 기억해두므로 저장하지 않아도 다시 열거나 학습 창을 열면 같은 순서로 나온다.
         """
-        row_count = self.word_table.rowCount()
-        if row_count < 2:
-            return  # 섞을 단어가 1개 이하라면 그냥 종료
-
-        # 1) 현재 테이블 데이터를 모두 읽어온 뒤
-        data_list = []
-        for r in range(row_count):
-            col0 = self.word_table.item(r, 0).text() if self.word_table.item(r, 0) else ""
-            col1 = self.word_table.item(r, 1).text() if self.word_table.item(r, 1) else ""
-            col2 = self.word_table.item(r, 2).text() if self.word_table.item(r, 2) else ""
-            data_list.append([col0, col1, col2])
-
-        # 2) random.shuffle()로 섞고
-        random.shuffle(data_list)
-
-        # 3) 다시 테이블에 반영
-        for r in range(row_count):
-            self.word_table.setItem(r, 0, QTableWidgetItem(data_list[r][0]))
-            self.word_table.setItem(r, 1, QTableWidgetItem(data_list[r][1]))
-            self.word_table.setItem(r, 2, QTableWidgetItem(data_list[r][2]))
+        self.table_model.shuffle()
+        record = self.catalog.get(self.shown_wordbook_id) if self.shown_wordbook_id is not None else None
+        if record is not None and self.table_model.seed is not None:
+            self.shuffle_store.set(record.path, self.table_model.seed, record.count)
 
     def save_wordbook(self):
-        selected_items = self.list_widget.selectedItems()
-        if not selected_items:
+        wordbook_id = self.selected_wordbook_id()
+        if wordbook_id is None:
             QMessageBox.warning(self, "경고", "먼저 단어장을 선택하세요.")
             return
 
-        list_item = selected_items[0]
-        list_item_widget = self.list_widget.itemWidget(list_item)
-        old_title = list_item_widget.title_label.text()
-
-        if old_title not in self.wordbooks or old_title not in self.wordbook_paths:
+        record = self.catalog.get(wordbook_id)
+        if record is None:
             QMessageBox.warning(self, "경고", "해당 단어장의 정보를 찾을 수 없습니다.")
             return
+        if not record.is_loaded:
+            self.catalog.prioritize(wordbook_id)
+            QMessageBox.warning(self, "경고", "단어장을 아직 불러오는 중입니다. 잠시 후 다시 시도하세요.")
+            return
+        old_title = record.title
 
         new_title = self.date_edit.text().strip()
         if not new_title:
@@ -501,117 +687,76 @@ class StudyPage(QWidget):
 
         # (1) 제목 변경 처리
         if new_title != old_title:
-            if new_title in self.wordbook_paths:
+            old_path = record.path
+            try:
+                self.catalog.rename(wordbook_id, new_title)
+            except FileExistsError:
                 QMessageBox.warning(self, "경고", f"이미 '{new_title}' 단어장이 존재합니다.")
                 return
-
-            old_path = self.wordbook_paths[old_title]
-            folder = os.path.dirname(old_path)
-            new_filename = f"{new_title}_wordbook.txt"
-            new_path = os.path.join(folder, new_filename)
-
-            try:
-                os.rename(old_path, new_path)
             except Exception as e:
                 QMessageBox.critical(self, "오류", f"파일 이름 변경 중 오류 발생: {e}")
                 return
-
-            # 내부 딕셔너리 key 변경
-            self.wordbooks[new_title] = self.wordbooks[old_title]
-            self.word_counts[new_title] = self.word_counts[old_title]
-            self.wordbook_paths[new_title] = new_path
-
-            del self.wordbooks[old_title]
-            del self.word_counts[old_title]
-            del self.wordbook_paths[old_title]
-
-            list_item_widget.title_label.setText(new_title)
+            self.shuffle_store.rename(old_path, record.path)
+            self.schedule_store.rename(old_path, record.path)
 
         final_title = new_title
-        updated_words = []
-        for row_idx in range(self.word_table.rowCount()):
-            eng_item = self.word_table.item(row_idx, 0)
-            kor_item = self.word_table.item(row_idx, 1)
-            ex_item = self.word_table.item(row_idx, 2)
-
-            eng_text = eng_item.text().strip() if eng_item else ""
-            kor_text = kor_item.text().strip() if kor_item else ""
-            ex_text = ex_item.text().strip() if ex_item else ""
-
-            if self.eng_first_radio.isChecked():
-                word_str = eng_text
-                meaning_str = kor_text
-            else:
-                word_str = kor_text
-                meaning_str = eng_text
-
-            if ex_text:
-                ex_final = "-" + ex_text
-            else:
-                ex_final = ""
-
-            if word_str or meaning_str:
-                updated_words.append({
-                    'word': word_str,
-                    'meaning': meaning_str,
-                    'example': ex_final
-                })
-
-        # (2) 파일에 저장
-        file_path = self.wordbook_paths[final_title]
-        try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                for wd in updated_words:
-                    f.write(wd['word'] + "\n")
-                    f.write(wd['meaning'] + "\n")
-                    if wd['example']:
-                        f.write(wd['example'] + "\n")
-
-            self.wordbooks[final_title] = updated_words
-            self.word_counts[final_title] = len(updated_words)
+        if self.shown_wordbook_id == wordbook_id and not self.table_model.is_modified():
+            # 제목만 바뀌었거나 바뀐 내용 없음
+            QMessageBox.information(self, "저장 완료", f"'{final_title}' 단어장이 저장되었습니다.")
+            return
+        # 빈 행(영단어/뜻이 모두 빈 행)은 저장하지 않음
+        updated_words, empty_rows, changes = self.table_model.collect_words()
 
-            # [추가] 왼쪽 리스트의 단어 개수도 갱신
-            list_item_widget.count_label.setText(f"({len(updated_words)})")
+        # (2) 파일에 저장 (왼쪽 리스트의 단어 개수는 카탈로그 시그널로 갱신)
+        try:
+            self.saving_wordbook = True
+            try:
+                self.catalog.save_words(wordbook_id, updated_words, changes)
+            finally:
+                self.saving_wordbook = False
+            # 저장된 목록을 모델의 새 원본으로 (빈 행만 지우고 스크롤/선택은 그대로)
+            self.table_model.mark_saved(record.words, empty_rows)
+            self.shown_wordbook_id = wordbook_id
+            # 섞은 순서도 파일에 그대로 저장되었으므로 기억해둔 seed는 지움
+            self.shuffle_store.clear(record.path)
 
             QMessageBox.information(self, "저장 완료", f"'{final_title}' 단어장이 저장되었습니다.")
         except Exception as e:
             QMessageBox.critical(self, "오류", f"단어장을 저장하는 중 오류가 발생했습니다: {e}")
 
     def request_open_small_window(self):
-        selected_items = self.list_widget.selectedItems()
-        if not selected_items:
+        wordbook_id = self.selected_wordbook_id()
+        if wordbook_id is None:
             QMessageBox.warning(self, "경고", "먼저 단어장을 선택하세요.")
             return
-        list_item_widget = self.list_widget.itemWidget(selected_items[0])
-        title = list_item_widget.title_label.text()
 
-        word_list = self.wordbooks.get(title, [])
+        record = self.catalog.get(wordbook_id)
+        if record is not None and not record.is_loaded:
+            self.catalog.prioritize(wordbook_id)
+            QMessageBox.warning(self, "경고", "단어장을 아직 불러오는 중입니다. 잠시 후 다시 시도하세요.")
+            return
+        if wordbook_id == self.shown_wordbook_id:
+            # 테이블에 보이는 순서대로 (섞었으면 그 순서, 저장된 단어만)
+            word_list = self.table_model.study_words()
+        else:
+            word_list = record.words
         if not word_list:
             QMessageBox.warning(self, "경고", "선택된 단어장이 비어 있습니다.")
             return
 
-        self.open_small_window_signal.emit(word_list)
+        self.open_small_window_signal.emit(word_list, record.path)
 
     def copy_all_words(self):
         """
         현재 word_table에 표시된 단어들을 모두 읽어서,
         탭(\t)으로 구분된 텍스트 형식으로 클립보드에 복사하는 기능
         """
-        row_count = self.word_table.rowCount()
+        row_count = self.table_model.rowCount()
         if row_count == 0:
             QMessageBox.warning(self, "경고", "복사할 내용이 없습니다.")
             return
 
-        copied_lines = []
-        for r in range(row_count):
-            col0 = self.word_table.item(r, 0).text() if self.word_table.item(r, 0) else ""
-            col1 = self.word_table.item(r, 1).text() if self.word_table.item(r, 1) else ""
-            col2 = self.word_table.item(r, 2).text() if self.word_table.item(r, 2) else ""
-            # 각 행의 데이터를 탭으로 구분하여 문자열로 만듭니다.
-            line = "\t".join([col0, col1, col2])
-            copied_lines.append(line)
-
-        # 모든 행을 줄바꿈 문자로 연결하여 최종 문자열 생성
-        copied_text = "\n".join(copied_lines)
+        # 각 행의 데이터를 탭으로 구분하고, 모든 행을 줄바꿈 문자로 연결하여 최종 문자열 생성
+        copied_text = "\n".join("\t".join(self.table_model.row_texts(r)) for r in range(row_count))
         QApplication.clipboard().setText(copied_text)
         QMessageBox.information(self, "복사 완료", "현재 단어장의 모든 내용이 클립보드에 복사되었습니다.")
@@ -0,0 +1,365 @@
+import os
+import json
+import time
+import heapq
+import hashlib
+import threading
+from collections import deque
+
+SCHEDULE_DIRNAME = ".study_schedule"
+SCHEDULE_VERSION = 1
+
+DAY_SECONDS = 24 * 60 * 60
+RELEARN_SECONDS = 60        # 몰랐던 단어는 1분 뒤에 다시
+MIN_EASE = 1.3
+START_EASE = 2.5
+QUALITY_KNEW = 4            # SM-2 응답 품질 (0~5): 알았음
+QUALITY_MISSED = 1          # 몰랐음
+
+
+def word_key(entry):
+    """단어별 학습 기록을 찾는 키 (영단어, 대소문자/앞뒤 공백 무시)"""
+    return entry.word.strip().casefold()
+
+
+class CardState:
+    """
+    단어 하나의 SM-2 상태.
+        reps: 연속으로 맞힌 횟수, interval: 다음 복습까지 간격(일), ease: 간격 배수
+        due: 다음 복습 시각(epoch 초), lapses: 몰랐던 횟수
+    """
+    __slots__ = ("reps", "interval", "ease", "due", "lapses")
+
+    def __init__(self, reps=0, interval=0.0, ease=START_EASE, due=0.0, lapses=0):
+        self.reps = reps
+        self.interval = interval
+        self.ease = ease
+        self.due = due
+        self.lapses = lapses
+
+    def to_list(self):
+        return [self.reps, self.interval, self.ease, self.due, self.lapses]
+
+    @classmethod
+    def from_list(cls, values):
+        return cls(*values)
+
+
+def sm2_review(state, quality, now):
+    """
+    SM-2로 상태를 갱신합니다. quality는 0~5 (3 미만이면 틀림)
+    - 맞힘: 간격 1일 -> 6일 -> 이전 간격 * ease
+    - 틀림: 처음부터 다시 (RELEARN_SECONDS 뒤에 다시 보여줌)
+    """
+    # 저장할 때 다시 다듬지 않도록 갱신할 때 반올림해 둠 (큰 단어장 저장 시간)
+    state.ease = round(max(MIN_EASE, state.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)), 3)
+    if quality < 3:
+        state.reps = 0
+        state.interval = 0.0
+        state.lapses += 1
+        state.due = int(now + RELEARN_SECONDS)
+        return state
+    if state.reps == 0:
+        state.interval = 1.0
+    elif state.reps == 1:
+        state.interval = 6.0
+    else:
+        state.interval = round(state.interval * state.ease, 4)
+    state.reps += 1
+    state.due = int(now + state.interval * DAY_SECONDS)
+    return state
+
+
+class StudyScheduler:
+    """
+    단어 목록 하나의 간격 반복(SM-2) 대기열. 다음 단어 고르기는 O(log n).
+
+    - 채점한 단어: (다음 복습 시각, 순번, 인덱스) 힙
+    - 처음 보는 단어: 목록 순서대로 deque (목록이 섞여 있으면 섞인 순서)
+    - 보여주고 채점하지 않은 단어(자동 넘기기): 상태는 그대로 두고 이번 세션의 반복 deque 맨 뒤로
+    next_card()는 복습할 때가 된 단어 -> 새 단어 -> 반복 deque -> 복습 시각이 가장 이른 단어 순으로 고릅니다.
+    그래서 한 번도 채점하지 않으면 예전처럼 목록을 처음부터 끝까지 돌아가며 보여주고,
+    알았던 단어는 복습할 때가 될 때까지 나오지 않습니다.
+    모든 단어를 알아서 복습할 때가 안 된 단어만 남으면, 복습 시각 순으로 미리 보여주며 돌아갑니다.
+    (넘긴 단어는 힙의 맨 뒤로 다시 넣음, 상태의 복습 시각은 그대로)
+
+    answer/skip은 next_card로 꺼낸 단어(또는 이전 단어로 돌아가 이미 대기열에 다시 넣은 단어)에 대해 부릅니다.
+    같은 단어가 대기열에 여러 번 들어갈 수 있어서 인덱스별 버전으로 오래된 항목을 걸러냅니다.
+    """
+    def __init__(self, words, states=None, now=None):
+        self.words = words
+        self.states = states if states is not None else {}   # {word_key: CardState} (채점한 단어만)
+        self.heap = []
+        self.new_cards = deque()
+        self.cycle = deque()  # [(인덱스, 버전), ...] 채점하지 않고 넘긴 단어
+        self.version = {}     # {인덱스: 대기열에 넣은 횟수} 가장 최근 항목만 유효
+        self.seq = 0
+        self.last_key = 0.0   # 힙에 넣은 가장 늦은 시각 (미리 본 단어를 맨 뒤로 보낼 때)
+        self.dirty = False
+
+        now = time.time() if now is None else now
+        if not self.states:
+            self.new_cards.extend(range(len(words)))
+            return
+        # 저장된 기록이 있으면 단어마다 키를 찾아봄 (처음 여는 단어장은 목록을 훑지 않음)
+        for index, entry in enumerate(words):
+            state = self.states.get(word_key(entry))
+            if state is None:
+                self.new_cards.append(index)
+            else:
+                self.heap.append((state.due, self._next_seq(), index, 0))
+                self.version[index] = 0
+                self.last_key = max(self.last_key, state.due)
+        heapq.heapify(self.heap)
+
+    def __len__(self):
+        return len(self.words)
+
+    def _next_seq(self):
+        self.seq += 1
+        return self.seq
+
+    def _bump(self, index):
+        version = self.version.get(index, -1) + 1
+        self.version[index] = version
+        return version
+
+    def _peek_heap(self):
+        while self.heap:
+            when, _, index, version = self.heap[0]
+            if self.version.get(index) == version:
+                return when, index
+            heapq.heappop(self.heap)
+        return None, None
+
+    def state_of(self, index):
+        return self.states.get(word_key(self.words[index]))
+
+    def due_count(self, now=None):
+        """지금 복습할 때가 된 단어 수 (힙의 유효 항목만 셈, 표시용)"""
+        now = time.time() if now is None else now
+        return sum(1 for when, _, index, version in self.heap
+                   if when <= now and self.version.get(index) == version)
+
+    def next_card(self, now=None):
+        """다음에 보여줄 단어 인덱스 (대기열에서 꺼냄, 단어가 없으면 None)"""
+        now = time.time() if now is None else now
+        when, index = self._peek_heap()
+        if index is not None and when <= now:
+            heapq.heappop(self.heap)
+            self._bump(index)   # 꺼낸 단어는 대기열에 없음 (다시 넣을 때까지)
+            return index
+        if self.new_cards:
+            return self.new_cards.popleft()
+        while self.cycle:
+            cycled, version = self.cycle.popleft()
+            if self.version.get(cycled) == version:
+                self._bump(cycled)
+                return cycled
+        if index is not None:
+            heapq.heappop(self.heap)
+            self._bump(index)
+            return index
+        return None
+
+    def upcoming(self, count, now=None):
+        """
+        앞으로 next_card가 돌려줄 단어 인덱스를 최대 count개 (대기열은 바꾸지 않음, 음성 미리 받기용)
+        힙은 정렬하지 않고 루트부터 작은 항목만 따라가므로 O(count log count)
+        """
+        now = time.time() if now is None else now
+        result = []
+        ordered = self._iter_heap_ordered()
+        not_due = None
+        for when, index in ordered:
+            if when > now:
+                not_due = index
+                break
+            result.append(index)
+            if len(result) >= count:
+                return result
+        for index in self.new_cards:
+            result.append(index)
+            if len(result) >= count:
+                return result
+        for index, version in self.cycle:
+            if self.version.get(index) == version:
+                result.append(index)
+                if len(result) >= count:
+                    return result
+        if not_due is not None:
+            result.append(not_due)
+            for _, index in ordered:
+                if len(result) >= count:
+                    break
+                result.append(index)
+        return result[:count]
+
+    def _iter_heap_ordered(self):
+        """힙의 유효 항목을 (복습 시각, 인덱스) 오름차순으로 (힙을 바꾸지 않음)"""
+        heap = self.heap
+        if not heap:
+            return
+        frontier = [(heap[0], 0)]
+        while frontier:
+            (when, _, index, version), position = heapq.heappop(frontier)
+            if self.version.get(index) == version:
+                yield when, index
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+
+    def answer(self, index, knew, now=None):
+        """단어를 채점하고 다음 복습 시각으로 대기열에 다시 넣습니다. Returns: 갱신된 CardState"""
+        now = time.time() if now is None else now
+        key = word_key(self.words[index])
+        state = self.states.get(key)
+        if state is None:
+            state = self.states[key] = CardState()
+        sm2_review(state, QUALITY_KNEW if knew else QUALITY_MISSED, now)
+        self._push(index, state.due)
+        self.dirty = True
+        return state
+
+    def skip(self, index, now=None):
+        """
+        채점하지 않고 넘긴 단어: 상태는 그대로 두고
+        - 복습할 때가 안 된 단어(미리 보기로 나온 단어)는 힙 맨 뒤로
+        - 나머지(새 단어, 복습할 때가 된 단어)는 이번 세션 반복 대기열 맨 뒤로
+        """
+        now = time.time() if now is None else now
+        state = self.state_of(index)
+        if state is not None and state.due > now:
+            self._push(index, max(state.due, self.last_key + 1))
+        else:
+            self.cycle.append((index, self._bump(index)))
+
+    def _push(self, index, when):
+        self.last_key = max(self.last_key, when)
+        heapq.heappush(self.heap, (when, self._next_seq(), index, self._bump(index)))
+
+
+class ScheduleStore:
+    """
+    단어장별 학습 기록 파일 (words/.study_schedule/<경로 해시>.json).
+        {"version": 1, "path": words/ 기준 상대 경로, "cards": {word_key: [reps, interval, ease, due, lapses]}}
+    단어장마다 파일이 따로라서 단어장 하나를 저장할 때 다른 단어장 기록은 다시 쓰지 않습니다.
+
+    save(background=True)는 쓸 내용을 _pending에 두고 저장소마다 하나인 작업 스레드가 씁니다.
+    같은 파일에 아직 쓰지 않은 내용이 있으면 최신 것으로 바꾸므로 예전 내용이 나중에 덮어쓰는 일이 없습니다.
+    작업 스레드는 daemon이라 앱을 끝낼 때는 flush()로 남은 내용을 써야 합니다.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self.folder = os.path.join(directory, SCHEDULE_DIRNAME)
+        self._write_lock = threading.Lock()          # 파일 쓰기/지우기는 한 번에 하나씩 (_pending에서 꺼내기 전에 잡음)
+        self._condition = threading.Condition()      # _pending 보호, 작업 스레드 깨우기
+        self._pending = {}                           # {기록 파일 경로: 쓸 data} 파일마다 최신 것만
+        self._writer = None
+
+    def key(self, wordbook_path):
+        return os.path.relpath(os.path.abspath(wordbook_path), os.path.abspath(self.directory))
+
+    def path_for(self, wordbook_path):
+        digest = hashlib.sha1(self.key(wordbook_path).encode("utf-8")).hexdigest()[:20]
+        return os.path.join(self.folder, digest + ".json")
+
+    def load(self, wordbook_path):
+        """{word_key: CardState} (기록이 없으면 빈 dict)"""
+        path = self.path_for(wordbook_path)
+        with self._condition:
+            data = self._pending.get(path)
+        if data is not None:   # 아직 쓰지 않은 최신 기록
+            return {key: CardState.from_list(values) for key, values in data["cards"].items()}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != SCHEDULE_VERSION:
+                return {}
+            return {key: CardState.from_list(values) for key, values in data.get("cards", {}).items()}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Study schedule ignored ({path}): {e}")
+            return {}
+
+    def save(self, wordbook_path, states, background=False):
+        """
+        기록을 파일에 씁니다. background=True면 상태를 복사만 하고 파일 쓰기는 작업 스레드에서
+        (카드가 수만 개인 단어장은 json 변환/쓰기가 수백 ms 걸려 학습 창이 멈추지 않도록)
+        """
+        path = self.path_for(wordbook_path)
+        data = {
+            "version": SCHEDULE_VERSION,
+            "path": self.key(wordbook_path),
+            "cards": {key: state.to_list() for key, state in states.items()},
+        }
+        if background:
+            with self._condition:
+                self._pending[path] = data
+                if self._writer is None:
+                    self._writer = threading.Thread(target=self._run, daemon=True)
+                    self._writer.start()
+                self._condition.notify()
+        else:
+            with self._write_lock:
+                with self._condition:
+                    self._pending.pop(path, None)   # 지금 쓰는 것이 더 최신
+                self._write(path, data)
+
+    def flush(self):
+        """작업 스레드가 아직 쓰지 않은 기록을 지금 씀 (앱을 끝낼 때)"""
+        with self._write_lock:
+            with self._condition:
+                pending, self._pending = self._pending, {}
+            for path, data in pending.items():
+                self._write(path, data)
+
+    def _run(self):
+        """(작업 스레드) _pending에 들어온 기록을 하나씩 꺼내 씀"""
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+            with self._write_lock:
+                with self._condition:
+                    if not self._pending:
+                        continue   # 그 사이 flush()나 동기 저장이 가져감
+                    path = next(iter(self._pending))
+                    data = self._pending.pop(path)
+                self._write(path, data)
+
+    def _write(self, path, data):
+        """_write_lock을 잡은 채로 호출"""
+        temp_path = path + ".tmp"
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            # json.dump는 조각마다 write를 불러 느림 -> 문자열로 만든 뒤 한 번에 씀
+            text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"Failed to write study schedule: {e}")
+
+    def clear(self, wordbook_path):
+        path = self.path_for(wordbook_path)
+        try:
+            with self._write_lock:
+                with self._condition:
+                    self._pending.pop(path, None)
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Failed to remove study schedule: {e}")
+
+    def rename(self, old_path, new_path):
+        old_file = self.path_for(old_path)
+        with self._condition:
+            pending = old_file in self._pending
+        if not pending and not os.path.exists(old_file):
+            return
+        states = self.load(old_path)
+        self.save(new_path, states)
+        self.clear(old_path)
@@ -0,0 +1,193 @@
+import os
+import json
+import heapq
+import datetime
+
+from study_log import (
+    SESSION_START, SESSION_STOP, CARD_SHOWN, CARD_SKIPPED, CARD_KNEW, CARD_MISSED, parse_lines
+)
+
+ROLLUP_FILENAME = "rollups.json"
+ROLLUP_VERSION = 1
+IDLE_SECONDS = 300   # 이벤트 사이가 이보다 길면 자리를 비운 것으로 보고 학습 시간에 넣지 않음
+
+# 날짜별/단어별 집계 칸
+SEEN, SKIPPED, KNEW, MISSED, SECONDS = range(5)
+WORD_FIELDS = 4      # 단어별: [본 횟수, 넘긴 횟수, 알았음, 몰랐음]
+COUNTED = {CARD_SHOWN: SEEN, CARD_SKIPPED: SKIPPED, CARD_KNEW: KNEW, CARD_MISSED: MISSED}
+
+
+class StudyStats:
+    """
+    학습 기록(StudyLog)을 날짜별/단어장별/단어별로 미리 집계해둔 표 (words/.study_log/rollups.json).
+        days:  {날짜: [본 단어, 넘긴 단어, 알았음, 몰랐음, 학습 시간(초)]}
+        books: {단어장: 학습 시간(초)}
+        words: {영단어: [본 횟수, 넘긴 횟수, 알았음, 몰랐음]}
+        cursor: [날짜, 바이트 위치]  여기까지의 기록을 집계함
+
+    catch_up()은 cursor 뒤에 새로 쌓인 기록만 읽어서 표에 더하므로, 1년치 기록이 있어도
+    학습 이력 페이지를 열 때 지난 기록 전체를 다시 훑지 않습니다.
+    (save() 전에 앱이 끝나도 다음 catch_up()에서 cursor 뒤부터 다시 집계하므로 빠지거나 두 번 세지 않음)
+    """
+    def __init__(self, study_log):
+        self.study_log = study_log
+        self.path = os.path.join(study_log.folder, ROLLUP_FILENAME)
+        self.reset()
+
+    def reset(self):
+        self.days = {}
+        self.books = {}
+        self.words = {}
+        self.cursor = ["", 0]
+        self.session = None   # [단어장, 마지막 이벤트 시각] 학습 시간 계산용 (세션 중에 끝난 집계를 이어가도록 저장)
+        self.dirty = False
+
+    # =====================
+    #   저장/불러오기
+    # =====================
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != ROLLUP_VERSION:
+                return
+            self.days = data["days"]
+            self.books = data["books"]
+            self.words = data["words"]
+            self.cursor = data["cursor"]
+            self.session = data.get("session")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Study rollups ignored, rebuilding ({self.path}): {e}")
+            self.reset()
+
+    def save(self):
+        if not self.dirty:
+            return
+        temp_path = self.path + ".tmp"
+        try:
+            os.makedirs(self.study_log.folder, exist_ok=True)
+            text = json.dumps({
+                "version": ROLLUP_VERSION,
+                "days": self.days,
+                "books": self.books,
+                "words": self.words,
+                "cursor": self.cursor,
+                "session": self.session,
+            }, ensure_ascii=False, separators=(",", ":"))
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(temp_path, self.path)
+            self.dirty = False
+        except Exception as e:
+            print(f"Failed to write study rollups: {e}")
+
+    # =====================
+    #   집계
+    # =====================
+    def catch_up(self):
+        """cursor 뒤에 쌓인 기록을 읽어 표에 더함. Returns: 새로 집계한 이벤트 수"""
+        cursor_date, offset = self.cursor
+        count = 0
+        for date in self.study_log.dates(start=cursor_date or None):
+            start = offset if date == cursor_date else 0
+            try:
+                with open(self.study_log.path_for(date), 'rb') as f:
+                    f.seek(start)
+                    data = f.read()
+            except OSError as e:
+                print(f"Failed to read study log ({date}): {e}")
+                continue
+            end = data.rfind(b"\n") + 1   # 쓰는 중인 마지막 줄은 다음에
+            if end == 0:
+                continue
+            events = parse_lines(data[:end].decode("utf-8", errors="replace").split("\n"))
+            self.add_events(date, events)
+            self.cursor = [date, start + end]
+            self.dirty = True
+            count += len(events)
+        return count
+
+    def add_events(self, date, events):
+        day = self.days.get(date)
+        if day is None:
+            day = self.days[date] = [0, 0, 0, 0, 0]
+        words = self.words
+        books = self.books
+        session = self.session
+        for event in events:
+            kind = event.get("e")
+            t = event.get("t", 0)
+            book = event.get("b")
+
+            # 학습 시간: 같은 세션에서 앞 이벤트와의 간격 (자리를 비운 간격은 빼고)
+            if kind == SESSION_START:
+                session = [book, t]
+            elif session is not None and session[0] == book:
+                gap = t - session[1]
+                if 0 < gap <= IDLE_SECONDS:
+                    day[SECONDS] += gap
+                    if book is not None:
+                        books[book] = books.get(book, 0) + gap
+                session[1] = t
+                if kind == SESSION_STOP:
+                    session = None
+
+            field = COUNTED.get(kind)
+            if field is None:
+                continue
+            day[field] += 1
+            word = event.get("w")
+            if word is not None:
+                counts = words.get(word)
+                if counts is None:
+                    counts = words[word] = [0] * WORD_FIELDS
+                counts[field] += 1
+        day[SECONDS] = round(day[SECONDS], 1)
+        self.session = session
+
+    # =====================
+    #   조회
+    # =====================
+    def daily(self, days=30, today=None):
+        """최근 days일의 [(날짜, 본 단어, 학습 시간(초)), ...] (오늘부터 거꾸로, 기록 없는 날은 0)"""
+        today = today or datetime.date.today()
+        result = []
+        for i in range(days):
+            date = (today - datetime.timedelta(days=i)).isoformat()
+            day = self.days.get(date)
+            result.append((date, day[SEEN] if day else 0, day[SECONDS] if day else 0))
+        return result
+
+    def book_times(self, limit=20):
+        """학습 시간이 긴 단어장 [(단어장, 초), ...]"""
+        return heapq.nlargest(limit, self.books.items(), key=lambda item: item[1])
+
+    def most_skipped(self, limit=20):
+        """가장 많이 넘긴 단어 [(영단어, 넘긴 횟수, 본 횟수), ...]"""
+        top = heapq.nlargest(limit, self.words.items(), key=lambda item: item[1][SKIPPED])
+        return [(word, counts[SKIPPED], counts[SEEN]) for word, counts in top if counts[SKIPPED] > 0]
+
+    def streaks(self, today=None):
+        """(지금까지 이어진 연속 학습 일수, 가장 길었던 연속 학습 일수) 오늘 아직 안 했으면 어제까지로 셈"""
+        today = today or datetime.date.today()
+        studied = sorted(datetime.date.fromisoformat(date) for date, day in self.days.items() if day[SEEN] > 0)
+        longest = run = 0
+        previous = None
+        for date in studied:
+            run = run + 1 if previous is not None and (date - previous).days == 1 else 1
+            longest = max(longest, run)
+            previous = date
+        current = 0
+        if previous is not None and (today - previous).days <= 1:
+            current = run
+        return current, longest
+
+    def totals(self):
+        """(전체 본 단어, 전체 학습 시간(초))"""
+        seen = seconds = 0
+        for day in self.days.values():
+            seen += day[SEEN]
+            seconds += day[SECONDS]
+        return seen, seconds
@@ -0,0 +1,105 @@
+"""
+간격 반복 대기열(study_scheduler.StudyScheduler)이 단어를 고르는 순서를 확인합니다.
+시각은 모두 now로 넘겨서 실행할 때마다 같은 결과가 나오게 합니다.
+
+실행:
+    python -m pytest -q tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from word_entry import WordEntry  # noqa: E402
+from study_scheduler import StudyScheduler, CardState, sm2_review, word_key, RELEARN_SECONDS, DAY_SECONDS, \
+    QUALITY_KNEW  # noqa: E402
+
+NOW = 1_700_000_000
+
+
+def make_words(count):
+    return [WordEntry(f"word{i}", f"뜻{i}") for i in range(count)]
+
+
+class StudySchedulerTest(unittest.TestCase):
+    def draw(self, scheduler, count, now, skip=True):
+        """next_card를 count번 부르고, 채점하지 않은 것처럼 skip으로 다시 넣음 (자동 넘기기)"""
+        shown = []
+        for _ in range(count):
+            index = scheduler.next_card(now)
+            shown.append(index)
+            if skip and index is not None:
+                scheduler.skip(index, now)
+        return shown
+
+    def test_no_grades_cycles_in_list_order(self):
+        scheduler = StudyScheduler(make_words(4), now=NOW)
+        self.assertEqual(self.draw(scheduler, 12, NOW), [0, 1, 2, 3] * 3)
+
+    def test_missed_card_returns_after_relearn_delay(self):
+        scheduler = StudyScheduler(make_words(5), now=NOW)
+        self.assertEqual(scheduler.next_card(NOW), 0)
+        state = scheduler.answer(0, knew=False, now=NOW)
+        self.assertEqual(state.due, NOW + RELEARN_SECONDS)
+        # 복습할 때가 되기 전에는 새 단어가 먼저
+        self.assertEqual(scheduler.next_card(NOW + RELEARN_SECONDS - 1), 1)
+        # 때가 되면 남은 새 단어보다 먼저
+        self.assertEqual(scheduler.next_card(NOW + RELEARN_SECONDS), 0)
+
+    def test_known_card_waits_until_due(self):
+        scheduler = StudyScheduler(make_words(3), now=NOW)
+        self.assertEqual(scheduler.next_card(NOW), 0)
+        state = scheduler.answer(0, knew=True, now=NOW)
+        self.assertEqual(state.due, NOW + DAY_SECONDS)
+        shown = self.draw(scheduler, 10, NOW + 10)
+        self.assertNotIn(0, shown)
+        self.assertEqual(shown, [1, 2] * 5)
+        self.assertEqual(scheduler.next_card(state.due), 0)
+
+    def test_skipped_preview_goes_to_back_of_heap(self):
+        # 모두 알아서 복습할 때가 안 된 단어만 남으면 복습 시각 순으로 미리 보여주고, 넘긴 단어는 맨 뒤로
+        states = {}
+        for i, entry in enumerate(make_words(3)):
+            states[word_key(entry)] = CardState(reps=1, interval=1.0, due=NOW + DAY_SECONDS + i)
+        scheduler = StudyScheduler(make_words(3), states, now=NOW)
+        self.assertEqual(self.draw(scheduler, 6, NOW), [0, 1, 2, 0, 1, 2])
+        # 넘길 때마다 힙에 새 항목이 들어가지만 오래된 항목은 버전으로 걸러짐
+        self.assertEqual(scheduler.due_count(NOW + 2 * DAY_SECONDS), 3)
+
+    @staticmethod
+    def mixed_scheduler():
+        """맞힌 단어, 틀린 단어, 넘긴 단어, 새 단어가 섞인 대기열"""
+        scheduler = StudyScheduler(make_words(8), now=NOW)
+        for _ in range(6):
+            scheduler.next_card(NOW)
+        scheduler.answer(0, knew=True, now=NOW)
+        scheduler.answer(1, knew=False, now=NOW)
+        scheduler.answer(2, knew=True, now=NOW)
+        scheduler.skip(3, NOW)
+        scheduler.skip(4, NOW)
+        scheduler.answer(5, knew=False, now=NOW - RELEARN_SECONDS)   # 이미 복습할 때가 됨
+        return scheduler
+
+    def test_upcoming_matches_next_card(self):
+        for now in (NOW, NOW + RELEARN_SECONDS):
+            with self.subTest(now=now):
+                scheduler = self.mixed_scheduler()
+                expected = scheduler.upcoming(8, now)
+                self.assertEqual(len(expected), 8)
+                self.assertEqual([scheduler.next_card(now) for _ in range(8)], expected)
+
+
+class Sm2ReviewTest(unittest.TestCase):
+    def test_intervals_grow_and_reset(self):
+        state = CardState()
+        intervals = [sm2_review(state, QUALITY_KNEW, NOW).interval for _ in range(3)]
+        self.assertEqual(intervals[:2], [1.0, 6.0])
+        self.assertGreater(intervals[2], 6.0)
+        self.assertEqual(state.due, int(NOW + intervals[2] * DAY_SECONDS))
+        sm2_review(state, 1, NOW)
+        self.assertEqual((state.reps, state.interval, state.lapses), (0, 0.0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
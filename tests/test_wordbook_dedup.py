@@ -0,0 +1,66 @@
+"""
+중복 단어 찾기(wordbook_dedup)가 백그라운드 로딩 도중에도 동작하는지 확인합니다.
+
+실행:
+    python -m pytest -q tests
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from word_entry import WordEntry  # noqa: E402
+from wordbook_catalog import WordbookCatalog  # noqa: E402
+from wordbook_dedup import find_duplicates, DuplicateIndex  # noqa: E402
+from duplicate_dialog import DuplicateDialog  # noqa: E402
+
+app = QApplication.instance() or QApplication(sys.argv[:1])
+
+
+class PartialLoadTest(unittest.TestCase):
+    """LibraryLoader가 목록만 보내고 단어는 일부만 보낸 상태 (나머지 record.words는 None)"""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        folder = os.path.join(self.directory.name, "2501_0101")
+        self.paths = [os.path.join(folder, f"{title}_wordbook.txt") for title in ("a", "b", "c")]
+        self.catalog = WordbookCatalog(self.directory.name)
+        # 작업 스레드가 보내는 시그널 대신 슬롯을 직접 불러서 로딩 중간 상태를 만듦
+        self.catalog.is_loading = True
+        self.catalog._on_listed([(os.path.basename(path)[:-len("_wordbook.txt")], path, None, None)
+                                 for path in self.paths])
+        self.catalog._on_batch_loaded([
+            (self.paths[0], [WordEntry("apple", "사과"), WordEntry("run", "달리다")]),
+            (self.paths[1], [WordEntry("Apple", "사과"), WordEntry("run", "운영하다")]),
+        ])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_find_duplicates_skips_unloaded(self):
+        unloaded = self.catalog.find_by_path(self.paths[2])
+        self.assertFalse(unloaded.is_loaded)
+        clusters = {cluster.word_key: cluster.kind for cluster in find_duplicates(self.catalog.records())}
+        self.assertEqual(clusters, {"apple": "exact", "run": "near"})
+
+    def test_dialog_opens(self):
+        dialog = DuplicateDialog(self.catalog)
+        self.assertEqual(len(dialog.clusters), 2)
+        dialog.close()
+
+    def test_index_ignores_unloaded(self):
+        index = DuplicateIndex(self.catalog)
+        unloaded = self.catalog.find_by_path(self.paths[2])
+        self.catalog.wordbook_changed.emit(unloaded.id)   # 예: 대본 파일이 바뀜
+        index.rebuild()
+        while index.updates.is_busy():
+            app.processEvents()
+        self.assertEqual(index.check([WordEntry("apple", "사과")]), {0: "exact"})
+
+
+if __name__ == "__main__":
+    unittest.main()
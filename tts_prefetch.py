@@ -0,0 +1,58 @@
+import threading
+from collections import deque
+
+from tts_utils import cached_tts_file, ensure_tts_file
+
+PREFETCH_DEPTH = 3     # 지금 카드 다음으로 음성을 미리 받아둘 카드 수
+PREFETCH_WORKERS = 2   # 동시에 받는 음성 수
+
+
+class TTSPrefetcher:
+    """
+    학습 창에서 앞으로 보여줄 카드들의 음성(gTTS)을 작업 스레드에서 미리 받아 캐시에 저장하는 큐.
+
+    prefetch(clips)에 [(text, lang), ...]을 재생할 순서대로 넘기면, 아직 받지 않은 것만 앞에서부터 받습니다.
+    카드가 바뀔 때마다 새 목록으로 prefetch를 다시 부르면 이전 목록의 남은 요청은 버립니다.
+    (이전/다음으로 여기저기 옮겨 다녀도 지금 카드 근처만 받음, 이미 받고 있던 요청은 끝까지 받아 캐시에 남김)
+    재생은 그대로 play_tts_in_background로 하며, 받아둔 음성은 네트워크 없이 바로 재생됩니다.
+    """
+    def __init__(self, workers=PREFETCH_WORKERS):
+        self.queue = deque()   # [(text, lang), ...] 받을 차례
+        self.condition = threading.Condition()
+        self.workers = workers
+        self.threads = []
+
+    def prefetch(self, clips):
+        """clips [(text, lang), ...]를 앞에서부터 미리 받음 (남아 있던 요청은 버림, 화면 스레드에서 호출)"""
+        pending = [(text, lang) for text, lang in dict.fromkeys(clips)
+                   if text and cached_tts_file(text, lang) is None]
+        with self.condition:
+            self.queue.clear()
+            self.queue.extend(pending)
+            if pending:
+                self._start_workers()
+                self.condition.notify_all()
+
+    def cancel(self):
+        """아직 받기 시작하지 않은 요청을 모두 버림"""
+        with self.condition:
+            self.queue.clear()
+
+    def _start_workers(self):
+        if self.threads:
+            return
+        for _ in range(self.workers):
+            thread = threading.Thread(target=self._run, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.queue:
+                    self.condition.wait()
+                text, lang = self.queue.popleft()
+            try:
+                ensure_tts_file(text, lang)
+            except Exception as e:
+                print(f"음성 미리 받기 실패 ({text!r}): {e}")
@@ -1,33 +1,103 @@
 import os
+import hashlib
 import tempfile
 import threading
 from gtts import gTTS
 from playsound import playsound
 
+# 한 번 변환한 음성은 파일로 남겨두고 다시 씀 (같은 단어를 다시 볼 때, 미리 받아둔 단어를 볼 때 바로 재생)
+TTS_CACHE_DIR = os.path.join(tempfile.gettempdir(), "wordbook_tts_cache")
+TTS_CACHE_MAX_FILES = 3000   # 이보다 많아지면 오래된 파일부터 지움
+
+_inflight = {}               # {캐시 파일 경로: threading.Event} 지금 변환 중인 음성
+_inflight_lock = threading.Lock()
+_cache_pruned = False
+
+
+def tts_cache_path(text, lang):
+    digest = hashlib.sha1(f"{lang}\0{text}".encode("utf-8")).hexdigest()
+    return os.path.join(TTS_CACHE_DIR, f"{digest}.mp3")
+
+
+def cached_tts_file(text, lang='en'):
+    """이미 변환해둔 음성 파일 경로 (없으면 None)"""
+    path = tts_cache_path(text, lang)
+    return path if os.path.exists(path) else None
+
+
+def ensure_tts_file(text, lang='en'):
+    """
+    text의 음성 파일 경로를 돌려줍니다. 캐시에 없으면 gTTS로 변환해서 저장합니다. (작업 스레드에서 호출)
+    다른 스레드(미리 받기)가 같은 음성을 변환하는 중이면 새로 요청하지 않고 끝나기를 기다립니다.
+    Raises: gTTS 변환 오류 (네트워크 등)
+    """
+    path = tts_cache_path(text, lang)
+    while True:
+        if os.path.exists(path):
+            return path
+        with _inflight_lock:
+            event = _inflight.get(path)
+            if event is None:
+                event = _inflight[path] = threading.Event()
+                break
+        event.wait()
+        if not os.path.exists(path):
+            # 먼저 변환하던 쪽이 실패함 -> 이쪽에서 다시 시도
+            continue
+        return path
+
+    try:
+        _prune_cache_once()
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'wb') as fp:
+                gTTS(text=text, lang=lang).write_to_fp(fp)
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return path
+    finally:
+        with _inflight_lock:
+            del _inflight[path]
+        event.set()
+
+
+def _prune_cache_once():
+    """처음 변환할 때 한 번, 캐시 파일이 너무 많으면 오래된 것부터 지움"""
+    global _cache_pruned
+    if _cache_pruned:
+        return
+    _cache_pruned = True
+    try:
+        with os.scandir(TTS_CACHE_DIR) as it:
+            files = [(entry.stat().st_mtime, entry.path) for entry in it if entry.name.endswith(".mp3")]
+    except OSError:
+        return
+    if len(files) <= TTS_CACHE_MAX_FILES:
+        return
+    files.sort()
+    for _, path in files[:len(files) - TTS_CACHE_MAX_FILES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
 def play_tts_in_background(text, lang='en'):
     """
     text(문자열)를 gTTS로 음성 변환 후, 별도의 스레드에서 바로 재생하는 함수.
+    이미 변환해둔 음성(캐시, TTSPrefetcher가 미리 받아둔 것 포함)은 네트워크 요청 없이 바로 재생합니다.
     playsound 사용 -> Windows, macOS, Linux에서 ffmpeg 없이 사용 가능 (단, OS별 기본 오디오 플레이어 필요).
     """
     def _play():
-        temp_path = None
         try:
-            # gTTS 객체 생성
-            tts = gTTS(text=text, lang=lang)
-
-            # 임시 파일로 저장
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as fp:
-                temp_path = fp.name
-                tts.write_to_fp(fp)
-
+            path = cached_tts_file(text, lang) or ensure_tts_file(text, lang)
             # 음성 재생
-            playsound(temp_path)
+            playsound(path)
         except Exception as e:
             print(f"음성 재생 중 오류 발생: {e}")
-        finally:
-            # 재생이 끝나면 임시 파일 삭제
-            if temp_path and os.path.exists(temp_path):
-                os.remove(temp_path)
 
     # 데몬 스레드로 실행 -> 메인 종료 시 함께 종료됨
     threading.Thread(target=_play, daemon=True).start()
@@ -0,0 +1,129 @@
+import sys
+
+KEYS = ('word', 'meaning', 'example')
+
+
+class WordEntry:
+    """
+    단어 하나 (영단어, 뜻, 예문).
+
+    dict 대신 __slots__ 클래스로 저장해서 단어당 메모리를 줄이고,
+    예문('-영문 예문+한글 뜻')은 파싱할 때 한 번만 영문/한글로 나눠 둡니다.
+        example_en: 영문 예문 ('+'가 없으면 '-' 뒤의 원문 그대로, 예문이 없으면 None)
+        example_ko: 한글 뜻 ('+'가 없으면 None)
+
+    기존 코드와의 호환을 위해 entry['word'], entry.get('example', "") 같은 dict 방식 접근도 지원합니다.
+    """
+    __slots__ = ('word', 'meaning', 'example_en', 'example_ko')
+
+    def __init__(self, word="", meaning="", example=""):
+        # 영단어/뜻은 여러 단어장에 반복되는 경우가 많아서 intern으로 같은 문자열 객체를 공유
+        self.word = sys.intern(word)
+        self.meaning = sys.intern(meaning)
+        self.example_en, self.example_ko = split_example(example)
+
+    @property
+    def example(self):
+        """파일 저장 형식의 예문 ('-영문+한글', '+'가 없으면 '-원문', 없으면 '')"""
+        if self.example_en is None:
+            return ""
+        if self.example_ko is None:
+            return "-" + self.example_en
+        return f"-{self.example_en}+{self.example_ko}"
+
+    @property
+    def example_body(self):
+        """맨 앞 '-'를 뺀 예문 (테이블 편집용)"""
+        if self.example_en is None:
+            return ""
+        if self.example_ko is None:
+            return self.example_en.strip()
+        return f"{self.example_en}+{self.example_ko}"
+
+    @property
+    def has_split_example(self):
+        """영문/한글로 나뉜 예문이 있는지 (예문 TTS 대상)"""
+        return self.example_ko is not None
+
+    # =====================
+    #   dict 호환
+    # =====================
+    def __getitem__(self, key):
+        if key in KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in KEYS:
+            return getattr(self, key)
+        return default
+
+    def __contains__(self, key):
+        return key in KEYS
+
+    def keys(self):
+        return KEYS
+
+    def values(self):
+        return tuple(getattr(self, key) for key in KEYS)
+
+    def items(self):
+        return tuple((key, getattr(self, key)) for key in KEYS)
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, WordEntry):
+            return (self.word, self.meaning, self.example_en, self.example_ko) == \
+                   (other.word, other.meaning, other.example_en, other.example_ko)
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"WordEntry({self.word!r}, {self.meaning!r}, {self.example!r})"
+
+
+def split_example(example):
+    """
+    '-hello + 안녕' -> ('hello', '안녕')
+    '-hello'        -> ('hello', None)
+    ''              -> (None, None)
+    """
+    if not example:
+        return None, None
+    body = example[1:] if example.startswith('-') else example
+    if '+' in body:
+        eng, kor = body.split('+', 1)
+        return eng.strip(), kor.strip()
+    return body, None
+
+
+def entries_to_fields(words):
+    """WordEntry 목록 -> (영단어, 뜻, 영문 예문, 한글 뜻, 영단어, ...) 한 줄로 늘어놓은 tuple (캐시 저장용)"""
+    return tuple(field for entry in words
+                 for field in (entry.word, entry.meaning, entry.example_en, entry.example_ko))
+
+
+def entries_from_fields(fields):
+    """
+    entries_to_fields의 반대. 예문은 이미 나눠져 있으므로 split_example 없이 칸만 채웁니다.
+    (캐시를 단어마다 객체로 pickle하면 불러올 때 객체 수만큼 느려서, 문자열 tuple로 저장했다가 쓸 때 만듦)
+    """
+    new = WordEntry.__new__
+    entries = []
+    for i in range(0, len(fields), 4):
+        entry = new(WordEntry)
+        entry.word, entry.meaning, entry.example_en, entry.example_ko = fields[i:i + 4]
+        entries.append(entry)
+    return entries
+
+
+def to_entries(words):
+    """dict 목록(또는 WordEntry 목록)을 WordEntry 목록으로 변환"""
+    return [w if isinstance(w, WordEntry) else
+            WordEntry(w.get('word', ""), w.get('meaning', ""), w.get('example', ""))
+            for w in words]
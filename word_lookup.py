@@ -0,0 +1,363 @@
+import threading
+from array import array
+from bisect import bisect_left, insort
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from sliced_work import SlicedWorkQueue
+
+MAX_EDIT_DISTANCE = 2
+PREFIX_LENGTH = 7    # 오타 색인은 앞 7글자만 사용 (SymSpell prefix length)
+HASH_MASK = 0xFFFFFFFF
+INSORT_LIMIT = 256           # 이보다 많이 바뀌면 하나씩 끼워 넣지 않고 붙인 뒤 다시 정렬
+UPDATE_LIMIT = 20_000        # 한 번에 이보다 많은 표제어가 바뀌면 색인을 작업 스레드에서 새로 만듦
+RECENT_CODES_LIMIT = 200_000
+REMOVED_LIMIT = 20_000
+
+
+def normalize_headword(word):
+    """비교용 영단어 (소문자, 공백 하나로)"""
+    return " ".join(word.lower().split())
+
+
+def edit_distance(a, b, max_distance=MAX_EDIT_DISTANCE):
+    """
+    자리바꿈을 한 번의 편집으로 세는 편집 거리 (Optimal String Alignment).
+    max_distance를 넘으면 계산을 멈추고 max_distance + 1을 반환합니다.
+    """
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+def deletes(term, depth):
+    """term에서 글자를 최대 depth개 지운 문자열 집합 (term 자신 포함)"""
+    result = {term}
+    frontier = {term}
+    for _ in range(depth):
+        frontier = {t[:i] + t[i + 1:] for t in frontier for i in range(len(t))} - result
+        result |= frontier
+    return result
+
+
+class HeadwordIndex:
+    """
+    영단어 표제어 조회용 색인 (접두어 + 오타 허용).
+
+    - 접두어: 정렬된 표제어 목록에서 bisect로 범위를 찾음 (trie와 같은 결과를 훨씬 적은 메모리로)
+    - 오타: SymSpell 방식. 표제어마다 앞 PREFIX_LENGTH글자에서 한 글자씩 지운 문자열의 해시를
+      (해시 << 32 | 표제어 번호) 형태로 정렬된 array('Q')에 저장합니다.
+      검색어에서 최대 두 글자를 지운 문자열의 해시로 후보를 찾고, 실제 편집 거리로 확인합니다.
+      (편집 거리 1과 자리바꿈은 항상, 2는 한쪽에만 몰린 삽입/삭제 등 일부를 찾음)
+
+    만든 뒤에는 update()로 바뀐 표제어만 반영합니다. 표제어 번호(by_id 위치)는 바뀌지 않으므로
+    새 표제어의 코드는 작은 정렬 list(recent_codes)에 따로 넣고, 뺀 표제어는 by_id에서 None으로만 표시합니다.
+    이렇게 쌓인 것이 많아지면 needs_rebuild()가 True가 됩니다. (HeadwordLookup이 작업 스레드에서 새로 만듦)
+    """
+    def __init__(self, headwords=()):
+        self.words = sorted(set(headwords))
+        self.by_id = list(self.words)   # 표제어 번호 -> 표제어 (뺀 표제어는 None)
+        codes = []
+        for word_no, word in enumerate(self.words):
+            for variant in deletes(word[:PREFIX_LENGTH], 1):
+                codes.append(((hash(variant) & HASH_MASK) << 32) | word_no)
+        codes.sort()
+        self.delete_codes = array('Q', codes)
+        self.recent_codes = []   # 만든 뒤 넣은 표제어의 코드 (정렬 유지)
+        self.removed = 0         # 만든 뒤 뺀 표제어 수 (delete_codes/recent_codes에 남아 있는 코드)
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        pos = bisect_left(self.words, word)
+        return pos < len(self.words) and self.words[pos] == word
+
+    def update(self, added=(), removed=()):
+        """
+        표제어를 빼고(removed) 넣습니다(added). 이미 있는 것을 넣거나 없는 것을 빼면 무시합니다.
+        정렬된 목록에는 몇 개면 bisect로 끼워 넣고, 많으면 뒤에 붙여 다시 정렬합니다. (이미 정렬된 부분은 합치기만 함)
+        """
+        words = self.words
+        removed = [word for word in set(removed) if word in self]
+        if removed:
+            for word in removed:
+                word_id = self._find_id(word)
+                if word_id is not None:
+                    self.by_id[word_id] = None
+            self.removed += len(removed)
+            if len(removed) <= INSORT_LIMIT:
+                for word in removed:
+                    del words[bisect_left(words, word)]
+            else:
+                gone = set(removed)
+                self.words = words = [word for word in words if word not in gone]
+
+        added = sorted(word for word in set(added) if word not in self)
+        if added:
+            for word in added:
+                word_id = len(self.by_id)
+                self.by_id.append(word)
+                for variant in deletes(word[:PREFIX_LENGTH], 1):
+                    self.recent_codes.append(((hash(variant) & HASH_MASK) << 32) | word_id)
+            self.recent_codes.sort()
+            if len(added) <= INSORT_LIMIT:
+                for word in added:
+                    insort(words, word)
+            else:
+                words.extend(added)
+                words.sort()
+
+    def needs_rebuild(self):
+        """update()로 쌓인 코드/뺀 표제어가 많아서 새로 만드는 편이 나은지"""
+        return (len(self.recent_codes) > max(RECENT_CODES_LIMIT, len(self.delete_codes) // 4)
+                or self.removed > max(REMOVED_LIMIT, len(self.by_id) // 4))
+
+    def _iter_codes(self, variant):
+        """variant 해시로 시작하는 코드의 표제어 번호 (delete_codes, recent_codes 모두)"""
+        lo = (hash(variant) & HASH_MASK) << 32
+        hi = lo + (1 << 32)
+        for codes in (self.delete_codes, self.recent_codes):
+            pos = bisect_left(codes, lo)
+            size = len(codes)
+            while pos < size and codes[pos] < hi:
+                yield codes[pos] & HASH_MASK
+                pos += 1
+
+    def _find_id(self, word):
+        """표제어 번호 (앞 PREFIX_LENGTH글자 자체도 코드로 들어 있으므로 그 해시로 찾음)"""
+        for word_id in self._iter_codes(word[:PREFIX_LENGTH]):
+            if self.by_id[word_id] == word:
+                return word_id
+        return None
+
+    def complete(self, prefix, limit=20):
+        """prefix로 시작하는 표제어 (사전순)"""
+        start = bisect_left(self.words, prefix)
+        result = []
+        for word in self.words[start:start + limit]:
+            if not word.startswith(prefix):
+                break
+            result.append(word)
+        return result
+
+    def fuzzy(self, word, max_distance=MAX_EDIT_DISTANCE, limit=10):
+        """편집 거리 max_distance 이내의 표제어를 [(표제어, 거리), ...]로 (거리, 사전순) 정렬해서 반환"""
+        candidates = set()
+        for variant in deletes(word[:PREFIX_LENGTH], max_distance):
+            candidates.update(self._iter_codes(variant))
+
+        matches = []
+        for word_id in candidates:
+            candidate = self.by_id[word_id]
+            if candidate is None:
+                continue
+            distance = edit_distance(word, candidate, max_distance)
+            if distance <= max_distance:
+                matches.append((distance, candidate))
+        matches.sort()
+        return [(candidate, distance) for distance, candidate in matches[:limit]]
+
+
+class HeadwordLookup(QObject):
+    """
+    카탈로그 전체의 영단어 -> (단어장, 단어 위치) 조회.
+
+    단어 위치(locations)는 카탈로그 시그널마다 그 단어장만 갱신하고 (큰 단어장은 SlicedWorkQueue로 나눠서),
+    접두어/오타 색인(HeadwordIndex)에는 새로 생기거나 없어진 표제어만 update()로 반영합니다.
+    라이브러리 전체를 다시 훑을 때나 바뀐 표제어가 많을 때는 색인을 작업 스레드에서 새로 만들고,
+    다 만들 때까지는 지금 색인으로 답한 뒤 (그동안 바뀐 표제어를 더해서) 교체합니다.
+    WordbookEditorDialog, StudyPage 테이블에서 입력한 단어가 이미 어디 있는지 보여줄 때 사용합니다.
+    """
+    index_built = pyqtSignal(object, int)   # (새 HeadwordIndex, 세대) 작업 스레드에서 보냄
+
+    def __init__(self, catalog, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.locations = {}          # {표제어: [(record_id, entry_index), ...]}
+        self.record_headwords = {}   # {record_id: {표제어, ...}}
+        self.index = HeadwordIndex()
+        self.updates = SlicedWorkQueue(self)  # 큰 단어장은 나눠서 반영
+        self._gone = {}              # {record_id: {표제어, ...}} 다시 읽는 중인 단어장에서 빠진 표제어 (다 읽으면 색인에 반영)
+        self._stale = False          # 라이브러리 전체를 다시 훑는 중 -> 다 훑은 뒤 색인을 새로 만듦
+        self._building = False       # 작업 스레드에서 색인을 만드는 중
+        self._generation = 0         # 만드는 도중 rebuild()로 다시 시작하면 이전 결과는 버림
+        self._replay = []            # 색인을 만드는 동안 바뀐 표제어 [(added, removed), ...]
+
+        self.updates.idle.connect(self._on_updates_idle)
+        self.index_built.connect(self._on_index_built)
+        catalog.reloaded.connect(self.rebuild)
+        catalog.wordbook_added.connect(self.update_record)
+        catalog.wordbook_changed.connect(self.update_record)
+        catalog.wordbook_removed.connect(self.remove_record)
+        if catalog.is_loaded:
+            self.rebuild()
+
+    def rebuild(self):
+        self._stale = True
+        self._building = False
+        self._generation += 1
+        self.updates.clear()
+        self.locations.clear()
+        self.record_headwords.clear()
+        self._gone.clear()
+        # 라이브러리 전체는 단어장마다 나눠서 이벤트 루프 사이사이에 (시작 직후 화면이 멈추지 않도록)
+        for record in self.catalog.records():
+            if record.words is not None:
+                self.updates.submit(record.id, self._iter_add_record(record), defer=True)
+        if not self.updates.is_busy():
+            self._on_updates_idle()
+
+    def _iter_add_record(self, record, step=1000):
+        gone = self._gone.pop(record.id, set())
+        headwords = self.record_headwords[record.id] = set()
+        added = []
+        try:
+            for entry_index, entry in enumerate(record.words):
+                headword = normalize_headword(entry.word)
+                if headword:
+                    locations = self.locations.get(headword)
+                    if locations is None:
+                        self.locations[headword] = [(record.id, entry_index)]
+                        added.append(headword)
+                    else:
+                        locations.append((record.id, entry_index))
+                    headwords.add(headword)
+                if entry_index % step == step - 1:
+                    yield
+        finally:
+            # 중간에 취소되어도 지금까지 넣은 표제어는 색인에 반영 (뒤이은 remove_record가 다시 뺌)
+            self._headwords_changed([word for word in added if word not in gone],
+                                    [word for word in gone if word not in self.locations])
+
+    def _remove_locations(self, record_id):
+        """record_id의 단어 위치를 지우고, 그 단어장에만 있던(locations에서 없어진) 표제어를 반환"""
+        gone = set()
+        for headword in self.record_headwords.pop(record_id, ()):
+            kept = [loc for loc in self.locations[headword] if loc[0] != record_id]
+            if kept:
+                self.locations[headword] = kept
+            else:
+                del self.locations[headword]
+                gone.add(headword)
+        return gone
+
+    def remove_record(self, record_id):
+        self.updates.cancel(record_id)
+        gone = self._remove_locations(record_id) | self._gone.pop(record_id, set())
+        self._headwords_changed((), [word for word in gone if word not in self.locations])
+
+    def update_record(self, record_id):
+        record = self.catalog.get(record_id)
+        if record is None or record.words is None:   # 아직 읽지 않은 단어장은 reloaded 때 한꺼번에
+            return
+        self.updates.cancel(record_id)
+        # 빠진 표제어는 다시 읽은 뒤에 색인에 반영 (다시 들어온 표제어는 색인을 건드리지 않도록)
+        self._gone.setdefault(record_id, set()).update(self._remove_locations(record_id))
+        self.updates.submit(record_id, self._iter_add_record(record))
+
+    # =====================
+    #   접두어/오타 색인
+    # =====================
+    def _headwords_changed(self, added, removed):
+        if not added and not removed:
+            return
+        if self._stale:
+            return   # 라이브러리 전체를 다 훑은 뒤 한꺼번에 만듦
+        if self._building:
+            self._replay.append((added, removed))
+            return
+        if len(added) + len(removed) > UPDATE_LIMIT:
+            self._start_build()
+            return
+        self.index.update(added, removed)
+        if self.index.needs_rebuild():
+            self._start_build()
+
+    def _on_updates_idle(self):
+        if self._stale:
+            self._stale = False
+            self._start_build()
+
+    def _start_build(self):
+        """지금 표제어로 작업 스레드에서 색인을 새로 만듦 (그동안은 지금 색인으로 답함)"""
+        self._building = True
+        self._replay = []
+        threading.Thread(target=self._build, args=(list(self.locations), self._generation), daemon=True).start()
+
+    def _build(self, headwords, generation):
+        self.index_built.emit(HeadwordIndex(headwords), generation)
+
+    def _on_index_built(self, index, generation):
+        if generation != self._generation or not self._building:
+            return
+        self._building = False
+        self.index = index
+        # 만드는 동안 바뀐 표제어를 순서대로 더함 (그 사이 다시 만들기 시작하면 나머지는 다음 교체 때)
+        replay, self._replay = self._replay, []
+        for added, removed in replay:
+            self._headwords_changed(added, removed)
+
+    # =====================
+    #   조회
+    # =====================
+    def where(self, word):
+        """word가 들어 있는 단어장 위치 [(record, entry_index), ...]"""
+        result = []
+        for record_id, entry_index in self.locations.get(normalize_headword(word), ()):
+            record = self.catalog.get(record_id)
+            if record is not None:
+                result.append((record, entry_index))
+        return result
+
+    def complete(self, prefix, limit=20):
+        """prefix로 시작하는 표제어 목록 (입력 자동 완성용)"""
+        prefix = normalize_headword(prefix)
+        return self.index.complete(prefix, limit) if prefix else []
+
+    def suggest(self, word, limit=5):
+        """오타로 보이는 입력에 대한 후보 [(표제어, 거리), ...] (입력한 단어 자신은 제외)"""
+        word = normalize_headword(word)
+        if not word:
+            return []
+        return [(headword, distance) for headword, distance in self.index.fuzzy(word, limit=limit + 1)
+                if headword != word][:limit]
+
+    def describe(self, word, exclude=None, max_books=3):
+        """
+        입력한 단어가 어디 있는지 한 줄 안내문으로 만듭니다. (없으면 오타 후보, 그것도 없으면 "")
+        exclude: 제외할 (record_id, entry_index) - 편집 중인 자기 자신
+        """
+        word = word.strip()
+        if not word:
+            return ""
+        hits = [(record, entry_index) for record, entry_index in self.where(word)
+                if (record.id, entry_index) != exclude]
+        if hits:
+            titles = []
+            for record, _ in hits:
+                if record.title not in titles:
+                    titles.append(record.title)
+            more = f" 외 {len(titles) - max_books}개" if len(titles) > max_books else ""
+            return f"'{word}' 이미 있음: " + ", ".join(titles[:max_books]) + more
+        suggestions = self.suggest(word, limit=3)
+        if suggestions:
+            return "혹시 이 단어? " + ", ".join(headword for headword, _ in suggestions)
+        return ""
@@ -0,0 +1,103 @@
+import os
+import json
+import random
+
+SHUFFLE_FILENAME = ".shuffle_orders.json"
+SHUFFLE_VERSION = 1
+
+
+def new_seed():
+    return random.randrange(2 ** 32)
+
+
+def shuffled_order(count, seed):
+    """0..count-1을 seed로 섞은 순서 (같은 seed, 같은 count면 항상 같은 결과)"""
+    order = list(range(count))
+    random.Random(seed).shuffle(order)
+    return order
+
+
+class PermutedWords:
+    """
+    단어 목록(list 또는 LazyWordbook)을 복사하지 않고 order 순서로 보여주는 읽기 전용 뷰.
+    list처럼 len(), [i], [a:b], for 문을 지원하므로 SmallWindow.set_word_list에 그대로 넘길 수 있습니다.
+    """
+    def __init__(self, words, order):
+        self.words = words
+        self.order = order
+
+    def __len__(self):
+        return len(self.order)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.words[i] for i in self.order[index]]
+        return self.words[self.order[index]]
+
+    def __iter__(self):
+        words = self.words
+        for i in self.order:
+            yield words[i]
+
+
+class ShuffleStore:
+    """
+    단어장별로 저장하지 않은 '단어 섞기' 순서를 기억해두는 파일 (words/.shuffle_orders.json).
+
+    순서 자체가 아니라 seed와 단어 수만 저장하고, 열 때 shuffled_order(count, seed)로 다시 만듭니다.
+    단어 수가 달라졌으면(파일이 바뀜) 그 기록은 버립니다.
+        {"version": 1, "orders": {words/ 기준 상대 경로: {"seed": seed, "count": 단어 수}}}
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self.path = os.path.join(directory, SHUFFLE_FILENAME)
+        self.orders = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == SHUFFLE_VERSION:
+                self.orders = data.get("orders", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Shuffle orders ignored ({self.path}): {e}")
+            self.orders = {}
+
+    def save(self):
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": SHUFFLE_VERSION, "orders": self.orders}, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            print(f"Failed to write shuffle orders: {e}")
+
+    def key(self, wordbook_path):
+        return os.path.relpath(os.path.abspath(wordbook_path), os.path.abspath(self.directory))
+
+    def get(self, wordbook_path, count):
+        """기억해둔 seed (없거나 단어 수가 달라졌으면 None)"""
+        entry = self.orders.get(self.key(wordbook_path))
+        if entry is None:
+            return None
+        if entry.get("count") != count:
+            self.clear(wordbook_path)
+            return None
+        return entry.get("seed")
+
+    def set(self, wordbook_path, seed, count):
+        self.orders[self.key(wordbook_path)] = {"seed": seed, "count": count}
+        self.save()
+
+    def clear(self, wordbook_path):
+        if self.orders.pop(self.key(wordbook_path), None) is not None:
+            self.save()
+
+    def rename(self, old_path, new_path):
+        entry = self.orders.pop(self.key(old_path), None)
+        if entry is not None:
+            self.orders[self.key(new_path)] = entry
+            self.save()
@@ -0,0 +1,280 @@
+import random
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QFontMetrics
+
+from word_entry import WordEntry
+from word_order import new_seed, shuffled_order, PermutedWords
+
+HEADERS = ("영단어", "뜻", "예문")
+MEANING_FIRST_HEADERS = ("뜻", "영단어", "예문")
+WIDTH_SAMPLE_ROWS = 200   # 열 너비를 잴 때 보는 행 수
+MAX_COLUMN_WIDTH = 400
+CELL_PADDING = 24
+
+
+class WordTableModel(QAbstractTableModel):
+    """
+    StudyPage 단어 테이블용 모델. 단어장의 단어 목록(list 또는 LazyWordbook)을 복사하지 않고 그대로 보여줍니다.
+    화면에 보이는 행만 data()로 읽으므로 큰 단어장도 여는 비용이 단어 수와 상관없이 거의 일정합니다.
+
+    - words: 원본 단어 목록 (읽기 전용으로만 씀)
+    - order: 행 -> 원본 인덱스. 처음에는 range라서 메모리를 쓰지 않고, 행 추가/삭제/섞기 때 list로 바꿈
+    - edited: {원본 인덱스: 고친 WordEntry}. 새로 추가한 행은 len(words) 이상의 인덱스로 여기에만 들어감
+    - seed: 지금 순서를 만든 섞기 seed (섞지 않았거나, 행을 추가/삭제한 뒤 섞었으면 None)
+    열 순서는 영-한이면 (영단어, 뜻, 예문), 한-영이면 (뜻, 영단어, 예문) 입니다.
+    열 순서 바꾸기와 섞기는 order/english_first만 바꾸고 단어는 복사하지 않습니다.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.words = []
+        self.order = range(0)
+        self.edited = {}
+        self.english_first = True
+        self.next_source = 0
+        self.seed = None
+        self.restructured = False  # 열고 나서 행을 추가/삭제함
+        self.modified = False
+
+    def set_words(self, words, english_first=True, seed=None):
+        """단어 목록을 표시합니다. seed가 있으면 shuffled_order(단어 수, seed) 순서로 (저장해둔 섞기 순서 복원)"""
+        self.beginResetModel()
+        self.words = words
+        self.order = shuffled_order(len(words), seed) if seed is not None else range(len(words))
+        self.edited = {}
+        self.english_first = english_first
+        self.next_source = len(words)
+        self.seed = seed
+        self.restructured = False
+        self.modified = False
+        self.endResetModel()
+
+    def set_english_first(self, english_first):
+        """영-한 / 한-영 열 순서 바꾸기. 열 0, 1이 가리키는 필드만 바꾸고 보이는 칸만 다시 그림"""
+        if english_first == self.english_first:
+            return
+        self.english_first = english_first
+        self.headerDataChanged.emit(Qt.Horizontal, 0, 1)
+        if self.order:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.order) - 1, 1), [Qt.DisplayRole, Qt.EditRole])
+
+    # =====================
+    #   행 -> 단어
+    # =====================
+    def source(self, row):
+        """행의 원본 인덱스 (새로 추가한 행이면 None)"""
+        source = self.order[row]
+        return source if source < len(self.words) else None
+
+    def row_of(self, source):
+        """원본 인덱스의 현재 행 (섞기/행 추가·삭제 반영, 삭제된 단어면 None)"""
+        if isinstance(self.order, range):
+            return source if 0 <= source < len(self.order) else None
+        try:
+            return self.order.index(source)
+        except ValueError:
+            return None
+
+    def entry(self, row):
+        source = self.order[row]
+        entry = self.edited.get(source)
+        return entry if entry is not None else self.words[source]
+
+    def column_text(self, entry, column):
+        if column == 2:
+            return entry.example_body
+        if (column == 0) == self.english_first:
+            return entry.word
+        return entry.meaning
+
+    def row_texts(self, row):
+        entry = self.entry(row)
+        return [self.column_text(entry, column) for column in range(3)]
+
+    def is_headword_column(self, column):
+        """영단어가 표시되는 열인지 (영-한 순서면 0번, 한-영 순서면 1번)"""
+        return column == (0 if self.english_first else 1)
+
+    # =====================
+    #   QAbstractTableModel
+    # =====================
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role in (Qt.DisplayRole, Qt.EditRole) and index.isValid():
+            return self.column_text(self.entry(index.row()), index.column())
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return (HEADERS if self.english_first else MEANING_FIRST_HEADERS)[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not index.isValid():
+            return False
+        row, column = index.row(), index.column()
+        text = (value or "").strip()
+        entry = self.entry(row)
+        if self.column_text(entry, column) == text:
+            return False
+
+        word, meaning, example = entry.word, entry.meaning, entry.example
+        if column == 2:
+            example = "-" + text if text else ""
+        elif self.is_headword_column(column):
+            word = text
+        else:
+            meaning = text
+        self.edited[self.order[row]] = WordEntry(word, meaning, example)
+        self.modified = True
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def insertRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or count <= 0:
+            return False
+        self._own_order()
+        self.beginInsertRows(parent, row, row + count - 1)
+        for i in range(count):
+            source = self.next_source
+            self.next_source += 1
+            self.edited[source] = WordEntry()
+            self.order.insert(row + i, source)
+        self.restructured = True
+        self.modified = True
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or count <= 0 or row + count > len(self.order):
+            return False
+        self._own_order()
+        self.beginRemoveRows(parent, row, row + count - 1)
+        for source in self.order[row:row + count]:
+            self.edited.pop(source, None)
+        del self.order[row:row + count]
+        self.restructured = True
+        self.modified = True
+        self.endRemoveRows()
+        return True
+
+    def _own_order(self):
+        if isinstance(self.order, range):
+            self.order = list(self.order)
+
+    def shuffle(self, seed=None):
+        """
+        행 순서를 seed로 섞습니다. (단어는 복사하지 않고 행 -> 원본 인덱스만 섞음)
+        행 구성이 그대로면 원본 순서를 shuffled_order(단어 수, seed)로 바꾸므로 seed만 있으면 같은 순서를 다시 만들 수 있고,
+        행을 추가/삭제한 뒤라면 지금 순서를 섞습니다. (이때는 seed로 복원할 수 없으므로 self.seed는 None)
+        Returns: 사용한 seed
+        """
+        if seed is None:
+            seed = new_seed()
+        if len(self.order) < 2:
+            return seed
+        self.layoutAboutToBeChanged.emit()
+        old_order = list(self.order)
+        if self.restructured:
+            self.order = old_order[:]
+            random.Random(seed).shuffle(self.order)
+            self.seed = None
+        else:
+            self.order = shuffled_order(len(self.words), seed)
+            self.seed = seed
+        # 선택/현재 칸이 섞인 뒤에도 같은 단어를 가리키도록 persistent index를 옮김
+        new_rows = {source: row for row, source in enumerate(self.order)}
+        for index in self.persistentIndexList():
+            self.changePersistentIndex(index, self.index(new_rows[old_order[index.row()]], index.column()))
+        # 저장하면 섞인 순서대로 파일에 씀
+        self.modified = True
+        self.layoutChanged.emit()
+        return seed
+
+    def study_words(self):
+        """저장된 단어를 테이블에 보이는 순서대로 (학습 창용, 단어는 복사하지 않는 PermutedWords 뷰)"""
+        if isinstance(self.order, range):
+            return self.words
+        count = len(self.words)
+        return PermutedWords(self.words, [source for source in self.order if source < count])
+
+    # =====================
+    #   저장
+    # =====================
+    def is_modified(self):
+        return self.modified
+
+    def collect_words(self):
+        """
+        (저장할 단어 목록, 저장되지 않는 빈 행(영단어/뜻이 모두 빈 행) 목록, 바뀐 행 정보)를 반환합니다.
+        바뀐 행 정보는 저장 엔진이 바뀐 행만 쓰도록 넘기는 dict입니다. (SQLiteWordbookStore.save_changes 참고)
+            sources: 저장할 단어마다 원본 인덱스 (새로 추가한 행은 None)
+            edited: 고친 원본 인덱스 집합
+            count: 원본 단어 수
+        바뀐 것이 없으면 원본 목록을 그대로 돌려줍니다. (바뀐 행 정보는 None)
+        """
+        if not self.modified:
+            return self.words, [], None
+        count = len(self.words)
+        words = []
+        sources = []
+        empty_rows = []
+        for row in range(len(self.order)):
+            entry = self.entry(row)
+            if entry.word or entry.meaning:
+                source = self.order[row]
+                words.append(entry)
+                sources.append(source if source < count else None)
+            else:
+                empty_rows.append(row)
+        edited = {source for source in self.edited if source < count}
+        return words, empty_rows, {"sources": sources, "edited": edited, "count": count}
+
+    def mark_saved(self, words, empty_rows=()):
+        """저장 후: 빈 행을 지우고 저장된 목록을 새 원본으로 삼아 편집 기록을 비움 (스크롤/선택은 그대로)"""
+        self._own_order()
+        for row in sorted(empty_rows, reverse=True):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self.order[row]
+            self.endRemoveRows()
+        self.words = words
+        self.order = range(len(words))
+        self.edited = {}
+        self.next_source = len(words)
+        self.seed = None
+        self.restructured = False
+        self.modified = False
+
+
+def fit_column_widths(view, sample_rows=WIDTH_SAMPLE_ROWS, max_width=MAX_COLUMN_WIDTH):
+    """
+    resizeColumnsToContents 대신 일부 행만 재서 열 너비를 맞춥니다.
+    처음 화면에 보이는 앞쪽 행과 나머지 구간에서 고르게 뽑은 행을 합쳐 sample_rows개 정도만 봅니다.
+    """
+    model = view.model()
+    row_count = model.rowCount()
+    head = min(row_count, sample_rows // 2)
+    step = max(1, (row_count - head) // max(1, sample_rows - head))
+    rows = list(range(head)) + list(range(head, row_count, step))
+
+    view.ensurePolished()
+    metrics = QFontMetrics(view.font())
+    header_metrics = QFontMetrics(view.horizontalHeader().font())
+    for column in range(model.columnCount()):
+        label = model.headerData(column, Qt.Horizontal)
+        width = header_metrics.horizontalAdvance(label)
+        for row in rows:
+            text = model.data(model.index(row, column))
+            if text:
+                width = max(width, metrics.horizontalAdvance(text))
+        view.setColumnWidth(column, min(width + CELL_PADDING, max_width))
@@ -0,0 +1,144 @@
+import os
+import pickle
+import hashlib
+
+from word_entry import entries_to_fields, entries_from_fields
+
+CACHE_FILENAME = ".wordbook_cache.pickle"
+CACHE_VERSION = 3  # 2: 단어를 WordEntry로 저장, 3: 단어를 문자열 tuple로 저장 (entries_to_fields)
+
+
+def file_digest(file_path):
+    """파일 내용의 sha1 해시(hex)를 계산합니다."""
+    h = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class WordbookCache:
+    """
+    파싱된 단어장을 라이브러리 단위의 캐시 파일(words/.wordbook_cache.pickle) 하나에 저장해두는 캐시.
+
+    항목 구조:
+        {상대 경로: {"mtime": ns, "size": bytes, "hash": sha1, "words": [WordEntry, ...]}}
+    파일에는 words를 entries_to_fields로 문자열 tuple 하나로 바꿔 저장하고, lookup 때 WordEntry 목록으로 되돌립니다.
+    (단어마다 객체로 pickle하면 단어 수십만 개를 불러오는 동안 GC가 늘어나는 객체를 거듭 훑어서 몇 배 느림)
+
+    - mtime, size가 같으면 파일을 열지 않고 바로 캐시를 사용
+    - mtime/size가 바뀌었어도 해시가 같으면(단순 touch 등) 다시 파싱하지 않음
+    - 그 외에는 parse_func로 다시 파싱해서 캐시 갱신
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self.cache_path = os.path.join(directory, CACHE_FILENAME)
+        self.entries = {}
+        self.seen = set()    # 이번 스캔에서 확인한 파일들 (사라진 파일 정리용)
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.cache_path, 'rb') as f:
+                data = pickle.load(f)
+            if data.get("version") == CACHE_VERSION:
+                self.entries = data.get("entries", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Wordbook cache ignored ({self.cache_path}): {e}")
+            self.entries = {}
+
+    def key_for(self, file_path):
+        return os.path.relpath(file_path, self.directory)
+
+    def lookup(self, file_path):
+        """
+        캐시가 유효하면 캐시된 단어 목록을, 아니면 None을 반환합니다. (파싱하지 않음)
+        """
+        key = self.key_for(file_path)
+        self.seen.add(key)
+        st = os.stat(file_path)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        if entry["mtime"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            return self._entry_words(entry)
+
+        if entry["hash"] == file_digest(file_path):
+            entry["mtime"] = st.st_mtime_ns
+            entry["size"] = st.st_size
+            self.dirty = True
+            return self._entry_words(entry)
+        return None
+
+    @staticmethod
+    def _entry_words(entry):
+        """파일에서 불러온 항목이면 문자열 tuple을 WordEntry 목록으로 바꿔 둠"""
+        words = entry["words"]
+        if isinstance(words, tuple):
+            words = entry["words"] = entries_from_fields(words)
+        return words
+
+    def put(self, file_path, words, digest=None):
+        """새로 파싱한 단어 목록을 캐시에 저장합니다. (digest를 이미 계산했다면 넘겨서 재계산 생략)"""
+        key = self.key_for(file_path)
+        self.seen.add(key)
+        st = os.stat(file_path)
+        self.entries[key] = {
+            "mtime": st.st_mtime_ns,
+            "size": st.st_size,
+            "hash": digest or file_digest(file_path),
+            "words": words,
+        }
+        self.dirty = True
+
+    def forget(self, file_path):
+        """삭제된 단어장의 항목을 지웁니다. (일부만 다시 읽어서 save(prune=False)할 때)"""
+        if self.entries.pop(self.key_for(file_path), None) is not None:
+            self.dirty = True
+
+    def get_words(self, file_path, parse_func):
+        """
+        캐시가 유효하면 캐시된 단어 목록을, 아니면 parse_func(file_path)로 다시 파싱한 결과를 반환합니다.
+        Returns: (words, word_count)
+        """
+        words = self.lookup(file_path)
+        if words is not None:
+            return words, len(words)
+
+        words, count = parse_func(file_path)
+        self.put(file_path, words)
+        return words, count
+
+    def save(self, prune=True):
+        """
+        이번 스캔에서 보지 못한 항목을 정리하고, 변경이 있으면 캐시 파일을 원자적으로 다시 씁니다.
+        prune=False: 바뀐 파일만 읽은 경우(카탈로그 refresh) -> 보지 못한 항목도 그대로 둠
+        """
+        if prune:
+            stale = [key for key in self.entries if key not in self.seen]
+            for key in stale:
+                del self.entries[key]
+            if stale:
+                self.dirty = True
+
+        if not self.dirty:
+            return
+
+        temp_path = self.cache_path + ".tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                entries = {key: {**entry, "words": self._entry_fields(entry["words"])}
+                           for key, entry in self.entries.items()}
+                pickle.dump({"version": CACHE_VERSION, "entries": entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.cache_path)
+            self.dirty = False
+        except Exception as e:
+            print(f"Failed to write wordbook cache: {e}")
+
+    @staticmethod
+    def _entry_fields(words):
+        return words if isinstance(words, tuple) else entries_to_fields(words)
@@ -0,0 +1,392 @@
+import os
+from PyQt5.QtCore import QObject, pyqtSignal
+
+import wordbook_manager
+from wordbook_manager import (
+    iter_library, read_wordbook, close_words, title_from_filename, find_script_files
+)
+from wordbook_cache import WordbookCache
+from library_manifest import LibraryManifest
+from word_entry import to_entries
+from lazy_wordbook import LazyWordbook
+from library_loader import LibraryLoader
+
+WORDS_DIRECTORY = os.path.join(os.path.dirname(__file__), 'words')
+
+
+class WordbookRecord:
+    """
+    카탈로그에 올라간 단어장 하나 (id는 세션 동안 바뀌지 않음)
+    백그라운드 로딩 중에는 목록만 먼저 올라오고 words는 읽을 때까지 None입니다. (is_loaded)
+    """
+    __slots__ = ("id", "title", "path", "words", "script_text_path", "script_audio_path")
+
+    def __init__(self, wordbook_id, title, path, words, script_text_path=None, script_audio_path=None):
+        self.id = wordbook_id
+        self.title = title
+        self.path = path
+        self.words = words
+        self.script_text_path = script_text_path
+        self.script_audio_path = script_audio_path
+
+    @property
+    def is_loaded(self):
+        return self.words is not None
+
+    @property
+    def count(self):
+        return len(self.words) if self.words is not None else 0
+
+
+class WordbookCatalog(QObject):
+    """
+    words/ 라이브러리를 한 번만 스캔해서 StudyPage, RadioPage가 함께 쓰는 단어장 목록.
+
+    - 단어장은 제목이 아니라 정수 id로 구분 (다른 폴더에 같은 제목이 있어도 충돌 없음)
+    - 단어 목록, 파일 경로, 대본/음성 경로를 한 곳에 보관
+    - 변경 시 시그널을 보내 각 페이지가 필요한 부분만 갱신
+    - 저장/이름 변경/삭제는 wordbook_manager의 저장 엔진을 거쳐서 반영
+
+    시작할 때는 load_async로 읽습니다. (창을 먼저 띄우고 라이브러리는 작업 스레드에서)
+        listed: 단어장 목록이 다 올라옴 (단어는 아직 읽지 않은 것이 있음, record.is_loaded)
+        wordbook_loaded(id): 그 단어장의 단어를 다 읽음
+        load_progress(done, total): 읽은 단어장 수
+        reloaded: 모든 단어장의 단어를 다 읽음 (검색 색인 등은 이때 한 번에 만듦)
+    load()로 한 번에 읽으면 listed와 reloaded를 이어서 보냅니다.
+    """
+    wordbook_added = pyqtSignal(int)
+    wordbook_changed = pyqtSignal(int)
+    wordbook_removed = pyqtSignal(int)
+    reloaded = pyqtSignal()
+    listed = pyqtSignal()
+    wordbook_loaded = pyqtSignal(int)
+    load_progress = pyqtSignal(int, int)
+
+    def __init__(self, directory=WORDS_DIRECTORY, parent=None):
+        super().__init__(parent)
+        self.directory = directory
+        self.manifest = LibraryManifest(directory)
+        self._records = {}   # {id: WordbookRecord} (추가된 순서 유지)
+        self._next_id = 1
+        self._own_writes = {}  # {절대 경로: (mtime_ns, size)} 카탈로그가 직접 저장한 파일
+        self.is_loaded = False   # 단어장 목록이 올라옴 (이후 추가되는 단어장은 wordbook_added로 알림)
+        self.is_loading = False  # 작업 스레드에서 단어를 읽는 중
+        self._loader = None
+        self._restart_load = False   # 로딩 중 refresh -> 멈춘 로더가 끝나면 다시 읽음
+        self._pending = {}       # {절대 경로: id} 목록에는 있지만 아직 단어를 읽지 않은 단어장
+        self._load_total = 0
+
+    # =====================
+    #   조회
+    # =====================
+    def get(self, wordbook_id):
+        return self._records.get(wordbook_id)
+
+    def records(self):
+        return list(self._records.values())
+
+    def ids(self):
+        return list(self._records.keys())
+
+    def find_by_path(self, path):
+        path = os.path.abspath(path)
+        for record in self._records.values():
+            if os.path.abspath(record.path) == path:
+                return record
+        return None
+
+    def __len__(self):
+        return len(self._records)
+
+    # =====================
+    #   스캔
+    # =====================
+    def load(self):
+        """라이브러리 전체를 한 번 읽어옵니다. (이미 읽었거나 백그라운드에서 읽는 중이면 아무것도 하지 않음)"""
+        if self.is_loaded or self.is_loading:
+            return
+        self.manifest.scan()
+        for info in iter_library(self.directory, manifest=self.manifest):
+            self._insert(info["title"], info["wordbook_path"], info["words"],
+                         info["script_text_path"], info["script_audio_path"])
+        self.is_loaded = True
+        self.listed.emit()
+        self.reloaded.emit()
+
+    def load_async(self):
+        """
+        라이브러리를 작업 스레드(LibraryLoader)에서 읽기 시작하고 바로 돌아옵니다.
+        목록이 먼저 올라오고(listed), 단어는 묶음으로 도착할 때마다 wordbook_loaded를 보냅니다.
+        """
+        if self.is_loaded or self.is_loading:
+            return
+        self.is_loading = True
+        self._start_loader()
+
+    def _start_loader(self):
+        self._loader = LibraryLoader(self.directory, self.manifest, self)
+        self._loader.listed.connect(self._on_listed)
+        self._loader.batch_loaded.connect(self._on_batch_loaded)
+        self._loader.finished.connect(self._on_load_finished)
+        self._loader.start()
+
+    def prioritize(self, wordbook_id):
+        """아직 단어를 읽지 않은 단어장이면 백그라운드 로딩에서 다음 차례로 읽도록 합니다."""
+        record = self._records.get(wordbook_id)
+        if record is not None and not record.is_loaded and self._loader is not None:
+            self._loader.prioritize(record.path)
+
+    def cancel_loading(self):
+        """백그라운드 로딩을 멈춥니다. (종료할 때) 작업 스레드는 다음 단어장을 넘기기 전에 멈춤"""
+        self._restart_load = False
+        if self._loader is not None:
+            self._loader.cancel()
+
+    def _on_listed(self, listing):
+        known = {os.path.abspath(record.path): record for record in self._records.values()}
+        for title, path, text_path, audio_path in listing:
+            abs_path = os.path.abspath(path)
+            record = known.get(abs_path)
+            if record is None:   # 목록이 오기 전에 가져온 단어장은 이미 있음
+                self._pending[abs_path] = self._insert(title, path, None, text_path, audio_path)
+            elif not record.is_loaded:
+                self._pending[abs_path] = record.id   # 다시 시작한 로딩: 앞의 로더가 목록만 올린 단어장
+        self._load_total = len(self._pending)
+        self.is_loaded = True
+        self.listed.emit()
+        self.load_progress.emit(0, self._load_total)
+
+    def _on_batch_loaded(self, batch):
+        for path, words in batch:
+            wordbook_id = self._pending.pop(os.path.abspath(path), None)
+            record = self._records.get(wordbook_id)
+            if record is None or record.is_loaded:
+                # 그 사이 삭제되었거나 직접 읽음(이름 변경, 저장 등)
+                close_words(words)
+                continue
+            record.words = words
+            self.wordbook_loaded.emit(wordbook_id)
+        self.load_progress.emit(self._load_total - len(self._pending), self._load_total)
+
+    def _on_load_finished(self):
+        loader = self._loader
+        loader.deleteLater()
+        self._loader = None
+        if loader.is_cancelled():
+            # 멈춘 로더가 읽지 못한 단어장은 실패가 아니므로 그대로 두고, refresh로 멈췄으면 처음부터 다시 읽음
+            if self._restart_load:
+                self._restart_load = False
+                self._start_loader()
+            return
+        # 끝까지 단어를 읽지 못한(비어 있거나 읽을 수 없는) 단어장은 목록에서 뺌
+        for wordbook_id in self._pending.values():
+            record = self._records.pop(wordbook_id, None)
+            if record is not None:
+                print(f"Failed to load wordbook: {os.path.basename(record.path)}")
+                self.wordbook_removed.emit(wordbook_id)
+        self._pending.clear()
+        self.is_loading = False
+        self.is_loaded = True
+        self.load_progress.emit(self._load_total, self._load_total)
+        self.reloaded.emit()
+
+    def _load_now(self, record):
+        """아직 단어를 읽지 않은 단어장을 백그라운드 차례를 기다리지 않고 지금 읽음"""
+        self._pending.pop(os.path.abspath(record.path), None)
+        if wordbook_manager.STORAGE_ENGINE == "sqlite":
+            record.words, _ = wordbook_manager.load_wordbook(record.path)
+        else:
+            record.words = read_wordbook(record.path)
+
+    def refresh(self, folders=None):
+        """
+        마지막 스캔 이후 바뀐 폴더/파일만 반영합니다.
+        바뀐 단어장마다 wordbook_added / wordbook_changed / wordbook_removed 시그널을 보냅니다.
+
+        folders: 변경이 감지된 폴더(절대 또는 words/ 기준 상대 경로) 목록.
+                 폴더 mtime이 그대로여도(파일을 제자리에서 덮어쓴 경우) 다시 읽습니다. (LibraryWatcher 참고)
+        """
+        if self.is_loading:
+            # 로딩 중인 목록은 이미 낡았을 수 있으므로 멈추고, 멈춘 뒤 다시 읽음 (_on_load_finished)
+            # (매니페스트는 로더 스레드가 쓰고 있으므로 멈출 때까지 기다렸다가 새 로더를 시작)
+            if self._loader is not None and not self._loader.is_cancelled():
+                self._loader.cancel()
+                self._restart_load = True
+            return
+        if not self.is_loaded:
+            self.load()
+            return
+
+        force = {self._relative_folder(folder) for folder in folders or ()}
+
+        if wordbook_manager.STORAGE_ENGINE == "sqlite":
+            # DB가 원본이므로 대본/음성 파일만 다시 확인
+            for record in self.records():
+                folder = os.path.dirname(record.path)
+                if folders is None or self._relative_folder(folder) in force:
+                    self.update_scripts(record.id, *find_script_files(folder), changed=folders is not None)
+            return
+
+        changes = self.manifest.scan(force)
+        # 바뀐 파일만 읽으므로 캐시의 나머지 항목은 그대로 두고(save(prune=False)), 바뀐 것이 없으면 캐시를 열지도 않음
+        cache = None
+        if changes["added"] or changes["modified"] or changes["removed"]:
+            cache = WordbookCache(self.directory)
+
+        for rel in changes["removed"]:
+            cache.forget(os.path.join(self.directory, rel))
+            record = self.find_by_path(os.path.join(self.directory, rel))
+            if record:
+                close_words(record.words)
+                del self._records[record.id]
+                self.wordbook_removed.emit(record.id)
+
+        scripts_by_folder = {}
+        for path, text_path, audio_path in self.manifest.iter_wordbooks():
+            scripts_by_folder[os.path.dirname(os.path.abspath(path))] = (text_path, audio_path)
+
+        for rel in changes["added"] + changes["modified"]:
+            path = os.path.join(self.directory, rel)
+            record = self.find_by_path(path)
+            if record is not None and self._is_own_write(path):
+                continue  # 카탈로그가 방금 쓴 파일 -> 이미 메모리에 같은 내용이 있으므로 다시 파싱하지 않음
+            words = read_wordbook(path, cache)
+            if record is None:
+                if words:
+                    text_path, audio_path = scripts_by_folder.get(os.path.dirname(os.path.abspath(path)), (None, None))
+                    self._insert(title_from_filename(os.path.basename(path)), path, words, text_path, audio_path)
+            elif isinstance(words, LazyWordbook) or words != record.words:
+                # LazyWordbook은 내용 비교 대신 (파일이 바뀌었으므로) 새로 연 뷰로 교체
+                close_words(record.words)
+                record.words = words
+                self.wordbook_changed.emit(record.id)
+
+        for rel in changes["scripts"]:
+            folder = os.path.abspath(os.path.join(self.directory, rel))
+            text_path, audio_path = scripts_by_folder.get(folder, find_script_files(folder))
+            for record in self.records():
+                if os.path.dirname(os.path.abspath(record.path)) == folder:
+                    self.update_scripts(record.id, text_path, audio_path, changed=True)
+
+        if cache is not None:
+            cache.save(prune=False)
+
+    def _relative_folder(self, folder):
+        """words/ 기준 상대 폴더 경로 (매니페스트 키 형식, 최상위는 "")"""
+        rel = os.path.relpath(os.path.join(self.directory, folder), self.directory)
+        return "" if rel == os.curdir else rel
+
+    def _remember_write(self, path):
+        """카탈로그를 거쳐 저장한 파일의 (mtime, size)를 기억 (LibraryWatcher가 알려줘도 다시 읽지 않도록)"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        self._own_writes[os.path.abspath(path)] = (st.st_mtime_ns, st.st_size)
+
+    def _is_own_write(self, path):
+        path = os.path.abspath(path)
+        stat = self._own_writes.pop(path, None)
+        if stat is None:
+            return False
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return stat == (st.st_mtime_ns, st.st_size)
+
+    def _insert(self, title, path, words, script_text_path=None, script_audio_path=None):
+        wordbook_id = self._next_id
+        self._next_id += 1
+        self._records[wordbook_id] = WordbookRecord(
+            wordbook_id, title, path, words, script_text_path, script_audio_path
+        )
+        if self.is_loaded:
+            self.wordbook_added.emit(wordbook_id)
+        return wordbook_id
+
+    # =====================
+    #   변경 (저장 엔진에 반영 후 시그널)
+    # =====================
+    def add_wordbook(self, path, words):
+        """이미 저장된 단어장(path)을 카탈로그에 추가하고 id를 반환합니다."""
+        self._remember_write(path)
+        record = self.find_by_path(path)
+        if record:
+            self.set_words(record.id, words)
+            return record.id
+        text_path, audio_path = find_script_files(os.path.dirname(path))
+        return self._insert(title_from_filename(os.path.basename(path)), path, words, text_path, audio_path)
+
+    def set_words(self, wordbook_id, words):
+        """메모리상의 단어 목록만 교체 (저장은 하지 않음)"""
+        record = self._records[wordbook_id]
+        if words is not record.words:
+            close_words(record.words)
+            record.words = to_entries(words)
+            self._pending.pop(os.path.abspath(record.path), None)
+        self.wordbook_changed.emit(wordbook_id)
+
+    def save_words(self, wordbook_id, words, changes=None):
+        """
+        단어 목록을 저장 엔진에 저장하고 카탈로그에 반영합니다.
+        changes: 지금 record.words 기준으로 바뀐 행 정보 (WordTableModel.collect_words 참고, sqlite 엔진은 그 행만 씀)
+        """
+        record = self._records[wordbook_id]
+        words = to_entries(words)
+        # 덮어쓰기 전에 기존 LazyWordbook의 mmap을 닫음
+        close_words(record.words)
+        wordbook_manager.save_wordbook(record.path, words, changes)
+        self._remember_write(record.path)
+        record.words = words
+        self._pending.pop(os.path.abspath(record.path), None)
+        self.wordbook_changed.emit(wordbook_id)
+
+    def rename(self, wordbook_id, new_title):
+        """단어장 제목 변경 (같은 폴더 안에서 파일명 변경). 반환: 새 경로"""
+        record = self._records[wordbook_id]
+        new_path = os.path.join(os.path.dirname(record.path), f"{new_title}_wordbook.txt")
+        if os.path.exists(new_path) or self.find_by_path(new_path):
+            raise FileExistsError(f"이미 '{new_title}' 단어장이 존재합니다.")
+        if not record.is_loaded:
+            self._load_now(record)  # 옮긴 뒤에는 작업 스레드가 예전 경로를 읽지 못함
+        lazy = isinstance(record.words, LazyWordbook)
+        if lazy:
+            close_words(record.words)
+        wordbook_manager.rename_wordbook(record.path, new_path)
+        self._remember_write(new_path)
+        if lazy:
+            record.words = read_wordbook(new_path)
+        record.path = new_path
+        record.title = new_title
+        self.wordbook_changed.emit(wordbook_id)
+        return new_path
+
+    def delete(self, wordbook_id):
+        record = self._records[wordbook_id]
+        close_words(record.words)
+        self._pending.pop(os.path.abspath(record.path), None)
+        wordbook_manager.delete_wordbook(record.path)
+        del self._records[wordbook_id]
+        self.wordbook_removed.emit(wordbook_id)
+
+    def update_scripts(self, wordbook_id, script_text_path, script_audio_path, changed=False):
+        """대본/음성 경로 반영. changed=True면 경로가 같아도(파일 내용이 새로 생성됨) 시그널을 보냄"""
+        record = self._records.get(wordbook_id)
+        if record is None:
+            return
+        if changed or (record.script_text_path, record.script_audio_path) != (script_text_path, script_audio_path):
+            record.script_text_path = script_text_path
+            record.script_audio_path = script_audio_path
+            self.wordbook_changed.emit(wordbook_id)
+
+
+_catalog = None
+
+
+def get_catalog():
+    """앱 전체에서 공유하는 WordbookCatalog (처음 호출 시 생성)"""
+    global _catalog
+    if _catalog is None:
+        _catalog = WordbookCatalog()
+    return _catalog
@@ -0,0 +1,216 @@
+import re
+import unicodedata
+
+from PyQt5.QtCore import QObject
+
+from word_entry import WordEntry
+from sliced_work import SlicedWorkQueue
+
+PUNCT_RE = re.compile(r"[^\w\s]|_")
+SENSE_SPLIT_RE = re.compile(r"[,;/·]")
+
+
+def normalize_text(text):
+    """비교용 문자열: 유니코드 정규화, 대소문자 무시, 문장부호 -> 공백, 공백 하나로 ("Take-off!" -> "take off")"""
+    if not text.isascii():
+        text = unicodedata.normalize("NFKC", text)
+    text = text.casefold()
+    return " ".join(PUNCT_RE.sub(" ", text).split())
+
+
+def split_senses(meaning):
+    """뜻을 쉼표 등으로 나눈 항목 목록 ("과시하는, 화려한" -> ["과시하는", "화려한"])"""
+    return [sense.strip() for sense in SENSE_SPLIT_RE.split(meaning) if sense.strip()]
+
+
+def meaning_key(meaning):
+    """뜻 비교용 키 (항목 순서/문장부호/공백 무시)"""
+    return frozenset(filter(None, (normalize_text(sense) for sense in split_senses(meaning))))
+
+
+class DuplicateCluster:
+    """
+    같은 영단어(정규화 기준)를 가진 단어 묶음.
+        kind: "exact"(뜻까지 같음) 또는 "near"(뜻이 다름)
+        members: [(record_id, entry_index), ...] 라이브러리 순서 (첫 번째가 병합 시 남길 단어)
+    """
+    __slots__ = ("word_key", "kind", "members")
+
+    def __init__(self, word_key, kind, members):
+        self.word_key = word_key
+        self.kind = kind
+        self.members = members
+
+
+def find_duplicates(records):
+    """
+    라이브러리 전체를 한 번 훑어서 중복 묶음을 찾습니다.
+    records: WordbookRecord 목록 (catalog.records(), 백그라운드 로딩 중 아직 단어를 읽지 않은 단어장은 건너뜀)
+    Returns: [DuplicateCluster, ...] (처음 나온 순서)
+    """
+    groups = {}   # {영단어 키: [(record_id, entry_index, 뜻 키), ...]}
+    for record in records:
+        if record.words is None:
+            continue
+        for entry_index, entry in enumerate(record.words):
+            word_key = normalize_text(entry.word)
+            if word_key:
+                groups.setdefault(word_key, []).append((record.id, entry_index, meaning_key(entry.meaning)))
+
+    clusters = []
+    for word_key, members in groups.items():
+        if len(members) < 2:
+            continue
+        kind = "exact" if len({m[2] for m in members}) == 1 else "near"
+        clusters.append(DuplicateCluster(word_key, kind, [(m[0], m[1]) for m in members]))
+    return clusters
+
+
+def merge_entries(entries):
+    """
+    여러 단어를 하나로 합칩니다.
+    영단어는 첫 번째 것, 뜻은 서로 다른 항목을 나온 순서대로 모으고, 예문은 처음 나온 것을 씁니다.
+    """
+    first = entries[0]
+    senses, seen = [], set()
+    for entry in entries:
+        for sense in split_senses(entry.meaning) or [entry.meaning]:
+            key = normalize_text(sense)
+            if key not in seen:
+                seen.add(key)
+                senses.append(sense)
+    example = next((entry.example for entry in entries if entry.example), "")
+    return WordEntry(first.word, ", ".join(senses), example)
+
+
+def plan_merge(catalog, clusters):
+    """
+    묶음마다 첫 번째 단어만 남기고(뜻/예문은 합침) 나머지를 지운 결과를 계산합니다.
+    Returns: {record_id: 새 단어 목록} (바뀌는 단어장만)
+    """
+    replaced = {}   # {(record_id, entry_index): 합친 단어}
+    removed = set() # {(record_id, entry_index)}
+    for cluster in clusters:
+        entries = [catalog.get(rid).words[idx] for rid, idx in cluster.members]
+        keeper = cluster.members[0]
+        replaced[keeper] = merge_entries(entries)
+        removed.update(cluster.members[1:])
+
+    affected = {rid for rid, _ in removed} | {rid for rid, _ in replaced}
+    plans = {}
+    for record_id in affected:
+        record = catalog.get(record_id)
+        new_words = []
+        changed = False
+        for entry_index, entry in enumerate(record.words):
+            key = (record_id, entry_index)
+            if key in removed:
+                changed = True
+                continue
+            merged = replaced.get(key)
+            if merged is not None and merged != entry:
+                new_words.append(merged)
+                changed = True
+            else:
+                new_words.append(entry)
+        if changed:
+            plans[record_id] = new_words
+    return plans
+
+
+def merge_duplicates(catalog, clusters):
+    """
+    중복 묶음을 병합하고, 바뀐 단어장은 한 번씩만 다시 저장합니다.
+    Returns: (지운 단어 수, 다시 저장한 단어장 수)
+    """
+    plans = plan_merge(catalog, clusters)
+    removed = 0
+    for record_id, new_words in plans.items():
+        removed += catalog.get(record_id).count - len(new_words)
+        catalog.save_words(record_id, new_words)
+    return removed, len(plans)
+
+
+class DuplicateIndex(QObject):
+    """
+    가져오기 전에 중복을 바로 확인하기 위한 영단어 키 -> 위치 색인.
+    카탈로그 시그널마다 그 단어장만 갱신합니다. (큰 단어장은 이벤트 루프 사이사이에 나눠서)
+    """
+    def __init__(self, catalog, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.locations = {}      # {영단어 키: {(record_id, entry_index): 뜻 키}}
+        self.record_keys = {}    # {record_id: {영단어 키, ...}}
+        self.updates = SlicedWorkQueue(self)  # 큰 단어장은 나눠서 반영
+
+        catalog.reloaded.connect(self.rebuild)
+        catalog.wordbook_added.connect(self.update_record)
+        catalog.wordbook_changed.connect(self.update_record)
+        catalog.wordbook_removed.connect(self.remove_record)
+        if catalog.is_loaded:
+            self.rebuild()
+
+    def rebuild(self):
+        self.updates.clear()
+        self.locations.clear()
+        self.record_keys.clear()
+        # 라이브러리 전체는 단어장마다 나눠서 이벤트 루프 사이사이에 (시작 직후 화면이 멈추지 않도록)
+        for record in self.catalog.records():
+            if record.words is not None:
+                self.updates.submit(record.id, self._iter_add_record(record), defer=True)
+
+    def _iter_add_record(self, record, step=500):
+        keys = self.record_keys[record.id] = set()
+        for entry_index, entry in enumerate(record.words):
+            word_key = normalize_text(entry.word)
+            if word_key:
+                self.locations.setdefault(word_key, {})[(record.id, entry_index)] = meaning_key(entry.meaning)
+                keys.add(word_key)
+            if entry_index % step == step - 1:
+                yield
+
+    def remove_record(self, record_id):
+        self.updates.cancel(record_id)
+        for word_key in self.record_keys.pop(record_id, ()):
+            locations = self.locations[word_key]
+            for location in [loc for loc in locations if loc[0] == record_id]:
+                del locations[location]
+            if not locations:
+                del self.locations[word_key]
+
+    def update_record(self, record_id):
+        record = self.catalog.get(record_id)
+        if record is not None and record.words is not None:   # 아직 읽지 않은 단어장은 reloaded 때 한꺼번에
+            self.remove_record(record_id)
+            self.updates.submit(record_id, self._iter_add_record(record))
+
+    def check(self, words, word_keys=None):
+        """
+        새로 들어올 단어 목록에서 중복을 찾습니다. (라이브러리에 이미 있거나, 목록 안에서 반복)
+        word_keys: 미리 계산해 둔 영단어 키 목록 (가져오기 작업 스레드에서 계산, 없으면 여기서 계산)
+        뜻 키는 영단어가 겹치는 단어에 대해서만 계산합니다.
+        Returns: {단어 인덱스: "exact" 또는 "near"}
+        """
+        flagged = {}
+        batch = {}   # 목록 안에서 먼저 나온 {영단어 키: 단어 인덱스}
+        batch_meanings = {}   # {먼저 나온 단어 인덱스: 뜻 키} (필요할 때만 계산)
+        if word_keys is None:
+            word_keys = (normalize_text(entry.word) for entry in words)
+        for entry_index, word_key in enumerate(word_keys):
+            if not word_key:
+                continue
+            locations = self.locations.get(word_key)
+            first_index = batch.get(word_key)
+            if first_index is None:
+                batch[word_key] = entry_index
+                if locations is None:
+                    continue  # 처음 보는 단어 (대부분의 경우)
+            existing = list(locations.values()) if locations is not None else []
+            if first_index is not None:
+                if first_index not in batch_meanings:
+                    batch_meanings[first_index] = meaning_key(words[first_index].meaning)
+                existing.append(batch_meanings[first_index])
+            new_meaning = meaning_key(words[entry_index].meaning)
+            batch_meanings.setdefault(entry_index, new_meaning)
+            flagged[entry_index] = "exact" if new_meaning in existing else "near"
+        return flagged
@@ -5,15 +5,25 @@ from PyQt5.QtWidgets import (
     QTableWidget, QTableWidgetItem, QPushButton, QMessageBox
 )
 
+from wordbook_manager import save_wordbook
+from custom_widgets import HeadwordDelegate
+from word_entry import to_entries
+from duplicate_dialog import ask_skip_duplicates
+
+
 class WordbookEditorDialog(QDialog):
     """
     새 단어장(직접 입력)을 위한 QDialog.
     - 단어장 제목
     - 단어 목록(영단어, 뜻, 예문)
     - 저장 시 words/YYMMDD_HHMM/ 폴더에 {제목}_wordbook.txt 형태로 생성
+    - lookup(HeadwordLookup)이 있으면 영단어 자동 완성 + 이미 있는 단어/오타 후보 안내
+    - duplicate_index(DuplicateIndex)가 있으면 저장 전에 중복 단어 확인
     """
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, lookup=None, duplicate_index=None):
         super().__init__(parent)
+        self.lookup = lookup
+        self.duplicate_index = duplicate_index
         self.setWindowTitle("새 단어장 추가")
         self.resize(600, 400)
         self.saved_file_path = None  # 저장된 파일 경로를 담을 변수
@@ -34,6 +44,14 @@ class WordbookEditorDialog(QDialog):
         self.table.setHorizontalHeaderLabels(["영단어", "뜻", "예문"])
         layout.addWidget(self.table)
 
+        # 입력한 영단어가 다른 단어장에 이미 있는지 안내
+        self.lookup_label = QLabel("")
+        self.lookup_label.setStyleSheet("color: gray;")
+        layout.addWidget(self.lookup_label)
+        if self.lookup is not None:
+            self.table.setItemDelegate(HeadwordDelegate(self.lookup, parent=self.table))
+            self.table.itemChanged.connect(self.show_word_lookup)
+
         # 행 추가/삭제 버튼
         row_btn_layout = QHBoxLayout()
         self.add_row_btn = QPushButton("행 추가")
@@ -56,6 +74,10 @@ class WordbookEditorDialog(QDialog):
         self.save_btn.clicked.connect(self.save_wordbook)
         self.cancel_btn.clicked.connect(self.reject)
 
+    def show_word_lookup(self, item):
+        if item.column() == 0:
+            self.lookup_label.setText(self.lookup.describe(item.text()))
+
     def add_row(self):
         row_count = self.table.rowCount()
         self.table.insertRow(row_count)
@@ -99,6 +121,14 @@ class WordbookEditorDialog(QDialog):
             QMessageBox.warning(self, "경고", "최소 1개 이상의 단어(영단어, 뜻)를 입력해야 합니다.")
             return
 
+        if self.duplicate_index is not None:
+            words = ask_skip_duplicates(self, self.duplicate_index, to_entries(words), title)
+            if words is None:
+                return
+            if not words:
+                QMessageBox.warning(self, "경고", "모든 단어가 이미 다른 단어장에 있습니다.")
+                return
+
         # 저장 폴더 생성 (날짜 기반)
         date_folder = datetime.now().strftime('%y%m%d_%H%M')
         base_dir = os.path.join(os.path.dirname(__file__), 'words', date_folder)
@@ -110,12 +140,7 @@ class WordbookEditorDialog(QDialog):
 
         # 파일 저장
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                for wd in words:
-                    f.write(wd['word'] + "\n")
-                    f.write(wd['meaning'] + "\n")
-                    if wd['example']:
-                        f.write(wd['example'] + "\n")
+            save_wordbook(file_path, words)
 
             self.saved_file_path = file_path
             QMessageBox.information(self, "완료", f"'{title}' 단어장이 생성되었습니다.")
@@ -0,0 +1,215 @@
+import csv
+import json
+import os
+import threading
+from itertools import islice
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+import wordbook_manager
+from wordbook_manager import iter_wordbook
+
+CHUNK_SIZE = 5000             # 한 번에 읽어서 쓰는 단어 수
+WRITE_BUFFER = 1024 * 1024    # 파일 쓰기 버퍼 (묶음 여러 개를 모아서 디스크에 씀)
+
+# json.dumps(..., ensure_ascii=False)는 호출마다 인코더를 새로 만들어서 하나를 재사용
+JSON_ENCODE = json.JSONEncoder(ensure_ascii=False).encode
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+# =====================
+#   쓰기 (파일 형식별 exporter)
+# =====================
+class TsvExporter:
+    """탭 구분 텍스트. 첫 줄은 가져오기(wordbook_import)가 알아보는 머리글"""
+    name = "TSV"
+    suffix = ".tsv"
+
+    def __init__(self, f):
+        self.writer = csv.writer(f, delimiter="\t", lineterminator="\n")
+
+    def write_header(self):
+        self.writer.writerow(("word", "meaning", "example", "wordbook"))
+
+    def write_entries(self, title, entries):
+        self.writer.writerows((e.word, e.meaning, e.example_body, title) for e in entries)
+
+
+class JsonlExporter:
+    """JSON Lines: 한 줄에 {"word", "meaning", "example", "wordbook"} 하나"""
+    name = "JSON Lines"
+    suffix = ".jsonl"
+
+    def __init__(self, f):
+        self.f = f
+
+    def write_header(self):
+        pass
+
+    def write_entries(self, title, entries):
+        encode = JSON_ENCODE
+        self.f.write("".join(
+            encode({"word": e.word, "meaning": e.meaning, "example": e.example_body, "wordbook": title}) + "\n"
+            for e in entries
+        ))
+
+
+class AnkiExporter:
+    """
+    Anki 'Import File'용 텍스트 (Anki 2.1.55+ 머리줄 형식).
+    필드는 앞면(영단어), 뒷면(뜻), 예문이고, 단어장 제목을 덱 이름으로 씁니다.
+    """
+    name = "Anki"
+    suffix = ".txt"
+
+    def __init__(self, f):
+        self.f = f
+        self.writer = csv.writer(f, delimiter="\t", lineterminator="\n")
+
+    def write_header(self):
+        self.f.write("#separator:tab\n#html:false\n#columns:Front\tBack\tExample\tDeck\n#deck column:4\n")
+
+    def write_entries(self, title, entries):
+        self.writer.writerows((e.word, e.meaning, e.example_body, title) for e in entries)
+
+
+# 형식 이름 -> exporter 클래스 (파일 객체를 받아 write_header, write_entries 제공). register_exporter로 추가
+EXPORTERS = {
+    "tsv": TsvExporter,
+    "jsonl": JsonlExporter,
+    "anki": AnkiExporter,
+}
+
+
+def register_exporter(key, exporter):
+    EXPORTERS[key] = exporter
+
+
+def file_filters():
+    """QFileDialog용 [(형식 이름, 필터 문자열), ...]"""
+    return [(key, f"{cls.name} (*{cls.suffix})") for key, cls in EXPORTERS.items()]
+
+
+# =====================
+#   내보내기 (저장 엔진에서 묶음 단위로 읽어 바로 쓰기)
+# =====================
+class ExportSource:
+    """내보낼 단어장 하나 (화면 스레드에서 카탈로그를 보고 만든 값, 작업 스레드에서는 이것만 씀)"""
+    __slots__ = ("title", "path", "count")
+
+    def __init__(self, title, path, count=0):
+        self.title = title
+        self.path = path
+        self.count = count
+
+    @classmethod
+    def from_record(cls, record):
+        return cls(record.title, record.path, record.count)
+
+
+def iter_text_chunks(path, chunk_size=CHUNK_SIZE):
+    """텍스트 단어장을 한 줄씩 읽어 chunk_size개씩 묶어 내줍니다."""
+    entries = iter_wordbook(path)
+    while True:
+        chunk = list(islice(entries, chunk_size))
+        if not chunk:
+            break
+        yield chunk
+
+
+def export_wordbooks(sources, dest_path, fmt="tsv", progress=None, is_cancelled=None, chunk_size=CHUNK_SIZE):
+    """
+    sources(ExportSource 목록)를 차례로 저장 엔진에서 chunk_size개씩 읽어 dest_path에 씁니다.
+    - text: 단어장 파일을 iter_wordbook으로 한 줄씩
+    - sqlite: 작업 스레드 전용 연결에서 커서로 fetchmany
+    메모리에는 묶음 하나와 쓰기 버퍼만 올라가므로 단어 수와 상관없이 사용량이 일정합니다.
+    임시 파일(dest_path + ".tmp")에 다 쓴 뒤 바꿔치기하고, 취소/오류 시 임시 파일을 지웁니다.
+    Returns: 내보낸 단어 수
+    """
+    exporter_cls = EXPORTERS[fmt]
+    total = sum(source.count for source in sources)
+    done = 0
+
+    store = None
+    if wordbook_manager.STORAGE_ENGINE == "sqlite" and sources:
+        from wordbook_store import SQLiteWordbookStore, DB_FILENAME
+        words_dir = os.path.dirname(os.path.dirname(os.path.abspath(sources[0].path)))
+        # sqlite3 연결은 만든 스레드에서만 쓸 수 있어서 내보내기 전용 연결을 따로 엶
+        store = SQLiteWordbookStore(os.path.join(words_dir, DB_FILENAME))
+
+    temp_path = dest_path + ".tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER) as f:
+            exporter = exporter_cls(f)
+            exporter.write_header()
+            for source in sources:
+                if store is not None:
+                    wordbook_id = store.wordbook_id_for_path(source.path)
+                    chunks = store.iter_entries(wordbook_id, chunk_size) if wordbook_id is not None else ()
+                else:
+                    chunks = iter_text_chunks(source.path, chunk_size)
+                for chunk in chunks:
+                    if is_cancelled is not None and is_cancelled():
+                        raise ExportCancelled()
+                    exporter.write_entries(source.title, chunk)
+                    done += len(chunk)
+                    if progress is not None:
+                        progress(done, max(total, done))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, dest_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    finally:
+        if store is not None:
+            store.close()
+    return done
+
+
+class ExportJob(QObject):
+    """
+    export_wordbooks를 백그라운드 스레드에서 실행하는 작업.
+        progress(내보낸 단어 수, 전체 단어 수)
+        finished(파일 경로, 내보낸 단어 수)
+        failed(오류 메시지)
+        cancelled()
+    """
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(str, int)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, sources, dest_path, fmt="tsv", parent=None):
+        super().__init__(parent)
+        self.sources = sources
+        self.dest_path = dest_path
+        self.fmt = fmt
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        try:
+            count = export_wordbooks(self.sources, self.dest_path, self.fmt,
+                                     progress=self.progress.emit, is_cancelled=self._cancel.is_set)
+        except ExportCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            print(f"Export failed '{self.dest_path}': {e}")
+            self.failed.emit(str(e))
+        else:
+            self.finished.emit(self.dest_path, count)
@@ -0,0 +1,419 @@
+import csv
+import html
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from itertools import chain
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+import wordbook_manager
+from wordbook_manager import (
+    iter_wordbook_lines, format_wordbook, save_wordbook, write_wordbook, delete_wordbook,
+    read_wordbook, get_store, LAZY_MIN_BYTES
+)
+from word_entry import WordEntry
+from wordbook_dedup import normalize_text
+
+CHUNK_SIZE = 5000   # 한 번에 읽고 쓰는 단어 수
+
+# 머리글 줄로 보고 열 위치를 정할 때 쓰는 이름 (소문자 비교)
+HEADER_NAMES = {
+    "word": ("word", "english", "front", "term", "headword", "영단어", "단어"),
+    "meaning": ("meaning", "definition", "back", "korean", "translation", "뜻", "의미"),
+    "example": ("example", "sentence", "examples", "예문"),
+}
+
+# Anki 'Notes in Plain Text' 내보내기의 #separator 값
+ANKI_SEPARATORS = {"tab": "\t", "comma": ",", "semicolon": ";", "space": " ", "pipe": "|", "colon": ":"}
+HTML_BREAK_RE = re.compile(r"<br\s*/?>|</div>|</p>", re.IGNORECASE)
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+JSON_DECODE = json.JSONDecoder().decode
+
+csv.field_size_limit(16 * 1024 * 1024)
+
+
+class ImportCancelled(Exception):
+    pass
+
+
+# =====================
+#   읽기 (파일 형식별 reader)
+# =====================
+def header_columns(row):
+    """row가 머리글이면 (영단어, 뜻, 예문) 열 번호를 반환 (예문 열이 없으면 None), 머리글이 아니면 None"""
+    names = [cell.strip().lower() for cell in row]
+    found = {}
+    for key, aliases in HEADER_NAMES.items():
+        for column, name in enumerate(names):
+            if name in aliases:
+                found[key] = column
+                break
+    if "word" not in found or "meaning" not in found:
+        return None
+    return found["word"], found["meaning"], found.get("example")
+
+
+def entry_from_row(row, columns, clean=str.strip):
+    """row의 columns(영단어, 뜻, 예문 열 번호) 칸으로 WordEntry를 만듭니다. 영단어가 비어 있으면 None"""
+    size = len(row)
+    word_column, meaning_column, example_column = columns
+    word = clean(row[word_column]) if word_column < size else ""
+    if not word:
+        return None
+    meaning = clean(row[meaning_column]) if meaning_column < size else ""
+    example = clean(row[example_column]) if example_column is not None and example_column < size else ""
+    return WordEntry(word, meaning, example)
+
+
+def read_delimited(f, delimiter):
+    """CSV/TSV: 첫 줄이 머리글이면 열 이름으로, 아니면 (영단어, 뜻, 예문) 순서로 읽습니다."""
+    columns = None
+    for row in csv.reader(f, delimiter=delimiter):
+        if not row:
+            continue
+        if columns is None:
+            if not any(cell.strip() for cell in row):
+                continue
+            columns = header_columns(row)
+            if columns is not None:
+                continue
+            columns = (0, 1, 2)
+        entry = entry_from_row(row, columns)
+        if entry is not None:
+            yield entry
+
+
+def read_csv(f):
+    return read_delimited(f, ",")
+
+
+def read_tsv(f):
+    return read_delimited(f, "\t")
+
+
+def read_jsonl(f):
+    """JSON Lines: 줄마다 {"word", "meaning", "example"} 객체 (HEADER_NAMES의 다른 이름도 허용) 또는 [영단어, 뜻, 예문] 배열"""
+    for line_no, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = JSON_DECODE(line)
+        except ValueError as e:
+            print(f"JSONL line {line_no} skipped: {e}")
+            continue
+        if isinstance(record, list):
+            row = [str(value) for value in record]
+            entry = entry_from_row(row, (0, 1, 2))
+        elif isinstance(record, dict):
+            if "word" in record:
+                values = [record.get("word"), record.get("meaning"), record.get("example")]
+            else:
+                lowered = {str(key).lower(): value for key, value in record.items()}
+                values = [next((lowered[name] for name in aliases if name in lowered), None)
+                          for aliases in HEADER_NAMES.values()]
+            entry = entry_from_row([value if isinstance(value, str) else "" if value is None else str(value)
+                                    for value in values], (0, 1, 2))
+        else:
+            entry = None
+        if entry is not None:
+            yield entry
+
+
+def strip_html(text):
+    """Anki 필드의 HTML을 일반 텍스트로 (<br>은 공백, 태그 제거, &nbsp; 등 엔티티 변환)"""
+    if "<" not in text and "&" not in text:
+        return text.strip()
+    text = HTML_TAG_RE.sub("", HTML_BREAK_RE.sub(" ", text))
+    return " ".join(html.unescape(text).split())
+
+
+def read_anki(f):
+    """
+    Anki 'Notes in Plain Text' 내보내기.
+    맨 위의 '#separator:tab', '#html:true', '#guid column:1', '#notetype column:2', '#deck column:3',
+    '#tags column:5' 같은 머리줄을 읽어 구분자와 필드가 아닌 열을 정하고, 남은 필드를 (영단어, 뜻, 예문)으로 씁니다.
+    머리줄이 없는 예전 형식은 탭 구분 + HTML 포함으로 봅니다.
+    """
+    delimiter = "\t"
+    is_html = True
+    skipped = set()   # guid/notetype/deck/tags 열 (0부터)
+    first_line = None
+    for line in f:
+        if not line.startswith("#"):
+            first_line = line
+            break
+        key, _, value = line[1:].strip().partition(":")
+        key, value = key.strip().lower(), value.strip()
+        if key == "separator":
+            delimiter = ANKI_SEPARATORS.get(value.lower(), value[:1] or "\t")
+        elif key == "html":
+            is_html = value.lower() == "true"
+        elif key.endswith(" column") and value.isdigit():
+            skipped.add(int(value) - 1)
+
+    if first_line is None:
+        return
+    clean = strip_html if is_html else str.strip
+    columns = None
+    for row in csv.reader(chain([first_line], f), delimiter=delimiter):
+        if not any(cell.strip() for cell in row):
+            continue
+        if columns is None:
+            fields = [column for column in range(max(len(row), 3 + len(skipped))) if column not in skipped]
+            columns = tuple(fields[:3])
+        entry = entry_from_row(row, columns, clean)
+        if entry is not None:
+            yield entry
+
+
+def read_text(f):
+    """.txt: 탭이 있거나 '#'로 시작하는 Anki 머리줄이 있으면 Anki 내보내기, 아니면 우리 단어장 형식"""
+    head = []
+    for line in f:
+        head.append(line)
+        if line.strip():
+            break
+    lines = chain(head, f)
+    if head and (head[-1].startswith("#") or "\t" in head[-1]):
+        return read_anki(lines)
+    return iter_wordbook_lines(lines)
+
+
+# 확장자 -> reader(텍스트 파일 객체를 받아 WordEntry를 yield). register_reader로 형식 추가
+READERS = {
+    ".txt": read_text,
+    ".csv": read_csv,
+    ".tsv": read_tsv,
+    ".tab": read_tsv,
+    ".jsonl": read_jsonl,
+    ".ndjson": read_jsonl,
+}
+
+
+def register_reader(suffix, reader):
+    """새 가져오기 형식 등록 (예: register_reader(".xml", read_xml))"""
+    READERS[suffix.lower()] = reader
+
+
+def reader_for(file_path):
+    suffix = os.path.splitext(file_path)[1].lower()
+    if suffix not in READERS:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {suffix or file_path}")
+    return READERS[suffix]
+
+
+def file_filter():
+    """QFileDialog용 필터 문자열"""
+    patterns = " ".join(f"*{suffix}" for suffix in READERS)
+    return f"단어장 파일 ({patterns});;All Files (*)"
+
+
+def import_destination(file_path, directory=None, exists=os.path.exists):
+    """
+    가져온 단어장을 저장할 경로: words/YYMMDD_HHMM/{원래 이름}_wordbook.txt
+    exists(path)가 참이면(같은 분에 같은 이름을 가져온 경우 등) '{이름} (2)_wordbook.txt'처럼 번호를 붙입니다.
+    """
+    directory = directory or os.path.join(os.path.dirname(__file__), 'words')
+    folder = os.path.join(directory, datetime.now().strftime('%y%m%d_%H%M'))
+    basename = os.path.splitext(os.path.basename(file_path))[0]
+    if basename.endswith('_wordbook'):
+        basename = basename[:-len('_wordbook')]
+    dest_path = os.path.join(folder, f"{basename}_wordbook.txt")
+    number = 2
+    while exists(dest_path):
+        dest_path = os.path.join(folder, f"{basename} ({number})_wordbook.txt")
+        number += 1
+    return dest_path
+
+
+# =====================
+#   가져오기 (읽기 -> 묶음 단위로 저장 엔진에 쓰기)
+# =====================
+class ImportResult:
+    """
+    import_wordbook 결과.
+        words: 가져온 단어 목록 (텍스트 엔진에서 LazyWordbook으로 열 만큼 큰 파일이면 None)
+        word_keys: 중복 확인용 영단어 키 목록 (DuplicateIndex.check에 넘김, words가 None이면 None)
+        temp_path: 텍스트 엔진에서 아직 제자리로 옮기지 않은 임시 파일 (commit_import에서 교체)
+        created_folder: 날짜 폴더를 이번 가져오기에서 만들었는지 (버리면 비어 있을 때 함께 지움)
+    """
+    __slots__ = ("source_path", "dest_path", "count", "words", "word_keys", "temp_path", "created_folder")
+
+    def __init__(self, source_path, dest_path, keep_words=True):
+        self.source_path = source_path
+        self.dest_path = dest_path
+        self.count = 0
+        self.words = [] if keep_words else None
+        self.word_keys = [] if keep_words else None
+        self.temp_path = None
+        self.created_folder = False
+
+
+def iter_chunks(source_path, result, progress=None, is_cancelled=None, chunk_size=CHUNK_SIZE):
+    """
+    source_path를 reader로 읽어 chunk_size개씩 묶어 내줍니다.
+    묶음마다 result를 갱신하고 progress(읽은 단어 수, 진행률 %)를 부르며, is_cancelled()가 참이면 ImportCancelled.
+    """
+    reader = reader_for(source_path)
+    total = os.path.getsize(source_path) or 1
+    # utf-8-sig: 엑셀에서 저장한 CSV 맨 앞의 BOM 제거, newline='': 따옴표 안 줄바꿈을 csv 모듈이 처리
+    with open(source_path, 'r', encoding='utf-8-sig', newline='') as f:
+        entries = reader(f)
+        while True:
+            if is_cancelled is not None and is_cancelled():
+                raise ImportCancelled()
+            chunk = []
+            for entry in entries:
+                chunk.append(entry)
+                if len(chunk) >= chunk_size:
+                    break
+            if not chunk:
+                break
+            result.count += len(chunk)
+            if result.words is not None:
+                result.words.extend(chunk)
+                result.word_keys.extend(normalize_text(entry.word) for entry in chunk)
+            if progress is not None:
+                progress(result.count, min(99, f.buffer.tell() * 100 // total))
+            yield chunk
+
+
+def import_wordbook(source_path, dest_path, progress=None, is_cancelled=None, chunk_size=CHUNK_SIZE):
+    """
+    source_path(CSV/TSV/JSONL/Anki/단어장 텍스트)를 한 번 훑으면서 묶음 단위로 현재 저장 엔진에 씁니다.
+    - text: dest_path + ".import"에 이어 쓰고 fsync (제자리 교체는 commit_import에서)
+    - sqlite: 작업 스레드 전용 연결로 한 트랜잭션 안에서 묶음마다 INSERT
+    작업 스레드에서 호출하는 함수라 Qt 객체나 카탈로그는 건드리지 않습니다.
+    Returns: ImportResult
+    """
+    sqlite = wordbook_manager.STORAGE_ENGINE == "sqlite"
+    keep_words = sqlite or os.path.getsize(source_path) < LAZY_MIN_BYTES
+    result = ImportResult(source_path, dest_path, keep_words)
+    folder = os.path.dirname(dest_path)
+    result.created_folder = not os.path.isdir(folder)
+    os.makedirs(folder, exist_ok=True)
+    chunks = iter_chunks(source_path, result, progress, is_cancelled, chunk_size)
+
+    if sqlite:
+        from wordbook_store import SQLiteWordbookStore, DB_FILENAME
+        words_dir = os.path.dirname(os.path.dirname(os.path.abspath(dest_path)))
+        # sqlite3 연결은 만든 스레드에서만 쓸 수 있어서 가져오기 전용 연결을 따로 엶 (WAL이라 화면 쪽 읽기와 동시에 가능)
+        store = SQLiteWordbookStore(os.path.join(words_dir, DB_FILENAME))
+        try:
+            store.import_entries(dest_path, chunks)
+        except BaseException:
+            _remove_empty_folder(result)
+            raise
+        finally:
+            store.close()
+        return result
+
+    # write_wordbook의 ".tmp"와 겹치지 않는 이름 (중복 제외로 다시 쓸 때 같은 폴더에서 함께 쓰임)
+    temp_path = dest_path + ".import"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for chunk in chunks:
+                f.write(format_wordbook(chunk))
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        _remove_empty_folder(result)
+        raise
+    result.temp_path = temp_path
+    return result
+
+
+def commit_import(result, kept_words=None):
+    """
+    (화면 스레드) 가져온 단어장을 확정합니다. kept_words가 있으면(중복 제외 등) 그 목록으로 저장합니다.
+    Returns: 카탈로그에 올릴 단어 목록
+    """
+    if wordbook_manager.STORAGE_ENGINE == "sqlite":
+        if kept_words is not None:
+            save_wordbook(result.dest_path, kept_words)
+            return kept_words
+        return result.words
+
+    if kept_words is not None:
+        write_wordbook(result.dest_path, kept_words)
+        os.remove(result.temp_path)
+        return kept_words
+    os.replace(result.temp_path, result.dest_path)
+    if result.words is not None:
+        return result.words
+    return read_wordbook(result.dest_path)
+
+
+def discard_import(result):
+    """(화면 스레드) 가져온 단어장을 버립니다. (중복 확인에서 취소, 단어가 하나도 없음 등)"""
+    if result.temp_path is not None:
+        if os.path.exists(result.temp_path):
+            os.remove(result.temp_path)
+    elif wordbook_manager.STORAGE_ENGINE == "sqlite":
+        delete_wordbook(result.dest_path)
+    _remove_empty_folder(result)
+
+
+def _remove_empty_folder(result):
+    """가져오기가 단어장 없이 끝나면(취소/실패/버림) import_wordbook이 만든 날짜 폴더를 비어 있을 때만 지웁니다."""
+    if not result.created_folder:
+        return
+    try:
+        os.rmdir(os.path.dirname(result.dest_path))
+    except OSError:
+        pass  # 같은 분에 가져온 다른 단어장 파일이 있거나 이미 없음
+
+
+class ImportJob(QObject):
+    """
+    파일 하나를 백그라운드 스레드에서 가져오는 작업.
+    시그널은 작업 스레드에서 보내지만, 받는 쪽(화면 스레드의 QObject)에는 Qt가 큐에 넣어 전달합니다.
+
+        progress(읽은 단어 수, 진행률 %)
+        finished(ImportResult)   - 확정 전 상태, commit_import/discard_import는 받는 쪽에서
+        failed(오류 메시지)
+        cancelled()
+    """
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, source_path, dest_path, parent=None):
+        super().__init__(parent)
+        self.source_path = source_path
+        self.dest_path = dest_path
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if wordbook_manager.STORAGE_ENGINE == "sqlite":
+            # 최초 마이그레이션은 화면 스레드의 저장소 연결에서 미리 끝냄
+            get_store(os.path.dirname(os.path.dirname(os.path.abspath(self.dest_path))))
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        try:
+            result = import_wordbook(self.source_path, self.dest_path,
+                                     progress=self.progress.emit, is_cancelled=self._cancel.is_set)
+        except ImportCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            print(f"Import failed '{self.source_path}': {e}")
+            self.failed.emit(str(e))
+        else:
+            self.finished.emit(result)
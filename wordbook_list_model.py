@@ -0,0 +1,365 @@
+import os
+import re
+
+from PyQt5.QtCore import Qt, QAbstractItemModel, QModelIndex, QSize
+from PyQt5.QtGui import QColor, QFont
+from PyQt5.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+DATE_FOLDER = re.compile(r"^(\d{2})(\d{2})\d{2}_\d{4}$")  # 단어장 폴더 이름 (YYMMDD_HHMM)
+FETCH_BATCH = 500  # 묶음을 펼칠 때 한 번에 만드는 행 수
+
+WordbookIdRole = Qt.UserRole       # 단어장 id (묶음 행이면 None)
+CountRole = Qt.UserRole + 1        # 단어 수 (묶음 행이면 단어장 수)
+IsGroupRole = Qt.UserRole + 2
+
+
+def group_of(path):
+    """
+    단어장이 들어갈 묶음 이름.
+    날짜 폴더(YYMMDD_HHMM)는 가져올 때마다 하나씩 생기므로 폴더 단위로 묶으면 묶음 수가 단어장 수만큼 늘어남
+    -> 같은 달(YYMM)의 폴더를 한 묶음으로 모읍니다. 날짜 형식이 아닌 폴더는 폴더 이름 그대로.
+    """
+    folder = os.path.basename(os.path.dirname(path))
+    match = DATE_FOLDER.match(folder)
+    return match.group(1) + match.group(2) if match is not None else folder
+
+
+def group_label(group):
+    """'2501' -> '2025.01' (날짜 묶음이 아니면 폴더 이름 그대로, words/ 바로 아래 파일은 'words')"""
+    if len(group) == 4 and group.isdigit():
+        return f"20{group[:2]}.{group[2:]}"
+    return group or "words"
+
+
+class WordbookGroup:
+    """목록에 보이는 묶음 하나. ids 중 앞의 fetched개만 실제 행으로 만들어져 있음 (펼칠 때 fetchMore로 늘어남)"""
+    __slots__ = ("key", "label", "ids", "fetched")
+
+    def __init__(self, key, ids):
+        self.key = key
+        self.label = group_label(key)
+        self.ids = ids
+        self.fetched = 0
+
+
+class WordbookListModel(QAbstractItemModel):
+    """
+    카탈로그의 단어장을 날짜 폴더(YYMMDD_HHMM)의 달별로 묶어 보여주는 2단계 트리 모델.
+
+    - 위 단계는 묶음(group_of), 아래 단계는 단어장. 단어장 행은 묶음을 펼칠 때(fetchMore) 처음 만들어지므로
+      단어장이 수천 개여도 목록을 채우는 비용은 묶음 수에 비례합니다.
+    - set_filter로 제목(또는 묶음 이름)에 검색어가 들어간 단어장만 남길 수 있습니다.
+    - 카탈로그 시그널(추가/변경/삭제/다시 읽기)로 바뀐 행만 갱신합니다.
+      백그라운드 로딩 중 아직 단어를 읽지 않은 단어장은 단어 수 대신 "…"을 보여줍니다.
+    """
+    def __init__(self, catalog, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.members = {}       # {묶음 이름: [단어장 id, ...]} (카탈로그 순서, 필터와 상관없이 전부)
+        self.group_by_id = {}  # {단어장 id: 묶음 이름}
+        self.keys = {}          # {단어장 id: 제목.casefold()} 필터용
+        self.query = ""
+        self.groups = []       # 보이는 WordbookGroup 목록
+        self.visible = {}       # {묶음 이름: WordbookGroup}
+        self.group_rows = {}   # {묶음 이름: 보이는 행 번호} (parent()가 자주 불리므로 list.index 대신)
+
+        catalog.wordbook_added.connect(self.on_wordbook_added)
+        catalog.wordbook_changed.connect(self.on_wordbook_changed)
+        catalog.wordbook_removed.connect(self.on_wordbook_removed)
+        catalog.wordbook_loaded.connect(self.on_wordbook_loaded)
+        catalog.listed.connect(self.rebuild)
+        self.rebuild()
+
+    # =====================
+    #   목록 만들기 / 필터
+    # =====================
+    def rebuild(self):
+        """카탈로그 전체로 묶음을 다시 만듭니다."""
+        members = {}
+        group_by_id = {}
+        keys = {}
+        for record in self.catalog.records():
+            key = group_of(record.path)
+            ids = members.get(key)
+            if ids is None:
+                ids = members[key] = []
+            ids.append(record.id)
+            group_by_id[record.id] = key
+            keys[record.id] = record.title.casefold()
+        self.members = members
+        self.group_by_id = group_by_id
+        self.keys = keys
+        self.refilter()
+
+    def set_filter(self, text):
+        query = text.strip().casefold()
+        if query != self.query:
+            self.query = query
+            self.refilter()
+
+    def matches(self, wordbook_id):
+        return not self.query or self.query in self.keys[wordbook_id]
+
+    def group_matches(self, key):
+        """검색어가 묶음 이름(또는 날짜 표시)에 들어 있으면 그 묶음의 단어장은 전부 보여줌"""
+        return bool(self.query) and (self.query in key or self.query in group_label(key))
+
+    def refilter(self):
+        self.beginResetModel()
+        self.groups = []
+        for key, ids in self.members.items():
+            if self.query and not self.group_matches(key):
+                ids = [i for i in ids if self.query in self.keys[i]]
+            if ids:
+                self.groups.append(WordbookGroup(key, list(ids)))
+        self.visible = {group.key: group for group in self.groups}
+        self.group_rows = {group.key: row for row, group in enumerate(self.groups)}
+        self.endResetModel()
+
+    def visible_count(self):
+        """필터를 통과한 단어장 수"""
+        return sum(len(group.ids) for group in self.groups)
+
+    # =====================
+    #   id <-> index
+    # =====================
+    def wordbook_id(self, index):
+        """index가 단어장 행이면 그 id, 묶음 행이거나 잘못된 index면 None"""
+        if not index.isValid() or index.internalPointer() is None:
+            return None
+        return index.internalPointer().ids[index.row()]
+
+    def group_index(self, group):
+        return self.createIndex(self.group_rows[group.key], 0)
+
+    def index_for_id(self, wordbook_id):
+        """단어장 id의 index (아직 만들지 않은 행이면 그 행까지 만들고, 필터에 걸러졌으면 잘못된 index)"""
+        group = self.visible.get(self.group_by_id.get(wordbook_id))
+        if group is None or wordbook_id not in group.ids:
+            return QModelIndex()
+        row = group.ids.index(wordbook_id)
+        if row >= group.fetched:
+            self.fetch_rows(group, row + 1)
+        return self.createIndex(row, 0, group)
+
+    def fetch_rows(self, group, count):
+        count = min(count, len(group.ids))
+        if count <= group.fetched:
+            return
+        self.beginInsertRows(self.group_index(group), group.fetched, count - 1)
+        group.fetched = count
+        self.endInsertRows()
+
+    # =====================
+    #   QAbstractItemModel
+    # =====================
+    def index(self, row, column, parent=QModelIndex()):
+        if column != 0 or row < 0:
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, 0) if row < len(self.groups) else QModelIndex()
+        if parent.internalPointer() is not None:
+            return QModelIndex()
+        group = self.groups[parent.row()]
+        return self.createIndex(row, 0, group) if row < group.fetched else QModelIndex()
+
+    def parent(self, index):
+        if not index.isValid() or index.internalPointer() is None:
+            return QModelIndex()
+        return self.group_index(index.internalPointer())
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self.groups)
+        if parent.internalPointer() is None:
+            return self.groups[parent.row()].fetched
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return bool(self.groups)
+        return parent.internalPointer() is None and bool(self.groups[parent.row()].ids)
+
+    def canFetchMore(self, parent):
+        if not parent.isValid() or parent.internalPointer() is not None:
+            return False
+        group = self.groups[parent.row()]
+        return group.fetched < len(group.ids)
+
+    def fetchMore(self, parent):
+        if self.canFetchMore(parent):
+            group = self.groups[parent.row()]
+            self.fetch_rows(group, group.fetched + FETCH_BATCH)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.internalPointer() is None:
+            return Qt.ItemIsEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        group = index.internalPointer()
+        if group is None:
+            group = self.groups[index.row()]
+            if role == Qt.DisplayRole:
+                return group.label
+            if role == CountRole:
+                return len(group.ids)
+            if role == IsGroupRole:
+                return True
+            return None
+
+        wordbook_id = group.ids[index.row()]
+        if role == WordbookIdRole:
+            return wordbook_id
+        if role == IsGroupRole:
+            return False
+        if role in (Qt.DisplayRole, CountRole, Qt.ToolTipRole):
+            record = self.catalog.get(wordbook_id)
+            if record is None:
+                return None
+            if role == CountRole:
+                return record.count if record.is_loaded else "…"
+            return record.title
+        return None
+
+    # =====================
+    #   카탈로그 시그널
+    # =====================
+    def on_wordbook_added(self, wordbook_id):
+        record = self.catalog.get(wordbook_id)
+        if record is None or wordbook_id in self.group_by_id:
+            return
+        key = group_of(record.path)
+        self.members.setdefault(key, []).append(wordbook_id)
+        self.group_by_id[wordbook_id] = key
+        self.keys[wordbook_id] = record.title.casefold()
+        if not self.matches(wordbook_id) and not self.group_matches(key):
+            return
+
+        group = self.visible.get(key)
+        if group is None:
+            group = WordbookGroup(key, [wordbook_id])
+            row = len(self.groups)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.groups.append(group)
+            self.visible[key] = group
+            self.group_rows[key] = row
+            self.endInsertRows()
+            return
+        fully_fetched = group.fetched == len(group.ids)
+        group.ids.append(wordbook_id)
+        if fully_fetched:
+            self.fetch_rows(group, len(group.ids))
+        group_index = self.group_index(group)
+        self.dataChanged.emit(group_index, group_index)
+
+    def on_wordbook_changed(self, wordbook_id):
+        record = self.catalog.get(wordbook_id)
+        if record is None or wordbook_id not in self.group_by_id:
+            return
+        was_visible = self.matches(wordbook_id)
+        self.keys[wordbook_id] = record.title.casefold()
+        if self.query and was_visible != self.matches(wordbook_id):
+            # 제목이 바뀌어 필터 결과가 달라짐 -> 다시 거름
+            self.refilter()
+            return
+        index = self.index_for_id(wordbook_id)
+        if index.isValid():
+            self.dataChanged.emit(index, index)
+
+    def on_wordbook_loaded(self, wordbook_id):
+        """백그라운드 로딩으로 단어가 도착함 -> 이미 만든 행이면 단어 수만 다시 그림 (접힌 묶음의 행은 만들지 않음)"""
+        group = self.visible.get(self.group_by_id.get(wordbook_id))
+        if group is None:
+            return
+        try:
+            row = group.ids.index(wordbook_id)
+        except ValueError:
+            return
+        if row < group.fetched:
+            index = self.createIndex(row, 0, group)
+            self.dataChanged.emit(index, index, [CountRole])
+
+    def on_wordbook_removed(self, wordbook_id):
+        key = self.group_by_id.pop(wordbook_id, None)
+        if key is None:
+            return
+        self.keys.pop(wordbook_id, None)
+        ids = self.members[key]
+        ids.remove(wordbook_id)
+        if not ids:
+            del self.members[key]
+
+        group = self.visible.get(key)
+        if group is None or wordbook_id not in group.ids:
+            return
+        if len(group.ids) == 1:
+            row = self.group_rows[key]
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self.groups[row]
+            del self.visible[key]
+            self.group_rows = {group.key: row for row, group in enumerate(self.groups)}
+            self.endRemoveRows()
+            return
+        row = group.ids.index(wordbook_id)
+        if row < group.fetched:
+            self.beginRemoveRows(self.group_index(group), row, row)
+            del group.ids[row]
+            group.fetched -= 1
+            self.endRemoveRows()
+        else:
+            del group.ids[row]
+        group_index = self.group_index(group)
+        self.dataChanged.emit(group_index, group_index)
+
+
+class WordbookItemDelegate(QStyledItemDelegate):
+    """
+    단어장 목록 한 줄을 직접 그리는 델리게이트. (행마다 QWidget + QLabel 두 개를 만들지 않음)
+    단어장: 왼쪽에 제목, 오른쪽에 작은 회색 글씨로 (단어 수) / 묶음: 굵은 글씨로 날짜(달), 오른쪽에 단어장 수
+    """
+    TITLE_PX = 12
+    COUNT_PX = 8
+    ROW_HEIGHT = 30
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        title = opt.text
+        opt.text = ""
+        style = opt.widget.style() if opt.widget is not None else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        is_group = index.data(IsGroupRole)
+        count = index.data(CountRole)
+        rect = option.rect.adjusted(6, 0, -8, 0)
+        selected = bool(option.state & QStyle.State_Selected)
+
+        painter.save()
+        count_font = QFont(option.font)
+        count_font.setPixelSize(self.COUNT_PX)
+        painter.setFont(count_font)
+        painter.setPen(option.palette.highlightedText().color() if selected else QColor("gray"))
+        count_text = f"({count})" if count is not None else ""
+        count_width = painter.fontMetrics().horizontalAdvance(count_text)
+        painter.drawText(rect, Qt.AlignRight | Qt.AlignVCenter, count_text)
+
+        title_font = QFont(option.font)
+        title_font.setPixelSize(self.TITLE_PX)
+        title_font.setBold(bool(is_group))
+        painter.setFont(title_font)
+        painter.setPen(option.palette.highlightedText().color() if selected else option.palette.text().color())
+        title_rect = rect.adjusted(0, 0, -(count_width + 8), 0)
+        title = painter.fontMetrics().elidedText(title or "", Qt.ElideRight, title_rect.width())
+        painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignVCenter, title)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
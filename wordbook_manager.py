@@ -1,55 +1,159 @@
 import os
+import heapq
+from concurrent.futures import ProcessPoolExecutor
 
-def parse_wordbook(file_path):
+from wordbook_cache import WordbookCache, file_digest
+from word_entry import WordEntry, to_entries
+from library_manifest import LibraryManifest
+from lazy_wordbook import LazyWordbook, index_path_for
+
+# 저장 엔진: "text"(기본, words/ 폴더의 텍스트 파일) 또는 "sqlite"(words/wordbooks.db)
+STORAGE_ENGINE = os.environ.get("PIP_STORAGE_ENGINE", "text")
+
+_stores = {}  # {words 디렉토리: SQLiteWordbookStore}
+
+# 병렬 로딩: 작업 프로세스 수 (0이면 CPU 개수). 파싱할 파일이 적거나 작으면 순차 로딩으로 대체
+LOAD_WORKERS = int(os.environ.get("PIP_LOAD_WORKERS", "0"))
+PARALLEL_MIN_FILES = 32
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+# 이 크기 이상인 단어장은 전부 파싱하지 않고 LazyWordbook(mmap + 오프셋 인덱스)으로 엽니다.
+LAZY_MIN_BYTES = int(os.environ.get("PIP_LAZY_MIN_MB", "16")) * 1024 * 1024
+
+
+def iter_wordbook(file_path):
     """
-    단어장 파일을 파싱하여 (영단어, 뜻, 예문) 리스트를 반환하고, 단어의 개수를 셉니다.
-    
+    단어장 파일을 한 줄씩 읽으면서 WordEntry(word, meaning, example)를 하나씩 생성(yield)하는 제너레이터.
+    파일 전체를 메모리에 올리지 않고 한 번만 훑기 때문에, 아주 큰 단어장도 일정한 메모리로 처리할 수 있습니다.
+
     파일 형식:
         단어
         뜻
         예문 (선택 사항, '-example +korean example' 형태)
         ...
     """
-    words = []
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = [line.strip() for line in f if line.strip()]
-
-        i = 0
-        while i < len(lines):
-            word = lines[i]
-            meaning = lines[i+1] if i+1 < len(lines) else ""
-            example = ""
-            # i+2 라인이 '-'로 시작하면 예문
-            if i+2 < len(lines) and lines[i+2].startswith('-'):
-                example_line = lines[i+2]
-                # '-hello +안녕' 형태 처리
-                if '+' in example_line:
-                    parts = example_line[1:].split('+', 1)  # 맨 앞 '-' 제거 후 '+' 기준 분리
-                    if len(parts) == 2:
-                        example = f"-{parts[0].strip()}+{parts[1].strip()}"
-                    else:
-                        example = example_line
-                else:
-                    example = example_line
-                i += 3
-            else:
-                i += 2
+    with open(file_path, 'r', encoding='utf-8') as f:
+        yield from iter_wordbook_lines(f)
+
+
+def iter_wordbook_lines(lines):
+    """iter_wordbook의 줄 단위 파싱 규칙. 파일 외의 줄 목록(가져오기 중인 파일 등)에도 씁니다."""
+    word = None      # 아직 뜻을 기다리는 단어
+    meaning = None   # 예문이 올 수도 있어서 대기 중인 뜻
+
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line:
+            continue
+
+        if word is None:
+            word = line
+        elif meaning is None:
+            meaning = line
+        elif line.startswith('-'):
+            # 단어/뜻 바로 다음 줄이 '-'로 시작하면 예문
+            yield WordEntry(word, meaning, line)
+            word, meaning = None, None
+        else:
+            # 예문 없이 다음 단어가 시작됨
+            yield WordEntry(word, meaning)
+            word, meaning = line, None
 
-            words.append({'word': word, 'meaning': meaning, 'example': example})
+    if word is not None:
+        # 마지막 단어 (뜻이 없으면 빈 문자열)
+        yield WordEntry(word, meaning or "")
 
-        word_count = len(words)
-        return words, word_count
+
+def title_from_filename(filename):
+    """
+    예: filename = "오늘 외울 거!_wordbook.txt"
+    -> base = "오늘 외울 거!_wordbook"
+    -> title = "오늘 외울 거!"  (마지막 _wordbook 제거)
+    """
+    base = os.path.splitext(filename)[0]
+    if base.endswith('_wordbook'):
+        return base[:-len('_wordbook')]
+    return base  # 혹시나 _wordbook이 제대로 없을 경우 대비
+
+
+def parse_wordbook(file_path):
+    """
+    단어장 파일을 파싱하여 (영단어, 뜻, 예문) 리스트를 반환하고, 단어의 개수를 셉니다.
+    실제 파싱은 iter_wordbook이 한 번의 순회로 처리합니다.
+    """
+    try:
+        words = list(iter_wordbook(file_path))
+        return words, len(words)
 
     except Exception as e:
         print(f"Error parsing wordbook '{file_path}': {e}")
         return [], 0
 
 
-def load_wordbooks(directory):
+def parse_wordbook_cached(file_path, cache=None):
+    """cache(WordbookCache)가 있으면 캐시를 거쳐서, 없으면 바로 parse_wordbook으로 파싱합니다."""
+    if cache is None:
+        return parse_wordbook(file_path)
+    try:
+        return cache.get_words(file_path, parse_wordbook)
+    except OSError as e:
+        print(f"Error reading wordbook '{file_path}': {e}")
+        return [], 0
+
+
+def is_large_wordbook(file_path):
+    """LazyWordbook으로 열어야 할 만큼 큰 단어장인지"""
+    try:
+        return os.path.getsize(file_path) >= LAZY_MIN_BYTES
+    except OSError:
+        return False
+
+
+def open_lazy_wordbook(file_path):
+    """큰 단어장을 LazyWordbook으로 엽니다. 실패하면 None."""
+    try:
+        return LazyWordbook(file_path)
+    except (OSError, ValueError) as e:
+        print(f"Error opening wordbook '{file_path}': {e}")
+        return None
+
+
+def read_wordbook(file_path, cache=None):
+    """
+    텍스트 단어장 하나의 단어 목록을 반환합니다.
+    큰 파일은 LazyWordbook(필요한 단어만 디코딩), 나머지는 parse_wordbook_cached 결과(list).
+    """
+    if is_large_wordbook(file_path):
+        words = open_lazy_wordbook(file_path)
+        if words is not None:
+            return words
+    return parse_wordbook_cached(file_path, cache)[0]
+
+
+def close_words(words):
+    """LazyWordbook이면 mmap/파일 핸들을 닫습니다. (파일 이름 변경/삭제/덮어쓰기 전에 호출)"""
+    if isinstance(words, LazyWordbook):
+        words.close()
+
+
+def iter_wordbook_files(directory, manifest=None):
+    """
+    지정된 디렉토리(및 하위 폴더)에서 _wordbook.txt 파일을 찾아 (title, file_path)를 하나씩 생성합니다.
+    LibraryManifest로 스캔하므로 지난 스캔 이후 바뀌지 않은 폴더는 다시 읽지 않습니다.
+    """
+    if manifest is None:
+        manifest = LibraryManifest(directory)
+        manifest.scan()
+    for file_path, _, _ in manifest.iter_wordbooks():
+        yield title_from_filename(os.path.basename(file_path)), file_path
+
+
+def load_wordbooks(directory, use_cache=True, workers=None):
     """
     지정된 디렉토리(및 하위 폴더)에서 모든 _wordbook.txt 파일을 찾아
     parse_wordbook으로 단어를 읽어 반환합니다.
+    use_cache가 True면 내용이 바뀌지 않은 파일은 WordbookCache에서 바로 꺼내 씁니다.
+    파싱할 파일이 많으면 workers 개의 프로세스로 나눠서 파싱합니다. (iter_library 참고)
 
     Returns:
       wordbooks (dict): {title: [ {word, meaning, example}, ... ], ...}
@@ -58,34 +162,229 @@ def load_wordbooks(directory):
     wordbooks = {}
     word_counts = {}
 
+    for info in iter_library(directory, use_cache, workers=workers):
+        wordbooks[info["title"]] = info["words"]
+        word_counts[info["title"]] = len(info["words"])
+
+    return wordbooks, word_counts
+
+
+def find_script_files(folder):
+    """
+    폴더 안의 script.txt, script.wav(또는 script_temp.mp3) 경로를 찾아 (text_path, audio_path)로 반환합니다.
+    없으면 None.
+    """
+    script_txt = os.path.join(folder, "script.txt")
+    script_wav = os.path.join(folder, "script.wav")
+    script_mp3 = os.path.join(folder, "script_temp.mp3")
+
+    text_path = script_txt if os.path.exists(script_txt) else None
+
+    # 우선순위로 script.wav -> 없으면 script_temp.mp3
+    if os.path.exists(script_wav):
+        audio_path = script_wav
+    elif os.path.exists(script_mp3):
+        audio_path = script_mp3
+    else:
+        audio_path = None
+
+    return text_path, audio_path
+
+
+def _parse_shard(file_paths):
+    """(작업 프로세스에서 실행) 파일 묶음을 파싱해서 [(file_path, words, sha1), ...]로 반환"""
+    results = []
+    for file_path in file_paths:
+        words, _ = parse_wordbook(file_path)
+        try:
+            digest = file_digest(file_path)
+        except OSError:
+            digest = None
+        results.append((file_path, words, digest))
+    return results
+
+
+def shard_by_size(file_paths, shard_count):
+    """
+    파일 크기 합이 비슷하도록 shard_count개의 묶음으로 나눕니다.
+    (큰 파일부터 현재 가장 가벼운 묶음에 배정)
+    """
+    sized = []
+    for file_path in file_paths:
+        try:
+            sized.append((os.path.getsize(file_path), file_path))
+        except OSError:
+            sized.append((0, file_path))
+    sized.sort(reverse=True)
+
+    shard_count = max(1, min(shard_count, len(sized)))
+    shards = [[] for _ in range(shard_count)]
+    heap = [(0, i) for i in range(shard_count)]
+    for size, file_path in sized:
+        total, i = heapq.heappop(heap)
+        shards[i].append(file_path)
+        heapq.heappush(heap, (total + size, i))
+    return [shard for shard in shards if shard]
+
+
+def resolve_workers(workers=None):
+    """작업 프로세스 수 결정 (None이면 LOAD_WORKERS 설정, 0 이하면 CPU 개수)"""
+    if workers is None:
+        workers = LOAD_WORKERS
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def should_parallelize(file_paths, workers):
+    """파싱할 파일이 충분히 많고 클 때만 병렬 로딩 (작은 라이브러리는 프로세스 시작 비용이 더 큼)"""
+    if workers <= 1 or len(file_paths) < PARALLEL_MIN_FILES:
+        return False
+    total = 0
+    for file_path in file_paths:
+        try:
+            total += os.path.getsize(file_path)
+        except OSError:
+            pass
+        if total >= PARALLEL_MIN_BYTES:
+            return True
+    return False
+
+
+def iter_prioritized(paths, priority=None):
+    """
+    paths를 순서대로 하나씩 생성하되, 생성할 때마다 priority()를 불러서
+    돌려준 경로가 아직 남아 있으면 그것을 먼저 생성합니다. (priority가 None을 돌려주면 원래 순서)
+    """
+    remaining = set(paths)
+    order = iter(paths)
+    while remaining:
+        path = priority() if priority else None
+        if path not in remaining:
+            path = next(order)
+            if path not in remaining:
+                continue
+        remaining.discard(path)
+        yield path
+
+
+def iter_library(directory, use_cache=True, manifest=None, workers=None, entries=None, priority=None):
+    """
+    라이브러리의 단어장을 하나씩 읽어 정보 딕셔너리로 생성합니다. (제목이 같은 단어장도 모두 생성)
+        {"title", "words", "wordbook_path", "script_text_path", "script_audio_path"}
+    단어가 없는 단어장은 건너뜁니다.
+
+    캐시에 없는 파일이 많으면 ProcessPoolExecutor로 크기별로 나눠 병렬 파싱하고,
+    결과는 매니페스트 순서대로 생성합니다. (텍스트 엔진)
+    entries: 이미 나열해 둔 [(file_path, script_text_path, script_audio_path), ...] (없으면 매니페스트에서)
+    priority: 먼저 읽을 경로를 돌려주는 함수 (iter_prioritized 참고, 백그라운드 로딩에서 선택한 단어장 먼저)
+    """
     if not os.path.isdir(directory):
         print(f"Directory '{directory}' does not exist.")
-        return wordbooks, word_counts
-
-    for root, dirs, files in os.walk(directory):
-        for filename in files:
-            if filename.endswith('_wordbook.txt'):
-                file_path = os.path.join(root, filename)
-                words, count = parse_wordbook(file_path)
-                if count > 0:
-                    # 예: filename = "오늘 외울 거!_wordbook.txt"
-                    # -> base = "오늘 외울 거!_wordbook"
-                    # -> title = "오늘 외울 거!"  (마지막 _wordbook 제거)
-                    base = os.path.splitext(filename)[0]  # "오늘 외울 거!_wordbook"
-                    if base.endswith('_wordbook'):
-                        title = base[:-len('_wordbook')]
-                    else:
-                        title = base  # 혹시나 _wordbook이 제대로 없을 경우 대비
-
-                    wordbooks[title] = words
-                    word_counts[title] = count
-                else:
-                    print(f"Failed to load wordbook: {filename}")
+        return
 
-    return wordbooks, word_counts
+    if STORAGE_ENGINE == "sqlite":
+        store = get_store(directory)
+        for wordbook_id, title, source_path, count in store.list_wordbooks():
+            if count > 0:
+                text_path, audio_path = find_script_files(os.path.dirname(source_path))
+                yield {
+                    "title": title,
+                    "words": store.get_entries(wordbook_id),
+                    "wordbook_path": source_path,
+                    "script_text_path": text_path,
+                    "script_audio_path": audio_path
+                }
+        return
+
+    cache = WordbookCache(directory) if use_cache else None
+    if entries is None:
+        if manifest is None:
+            manifest = LibraryManifest(directory)
+            manifest.scan()
+        entries = list(manifest.iter_wordbooks())
+
+    # (1) 캐시에서 바로 꺼낼 수 있는 것과 새로 파싱해야 하는 것 분리
+    #     (아주 큰 단어장은 파싱/캐시 없이 LazyWordbook으로 엶)
+    cached = {}
+    pending = []
+    for file_path, _, _ in entries:
+        words = None
+        if is_large_wordbook(file_path):
+            words = open_lazy_wordbook(file_path)
+        if words is None and cache:
+            try:
+                words = cache.lookup(file_path)
+            except OSError:
+                pass
+        if words is None:
+            pending.append(file_path)
+        else:
+            cached[file_path] = words
 
+    # (2) 파싱할 파일이 많으면 크기별로 묶어서 프로세스 풀에 제출
+    workers = resolve_workers(workers)
+    executor = None
+    shard_futures = {}   # {file_path: future}
+    shard_results = {}   # {future: {file_path: (words, digest)}}
+    if should_parallelize(pending, workers):
+        try:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            for shard in shard_by_size(pending, workers * 4):
+                future = executor.submit(_parse_shard, shard)
+                for file_path in shard:
+                    shard_futures[file_path] = future
+        except Exception as e:
+            print(f"Parallel loading unavailable, falling back to serial: {e}")
+            shard_futures = {}
 
-def load_wordbooks_with_script_audio(directory):
+    # (3) 매니페스트 순서대로 결과 생성 (priority가 돌려준 경로는 먼저)
+    scripts = {file_path: (text_path, audio_path) for file_path, text_path, audio_path in entries}
+    try:
+        for file_path in iter_prioritized([file_path for file_path, _, _ in entries], priority):
+            text_path, audio_path = scripts[file_path]
+            if file_path in cached:
+                words = cached[file_path]
+            else:
+                words, digest = None, None
+                future = shard_futures.get(file_path)
+                if future is not None:
+                    try:
+                        if future not in shard_results:
+                            shard_results[future] = {p: (w, d) for p, w, d in future.result()}
+                        words, digest = shard_results[future][file_path]
+                    except Exception as e:
+                        print(f"Parallel parse failed for '{file_path}': {e}")
+                if words is None:
+                    words, _ = parse_wordbook(file_path)
+                if cache:
+                    try:
+                        cache.put(file_path, words, digest)
+                    except OSError:
+                        pass
+
+            if words:
+                yield {
+                    "title": title_from_filename(os.path.basename(file_path)),
+                    "words": words,
+                    "wordbook_path": file_path,
+                    "script_text_path": text_path,
+                    "script_audio_path": audio_path
+                }
+            else:
+                print(f"Failed to load wordbook: {os.path.basename(file_path)}")
+    finally:
+        if executor:
+            # 중간에 멈췄을 때 아직 시작하지 않은 묶음은 취소 (shutdown의 cancel_futures는 Python 3.9부터라 직접)
+            for future in set(shard_futures.values()):
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    if cache:
+        cache.save()
+
+
+def load_wordbooks_with_script_audio(directory, use_cache=True):
     """
     (추가) 
     지정된 디렉토리(및 하위 폴더)에서 _wordbook.txt 파일을 찾고, 
@@ -104,48 +403,135 @@ def load_wordbooks_with_script_audio(directory):
     }
     """
     results = {}
+    for info in iter_library(directory, use_cache):
+        title = info.pop("title")
+        results[title] = info
+    return results
 
-    if not os.path.isdir(directory):
-        print(f"Directory '{directory}' does not exist.")
-        return results
-
-    for root, dirs, files in os.walk(directory):
-        for filename in files:
-            # _wordbook.txt 로 끝나는 파일만
-            if filename.endswith('_wordbook.txt'):
-                file_path = os.path.join(root, filename)
-                words, count = parse_wordbook(file_path)
-                if count > 0:
-                    # 파일명 파싱 -> title
-                    base = os.path.splitext(filename)[0]  # "오늘 외울 거!_wordbook"
-                    if base.endswith('_wordbook'):
-                        title = base[:-len('_wordbook')]
-                    else:
-                        title = base
-
-                    results[title] = {
-                        "words": words,
-                        "wordbook_path": file_path,
-                        "script_text_path": None,
-                        "script_audio_path": None
-                    }
-                else:
-                    print(f"Failed to load wordbook: {filename}")
-
-    # script.txt / script.wav / script_temp.mp3 체크
-    for title, info in results.items():
-        folder = os.path.dirname(info["wordbook_path"])
-        script_txt = os.path.join(folder, "script.txt")
-        script_wav = os.path.join(folder, "script.wav")
-        script_mp3 = os.path.join(folder, "script_temp.mp3")
-
-        if os.path.exists(script_txt):
-            info["script_text_path"] = script_txt
-
-        # 우선순위로 script.wav -> 없으면 script_temp.mp3
-        if os.path.exists(script_wav):
-            info["script_audio_path"] = script_wav
-        elif os.path.exists(script_mp3):
-            info["script_audio_path"] = script_mp3
 
-    return results
+def get_store(directory):
+    """
+    directory(words 폴더)의 SQLite 저장소를 열어 반환합니다.
+    DB가 비어 있으면 기존 텍스트 트리를 먼저 가져옵니다(최초 1회 마이그레이션).
+    """
+    from wordbook_store import SQLiteWordbookStore, DB_FILENAME
+
+    directory = os.path.abspath(directory)
+    store = _stores.get(directory)
+    if store is None:
+        store = SQLiteWordbookStore(os.path.join(directory, DB_FILENAME))
+        if store.is_empty():
+            store.import_text_tree(directory)
+        _stores[directory] = store
+    return store
+
+
+def _store_for_path(file_path):
+    """단어장 경로(words/YYMMDD_HHMM/제목_wordbook.txt)가 속한 저장소"""
+    return get_store(os.path.dirname(os.path.dirname(os.path.abspath(file_path))))
+
+
+def load_wordbook(file_path):
+    """현재 저장 엔진에서 단어장 하나를 읽어 (words, word_count)로 반환합니다."""
+    if STORAGE_ENGINE == "sqlite":
+        store = _store_for_path(file_path)
+        wordbook_id = store.wordbook_id_for_path(file_path)
+        if wordbook_id is not None:
+            words = store.get_entries(wordbook_id)
+            return words, len(words)
+    return parse_wordbook(file_path)
+
+
+def add_wordbook_file(file_path):
+    """
+    words/ 폴더로 복사해 온 텍스트 단어장을 파싱하고, 저장 엔진에 등록합니다.
+    Returns: (words, word_count)
+    """
+    words, count = parse_wordbook(file_path)
+    if count > 0 and STORAGE_ENGINE == "sqlite":
+        store = _store_for_path(file_path)
+        if store.wordbook_id_for_path(file_path) is None:
+            store.create_wordbook(file_path, words)
+    return words, count
+
+
+def write_wordbook(file_path, words):
+    """
+    단어 목록을 텍스트 단어장 형식(단어/뜻/예문 줄)으로 file_path에 씁니다.
+    같은 폴더의 임시 파일에 다 쓴 뒤 os.replace로 바꿔치기하므로,
+    저장 도중 프로그램이 죽어도 기존 파일이 반쯤 잘린 채로 남지 않습니다.
+    """
+    text = format_wordbook(words)
+
+    temp_path = file_path + ".tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def format_wordbook(words):
+    """단어 목록을 텍스트 단어장 형식 문자열로 (예문이 없으면 예문 줄도 생략)"""
+    parts = []
+    for wd in to_entries(words):
+        example = wd.example
+        parts.append(f"{wd.word}\n{wd.meaning}\n{example}\n" if example else f"{wd.word}\n{wd.meaning}\n")
+    return "".join(parts)
+
+
+def save_wordbook(file_path, words, changes=None):
+    """
+    현재 저장 엔진에 단어장을 저장합니다. (없으면 새로 생성)
+    - text: 파일 전체를 임시 파일에 쓴 뒤 원자적으로 교체 (write_wordbook, 텍스트 파일은 한 줄만 고쳐 쓸 수 없음)
+    - sqlite: 바뀐 행만 DB에 반영. changes(바뀐 행 정보, WordTableModel.collect_words 참고)가 있으면
+              기존 단어를 읽지 않고 그 행만 쓰고(save_changes), 없으면 기존 행과 비교해서 씀(save_entries)
+    """
+    if STORAGE_ENGINE == "sqlite":
+        store = _store_for_path(file_path)
+        wordbook_id = store.wordbook_id_for_path(file_path)
+        if wordbook_id is None:
+            store.create_wordbook(file_path, words)
+        elif changes is not None:
+            store.save_changes(wordbook_id, words, changes["sources"], changes["edited"], changes["count"])
+        else:
+            store.save_entries(wordbook_id, words)
+        return
+    write_wordbook(file_path, words)
+
+
+def rename_wordbook(old_path, new_path):
+    """단어장 제목 변경 (파일명 변경 또는 DB 제목/경로 변경)"""
+    if STORAGE_ENGINE == "sqlite":
+        store = _store_for_path(old_path)
+        wordbook_id = store.wordbook_id_for_path(old_path)
+        if wordbook_id is not None:
+            store.rename_wordbook(wordbook_id, new_path)
+        if not os.path.exists(old_path):
+            return
+    os.rename(old_path, new_path)
+    _remove_index_file(old_path)
+
+
+def delete_wordbook(file_path):
+    """단어장 삭제 (파일 삭제 또는 DB에서 삭제)"""
+    if STORAGE_ENGINE == "sqlite":
+        store = _store_for_path(file_path)
+        wordbook_id = store.wordbook_id_for_path(file_path)
+        if wordbook_id is not None:
+            store.delete_wordbook(wordbook_id)
+    if os.path.exists(file_path):
+        os.remove(file_path)
+    _remove_index_file(file_path)
+
+
+def _remove_index_file(file_path):
+    """LazyWordbook 오프셋 인덱스(.{파일명}.idx)가 있으면 삭제"""
+    index_path = index_path_for(file_path)
+    if os.path.exists(index_path):
+        os.remove(index_path)
@@ -0,0 +1,414 @@
+import os
+import sqlite3
+from datetime import datetime
+from collections import deque
+
+from word_entry import WordEntry
+from wordbook_manager import (
+    iter_wordbook, iter_wordbook_files, find_script_files, title_from_filename, write_wordbook
+)
+
+DB_FILENAME = "wordbooks.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS wordbooks (
+    id          INTEGER PRIMARY KEY,
+    title       TEXT NOT NULL,
+    folder      TEXT NOT NULL,
+    source_path TEXT NOT NULL UNIQUE,
+    updated_at  TEXT
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id          INTEGER PRIMARY KEY,
+    wordbook_id INTEGER NOT NULL REFERENCES wordbooks(id) ON DELETE CASCADE,
+    position    REAL NOT NULL,
+    word        TEXT NOT NULL DEFAULT '',
+    meaning     TEXT NOT NULL DEFAULT '',
+    example     TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS scripts (
+    wordbook_id INTEGER PRIMARY KEY REFERENCES wordbooks(id) ON DELETE CASCADE,
+    script_text TEXT,
+    audio_path  TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_wordbooks_title ON wordbooks(title);
+CREATE INDEX IF NOT EXISTS idx_entries_word ON entries(word);
+CREATE INDEX IF NOT EXISTS idx_entries_position ON entries(wordbook_id, position);
+"""
+
+
+class SQLiteWordbookStore:
+    """
+    단어장을 SQLite DB(words/wordbooks.db) 하나에 저장하는 저장소.
+
+    - wordbooks: 단어장 (제목, 날짜 폴더, 원래 텍스트 파일 경로)
+    - entries: 단어 (position 순서대로 정렬, 중간 삽입은 position 사이 값으로 처리)
+    - scripts: 라디오 대본/음성
+
+    단어장은 텍스트 엔진과 똑같이 'words/YYMMDD_HHMM/{제목}_wordbook.txt' 경로(source_path)로 식별하므로,
+    import_text_tree / export_text_tree 로 기존 텍스트 형식과 자유롭게 오갈 수 있습니다.
+    """
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    # =====================
+    #   조회
+    # =====================
+    def is_empty(self):
+        return self.conn.execute("SELECT 1 FROM wordbooks LIMIT 1").fetchone() is None
+
+    def wordbook_id_for_path(self, source_path):
+        row = self.conn.execute(
+            "SELECT id FROM wordbooks WHERE source_path = ?", (os.path.abspath(source_path),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def list_wordbooks(self):
+        """[(id, title, source_path, 단어 개수), ...]"""
+        return self.conn.execute(
+            "SELECT w.id, w.title, w.source_path, COUNT(e.id) "
+            "FROM wordbooks w LEFT JOIN entries e ON e.wordbook_id = w.id "
+            "GROUP BY w.id ORDER BY w.folder, w.title"
+        ).fetchall()
+
+    def get_entries(self, wordbook_id, with_ids=False):
+        """단어 목록을 position 순서로 반환. with_ids=True면 각 dict에 'id'(entries.id)를 포함합니다."""
+        rows = self.conn.execute(
+            "SELECT id, word, meaning, example FROM entries WHERE wordbook_id = ? ORDER BY position",
+            (wordbook_id,)
+        )
+        if with_ids:
+            return [{'id': r[0], 'word': r[1], 'meaning': r[2], 'example': r[3]} for r in rows]
+        return [WordEntry(r[1], r[2], r[3]) for r in rows]
+
+    def iter_entries(self, wordbook_id, chunk_size=5000):
+        """단어를 position 순서로 chunk_size개씩 WordEntry 목록으로 내줍니다. (전체를 한 번에 읽지 않음)"""
+        cur = self.conn.execute(
+            "SELECT word, meaning, example FROM entries WHERE wordbook_id = ? ORDER BY position",
+            (wordbook_id,)
+        )
+        while True:
+            rows = cur.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield [WordEntry(*row) for row in rows]
+
+    def get_script(self, wordbook_id):
+        """(script_text, audio_path) 또는 (None, None)"""
+        row = self.conn.execute(
+            "SELECT script_text, audio_path FROM scripts WHERE wordbook_id = ?", (wordbook_id,)
+        ).fetchone()
+        return row if row else (None, None)
+
+    # =====================
+    #   쓰기
+    # =====================
+    def create_wordbook(self, source_path, words):
+        """source_path(텍스트 형식 기준 경로)로 새 단어장을 만들고 id를 반환합니다."""
+        with self.conn:
+            wordbook_id = self._insert_wordbook(source_path)
+            self._insert_entries(wordbook_id, words)
+        return wordbook_id
+
+    def import_entries(self, source_path, chunks):
+        """
+        chunks(단어 목록 묶음을 차례로 내주는 iterable)를 받아 새 단어장을 만들고 id를 반환합니다.
+        묶음마다 executemany로 넣지만 전체가 한 트랜잭션이라, 도중에 예외가 나면(취소 포함) 아무것도 남지 않습니다.
+        """
+        with self.conn:
+            wordbook_id = self._insert_wordbook(source_path)
+            position = 0
+            for chunk in chunks:
+                self._insert_entries(wordbook_id, chunk, position)
+                position += len(chunk)
+        return wordbook_id
+
+    def _insert_wordbook(self, source_path):
+        source_path = os.path.abspath(source_path)
+        cur = self.conn.execute(
+            "INSERT INTO wordbooks (title, folder, source_path, updated_at) VALUES (?, ?, ?, ?)",
+            (title_from_filename(os.path.basename(source_path)),
+             os.path.basename(os.path.dirname(source_path)),
+             source_path, datetime.now().isoformat(timespec='seconds'))
+        )
+        return cur.lastrowid
+
+    def _insert_entries(self, wordbook_id, words, start=0):
+        self.conn.executemany(
+            "INSERT INTO entries (wordbook_id, position, word, meaning, example) VALUES (?, ?, ?, ?, ?)",
+            ((wordbook_id, float(start + i), w['word'], w['meaning'], w['example']) for i, w in enumerate(words))
+        )
+
+    def rename_wordbook(self, wordbook_id, new_source_path):
+        new_source_path = os.path.abspath(new_source_path)
+        with self.conn:
+            self.conn.execute(
+                "UPDATE wordbooks SET title = ?, source_path = ?, updated_at = ? WHERE id = ?",
+                (title_from_filename(os.path.basename(new_source_path)), new_source_path,
+                 datetime.now().isoformat(timespec='seconds'), wordbook_id)
+            )
+
+    def delete_wordbook(self, wordbook_id):
+        with self.conn:
+            self.conn.execute("DELETE FROM wordbooks WHERE id = ?", (wordbook_id,))
+
+    def set_script(self, wordbook_id, script_text, audio_path):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO scripts (wordbook_id, script_text, audio_path) VALUES (?, ?, ?)",
+                (wordbook_id, script_text, audio_path)
+            )
+
+    def apply_changes(self, wordbook_id, updated=None, inserted=None, deleted=None, moved=None):
+        """
+        바뀐 행만 한 트랜잭션으로 반영합니다.
+            updated: {entry_id: {word, meaning, example}}
+            inserted: [(position, {word, meaning, example}), ...]  (position은 앞뒤 행 사이의 실수 값)
+            deleted: [entry_id, ...]
+            moved: {entry_id: 새 position}  (순서가 바뀐 행)
+        """
+        with self.conn:
+            if deleted:
+                self.conn.executemany("DELETE FROM entries WHERE id = ?", ((i,) for i in deleted))
+            if updated:
+                self.conn.executemany(
+                    "UPDATE entries SET word = ?, meaning = ?, example = ? WHERE id = ?",
+                    ((w['word'], w['meaning'], w['example'], i) for i, w in updated.items())
+                )
+            if moved:
+                self.conn.executemany(
+                    "UPDATE entries SET position = ? WHERE id = ?", ((pos, i) for i, pos in moved.items())
+                )
+            if inserted:
+                self.conn.executemany(
+                    "INSERT INTO entries (wordbook_id, position, word, meaning, example) VALUES (?, ?, ?, ?, ?)",
+                    ((wordbook_id, pos, w['word'], w['meaning'], w['example']) for pos, w in inserted)
+                )
+            self.conn.execute(
+                "UPDATE wordbooks SET updated_at = ? WHERE id = ?",
+                (datetime.now().isoformat(timespec='seconds'), wordbook_id)
+            )
+
+    def save_entries(self, wordbook_id, words):
+        """
+        전체 단어 목록을 받아 기존 행과 비교하고, 실제로 달라진 행만 UPDATE/INSERT/DELETE 합니다.
+        (어떤 행이 바뀌었는지 모를 때 - 텍스트 트리 가져오기 등. 알고 있으면 save_changes가 기존 단어를 읽지 않아 더 빠름)
+
+        행을 위치가 아니라 내용으로 맞춰 보므로(match_rows) 중간에 한 행을 넣거나 지우면
+        그 한 행만 INSERT/DELETE 되고 뒤의 행은 건드리지 않습니다.
+        """
+        rows = self.conn.execute(
+            "SELECT id, position, word, meaning, example FROM entries WHERE wordbook_id = ? ORDER BY position",
+            (wordbook_id,)
+        ).fetchall()
+        old = [row[2:] for row in rows]
+        new = [(w['word'], w['meaning'], w['example']) for w in words]
+        sources, edited = match_rows(old, new)
+        self._save_rows(wordbook_id, words, sources, edited, [row[0] for row in rows], [row[1] for row in rows])
+
+    def save_changes(self, wordbook_id, words, sources, edited, count):
+        """
+        편집 기록으로 바뀐 행만 반영합니다. (기존 단어 내용은 읽지 않음)
+            words: 저장할 전체 단어 목록 (새 순서)
+            sources: words[i]가 원래 몇 번째 행(position 순서, 0부터)이었는지. 새로 추가한 행은 None
+            edited: 내용이 바뀐 원래 행 번호 집합
+            count: 편집을 시작할 때의 행 수
+        sources에 없는 원래 행은 삭제하고, 중간에 추가한 행은 앞뒤 행 position 사이 값으로 넣습니다.
+        DB의 행 수가 편집을 시작할 때와 다르면(다른 곳에서 바뀜) save_entries로 전체를 비교합니다.
+        """
+        rows = self.conn.execute(
+            "SELECT id, position FROM entries WHERE wordbook_id = ? ORDER BY position", (wordbook_id,)
+        ).fetchall()
+        if len(rows) != count:
+            self.save_entries(wordbook_id, words)
+            return
+        self._save_rows(wordbook_id, words, sources, edited, [row[0] for row in rows], [row[1] for row in rows])
+
+    def _save_rows(self, wordbook_id, words, sources, edited, ids, positions):
+        """sources/edited(save_changes 참고)를 UPDATE/INSERT/DELETE로 바꿔 apply_changes에 넘김"""
+        kept = [s for s in sources if s is not None]
+        kept_set = set(kept)
+        deleted = [entry_id for s, entry_id in enumerate(ids) if s not in kept_set]
+        updated = {ids[s]: words[i] for i, s in enumerate(sources) if s is not None and s in edited}
+
+        inserted = None
+        moved = None
+        if all(a < b for a, b in zip(kept, kept[1:])):
+            inserted = insert_positions(words, sources, positions)
+        if inserted is None:
+            # 순서가 바뀌었거나(섞기) 사이에 넣을 실수 값이 모자람 -> 모든 행의 position을 0, 1, 2, ...로 다시 매김
+            moved = {ids[s]: float(i) for i, s in enumerate(sources) if s is not None and positions[s] != i}
+            inserted = [(float(i), words[i]) for i, s in enumerate(sources) if s is None]
+
+        if updated or inserted or deleted or moved:
+            self.apply_changes(wordbook_id, updated, inserted, deleted, moved)
+
+    # =====================
+    #   텍스트 형식 가져오기/내보내기
+    # =====================
+    def import_text_tree(self, directory):
+        """
+        words/ 텍스트 트리를 DB로 가져옵니다. 이미 가져온 경로(source_path)는 단어 목록만 갱신합니다.
+        Returns: 가져온 단어장 수
+        """
+        imported = 0
+        for title, file_path in iter_wordbook_files(directory):
+            try:
+                words = list(iter_wordbook(file_path))
+            except Exception as e:
+                print(f"Import skipped '{file_path}': {e}")
+                continue
+
+            wordbook_id = self.wordbook_id_for_path(file_path)
+            if wordbook_id is None:
+                wordbook_id = self.create_wordbook(file_path, words)
+            else:
+                self.save_entries(wordbook_id, words)
+
+            text_path, audio_path = find_script_files(os.path.dirname(file_path))
+            if text_path or audio_path:
+                script_text = None
+                if text_path:
+                    with open(text_path, 'r', encoding='utf-8') as f:
+                        script_text = f.read()
+                self.set_script(wordbook_id, script_text, audio_path)
+            imported += 1
+        return imported
+
+    def export_text_tree(self, directory):
+        """
+        DB의 모든 단어장을 directory/{폴더}/{제목}_wordbook.txt (+ script.txt) 형식으로 내보냅니다.
+        Returns: 내보낸 단어장 수
+        """
+        exported = 0
+        for wordbook_id, title, source_path, _ in self.list_wordbooks():
+            folder_name = os.path.basename(os.path.dirname(source_path))
+            folder = os.path.join(directory, folder_name)
+            os.makedirs(folder, exist_ok=True)
+            write_wordbook(os.path.join(folder, f"{title}_wordbook.txt"), self.get_entries(wordbook_id))
+
+            script_text, _ = self.get_script(wordbook_id)
+            if script_text:
+                with open(os.path.join(folder, "script.txt"), 'w', encoding='utf-8') as f:
+                    f.write(script_text)
+            exported += 1
+        return exported
+
+
+def match_rows(old, new):
+    """
+    기존 행 old와 새 행 new(둘 다 (word, meaning, example) 튜플 목록)를 맞춰 (sources, edited)를 만듭니다. (save_changes 참고)
+    같은 앞/뒤 구간은 그대로 짝짓고, 가운데 구간은 내용이 같은 행끼리 짝지은 뒤
+    남은 새 행을 같은 자리(앞뒤로 짝지어진 행 사이)의 남은 기존 행과 짝지어 '고친 행'으로 봅니다. (단어 수에 비례)
+    """
+    head = 0
+    limit = min(len(old), len(new))
+    while head < limit and old[head] == new[head]:
+        head += 1
+    tail = 0
+    while tail < limit - head and old[-1 - tail] == new[-1 - tail]:
+        tail += 1
+    old_end = len(old) - tail
+
+    # (1) 가운데 구간: 내용이 같은 기존 행과 짝지음 (같은 내용이 여러 번이면 앞에서부터)
+    by_content = {}
+    for i in range(head, old_end):
+        by_content.setdefault(old[i], deque()).append(i)
+    middle = []
+    for row in new[head:len(new) - tail]:
+        candidates = by_content.get(row)
+        middle.append(candidates.popleft() if candidates else None)
+
+    # (2) 짝 없는 새 행: 앞뒤 짝지어진 기존 행 사이에 남은 기존 행이 있으면 그 행을 고친 것으로
+    edited = set()
+    kept = [source for source in middle if source is not None]
+    if all(a < b for a, b in zip(kept, kept[1:])):
+        kept_set = set(kept)
+        previous = head - 1
+        run = []
+        for k, source in enumerate(middle + [old_end]):
+            if k < len(middle) and source is None:
+                run.append(k)
+                continue
+            if run:
+                free = [i for i in range(previous + 1, source) if i not in kept_set]
+                for k_new, i in zip(run, free):
+                    middle[k_new] = i
+                    edited.add(i)
+                run = []
+            previous = source
+    return list(range(head)) + middle + list(range(old_end, len(old))), edited
+
+
+def insert_positions(words, sources, positions):
+    """
+    새 행(sources가 None)마다 앞뒤 기존 행 position 사이의 값을 정해 [(position, 단어), ...]로 반환합니다.
+    맨 앞이면 첫 행보다 1씩 작게, 맨 뒤면 마지막 행보다 1씩 크게.
+    사이 값이 실수 정밀도로 구분되지 않으면 None (다시 매겨야 함)
+    """
+    inserted = []
+    previous = None   # 바로 앞 기존 행의 position
+    run = []          # 아직 position을 정하지 못한 새 행들의 인덱스
+    for i, source in enumerate(sources):
+        if source is None:
+            run.append(i)
+            continue
+        if run:
+            placed = _place_run(words, run, previous, positions[source])
+            if placed is None:
+                return None
+            inserted.extend(placed)
+            run = []
+        previous = positions[source]
+    if run:
+        placed = _place_run(words, run, previous, None)
+        if placed is None:
+            return None
+        inserted.extend(placed)
+    return inserted
+
+
+def _place_run(words, run, low, high):
+    """low와 high(기존 행 position, 없으면 None) 사이에 run(단어 인덱스 목록)을 고르게 배치"""
+    count = len(run)
+    if low is None and high is None:
+        values = [float(k) for k in range(count)]
+    elif high is None:
+        values = [low + 1.0 + k for k in range(count)]
+    elif low is None:
+        values = [high - count + k for k in range(count)]
+    else:
+        step = (high - low) / (count + 1)
+        values = [low + step * (k + 1) for k in range(count)]
+        if not all(a < b for a, b in zip([low] + values, values + [high])):
+            return None
+    return [(value, words[i]) for value, i in zip(values, run)]
+
+
+if __name__ == "__main__":
+    # 사용법: python wordbook_store.py import|export [words 폴더] [DB 경로]
+    import sys
+
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    words_dir = sys.argv[2] if len(sys.argv) > 2 else os.path.join(os.path.dirname(__file__), 'words')
+    db_path = sys.argv[3] if len(sys.argv) > 3 else os.path.join(words_dir, DB_FILENAME)
+
+    if command not in ("import", "export"):
+        print("usage: python wordbook_store.py import|export [words_dir] [db_path]")
+        sys.exit(1)
+
+    store = SQLiteWordbookStore(db_path)
+    if command == "import":
+        print(f"{store.import_text_tree(words_dir)} wordbooks imported into {db_path}")
+    else:
+        print(f"{store.export_text_tree(words_dir)} wordbooks exported to {words_dir}")
+    store.close()